@@ -0,0 +1,177 @@
+from typing import ClassVar
+
+from typing_extensions import TypeAlias, TypeAliasType
+
+from .address import Address
+from .hex import BoundHexBytes, HexBytes
+
+__all__: list[str]
+
+BYTES_SIZES: range
+INT_SIZES: range
+
+bool = TypeAliasType("bool", bool)
+bytes = TypeAliasType("bytes", HexBytes)
+string = TypeAliasType("string", str)
+address = TypeAliasType("address", Address)
+
+class bytes1(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes2(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes3(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes4(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes5(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes6(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes7(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes8(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes9(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes10(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes11(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes12(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes13(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes14(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes15(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes16(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes17(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes18(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes19(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes20(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes21(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes22(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes23(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes24(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes25(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes26(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes27(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes28(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes29(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes30(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes31(BoundHexBytes):
+    size: ClassVar[int]
+
+class bytes32(BoundHexBytes):
+    size: ClassVar[int]
+
+int8: TypeAlias = int
+int16: TypeAlias = int
+int24: TypeAlias = int
+int32: TypeAlias = int
+int40: TypeAlias = int
+int48: TypeAlias = int
+int56: TypeAlias = int
+int64: TypeAlias = int
+int72: TypeAlias = int
+int80: TypeAlias = int
+int88: TypeAlias = int
+int96: TypeAlias = int
+int104: TypeAlias = int
+int112: TypeAlias = int
+int120: TypeAlias = int
+int128: TypeAlias = int
+int136: TypeAlias = int
+int144: TypeAlias = int
+int152: TypeAlias = int
+int160: TypeAlias = int
+int168: TypeAlias = int
+int176: TypeAlias = int
+int184: TypeAlias = int
+int192: TypeAlias = int
+int200: TypeAlias = int
+int208: TypeAlias = int
+int216: TypeAlias = int
+int224: TypeAlias = int
+int232: TypeAlias = int
+int240: TypeAlias = int
+int248: TypeAlias = int
+int256: TypeAlias = int
+uint8: TypeAlias = int
+uint16: TypeAlias = int
+uint24: TypeAlias = int
+uint32: TypeAlias = int
+uint40: TypeAlias = int
+uint48: TypeAlias = int
+uint56: TypeAlias = int
+uint64: TypeAlias = int
+uint72: TypeAlias = int
+uint80: TypeAlias = int
+uint88: TypeAlias = int
+uint96: TypeAlias = int
+uint104: TypeAlias = int
+uint112: TypeAlias = int
+uint120: TypeAlias = int
+uint128: TypeAlias = int
+uint136: TypeAlias = int
+uint144: TypeAlias = int
+uint152: TypeAlias = int
+uint160: TypeAlias = int
+uint168: TypeAlias = int
+uint176: TypeAlias = int
+uint184: TypeAlias = int
+uint192: TypeAlias = int
+uint200: TypeAlias = int
+uint208: TypeAlias = int
+uint216: TypeAlias = int
+uint224: TypeAlias = int
+uint232: TypeAlias = int
+uint240: TypeAlias = int
+uint248: TypeAlias = int
+uint256: TypeAlias = int
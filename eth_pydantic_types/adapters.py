@@ -0,0 +1,111 @@
+"""
+Shared, cached ``TypeAdapter`` objects for validating bare values (rather than
+model fields), so each type's core schema is only built once per process.
+
+Usage example::
+
+    from eth_pydantic_types import Address
+    from eth_pydantic_types.adapters import get_adapter, warmup
+
+    warmup(background=True)  # E.g. at the start of a serverless function.
+    ...
+    addresses = get_adapter(list[Address]).validate_python(raw_addresses)
+"""
+
+import threading
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.bip122 import Bip122Uri
+from eth_pydantic_types.hex.bytes import HexBytes, HexBytes20, HexBytes32
+from eth_pydantic_types.hex.int import HexInt, HexInt32
+from eth_pydantic_types.hex.str import HexStr, HexStr20, HexStr32
+
+PUBLIC_TYPES: tuple[Any, ...] = (
+    Address,
+    Bip122Uri,
+    HexBytes,
+    HexBytes20,
+    HexBytes32,
+    HexInt,
+    HexInt32,
+    HexStr,
+    HexStr20,
+    HexStr32,
+)
+"""The types :func:`~eth_pydantic_types.adapters.warmup` builds adapters for by default."""
+
+
+@cache
+def get_adapter(type_: Any) -> TypeAdapter:
+    """
+    The shared ``TypeAdapter`` of a type or annotation, e.g. ``HexBytes32``,
+    ``list[Address]`` or ``HexInt | None``. It is built on first use.
+
+    **NOTE**: Equal annotations share an adapter, e.g. ``Optional[Address]``
+    and ``Address | None``.
+
+    Args:
+        type_ (Any): The type or annotation. Must be hashable.
+
+    Returns:
+        ``TypeAdapter``
+    """
+    return TypeAdapter(type_)
+
+
+def get_warmup_types(types: Iterable[Any] | None = None) -> list[Any]:
+    """
+    The annotations :func:`~eth_pydantic_types.adapters.warmup` builds
+    adapters for: each type ``T``, ``list[T]`` and ``T | None``.
+
+    Args:
+        types (Iterable[Any] | None): The types. Defaults to
+          :data:`~eth_pydantic_types.adapters.PUBLIC_TYPES`.
+
+    Returns:
+        list[Any]
+    """
+    annotations: list[Any] = []
+    for type_ in PUBLIC_TYPES if types is None else types:
+        annotations.extend((type_, list[type_], type_ | None))  # type: ignore[valid-type]
+
+    return annotations
+
+
+def warmup(types: Iterable[Any] | None = None, background: bool = False) -> threading.Thread | None:
+    """
+    Build the shared adapters of ``types`` (and their common containers) ahead
+    of their first use, moving the cost of building core schemas out of the
+    first request.
+
+    Args:
+        types (Iterable[Any] | None): The types. Defaults to
+          :data:`~eth_pydantic_types.adapters.PUBLIC_TYPES`.
+        background (bool): Set to ``True`` to build them in a (daemon) thread.
+          Adapters requested meanwhile are still available; one requested
+          before the thread reaches it is just built by the caller instead.
+
+    Returns:
+        threading.Thread | None: The started thread, when in the background
+        (e.g. to ``join()``).
+    """
+    annotations = get_warmup_types(types)
+    if not background:
+        _build_adapters(annotations)
+        return None
+
+    thread = threading.Thread(
+        target=_build_adapters, args=(annotations,), name="eth-pydantic-types-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _build_adapters(annotations: list[Any]):
+    for annotation in annotations:
+        get_adapter(annotation)
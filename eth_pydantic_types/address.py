@@ -1,23 +1,35 @@
-from functools import cached_property
+import re
+import threading
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 
+import cchecksum
 from cchecksum import to_checksum_address
 from eth_typing import ChecksumAddress
 from pydantic_core.core_schema import (
     ValidationInfo,
     str_schema,
-    with_info_before_validator_function,
+    with_info_plain_validator_function,
 )
 
+import eth_pydantic_types.instrumentation as instrumentation
 from eth_pydantic_types.hex import HexStr20
 from eth_pydantic_types.utils import (
-    PadDirection,
+    LRUCache,
+    normalize_hex,
 )
 
 if TYPE_CHECKING:
     from pydantic_core import CoreSchema
 
 ADDRESS_PATTERN = "^0x[a-fA-F0-9]{40}$"
+CHECKSUM_CACHE_SIZE = 8192
+
+# Matches normalized (lowercase, 0x-prefixed, full-length) addresses.
+_NORMALIZED_ADDRESS = re.compile(r"0x[0-9a-f]{40}")
+
+# NOTE: Older cchecksum releases do not have the batch function.
+_to_checksum_address_many = getattr(cchecksum, "to_checksum_address_many", None)
 
 
 def address_schema():
@@ -27,9 +39,15 @@ def address_schema():
 class Address(HexStr20):
     """
     Use for address-types. Validates as a checksummed address. Left-pads zeroes
-    if necessary.
+    if necessary. Checksummed results are kept in a bounded LRU cache
+    (:attr:`checksum_cache`), keyed by the normalized lowercase hex. Each
+    subclass has its own cache.
     """
 
+    __slots__ = ()
+
+    checksum_cache: ClassVar[LRUCache] = LRUCache(maxsize=CHECKSUM_CACHE_SIZE)
+
     schema_pattern: ClassVar[str] = ADDRESS_PATTERN
     schema_examples: ClassVar[tuple[str, ...]] = (
         "0x0000000000000000000000000000000000000000",  # Zero address
@@ -38,19 +56,108 @@ class Address(HexStr20):
         "0x1e59ce931B4CFea3fe4B875411e280e173cB7A9C",
     )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # NOTE: Subclasses may checksum differently (e.g. by overriding
+        #   ``to_checksum_address``), so each class gets its own cache.
+        if "checksum_cache" not in cls.__dict__:
+            cls.checksum_cache = LRUCache(maxsize=cls.checksum_cache.maxsize)
+
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
-        return with_info_before_validator_function(
-            cls.__eth_pydantic_validate__,
-            address_schema(),
-        )
+        # NOTE: The validator always returns a well-formed checksummed address,
+        #   so the ``address_schema()`` length and pattern checks are only used
+        #   for the JSON schema and never re-run on validated (or cached) values.
+        return with_info_plain_validator_function(cls.__eth_pydantic_validate__)
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        return super().__get_pydantic_json_schema__(address_schema(), handler)
 
     @classmethod
     def __eth_pydantic_validate__(
         cls, value: Any, info: ValidationInfo | None = None, **kwargs
     ) -> str:
-        value = super().__eth_pydantic_validate__(value, info, pad=PadDirection.LEFT)
-        return cls.to_checksum_address(value)
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
+
+        cache = cls.checksum_cache
+        pool = cls.intern_pool
+        if cache.maxsize and isinstance(value, str):
+            key = (value if value[:2] == "0x" else f"0x{value}").lower()
+            if (cached := cache.get(key)) is not None:
+                if instrumentation.collector is not None:
+                    instrumentation.collector.event("checksum.cached")
+
+                return cached if pool is None else pool.intern(cached)
+
+        value = normalize_hex(value, cls.size)
+        if instrumentation.collector is not None:
+            instrumentation.collector.event("checksum")
+
+        checksummed = cls.to_checksum_address(value)
+        if pool is not None:
+            checksummed = pool.intern(checksummed)
+
+        cache.put(value, checksummed)
+        return checksummed
+
+    @classmethod
+    def checksum_many(cls, values: Iterable[Any]) -> list[ChecksumAddress]:
+        """
+        Validate and checksum a whole sequence of addresses in one call.
+        Already-normalized inputs that miss the cache are checksummed together
+        in a single batch; anything else (ints, bytes, unpadded or malformed
+        strings) goes through the regular per-value validation.
+
+        Args:
+            values (Iterable[Any]): The raw address values.
+
+        Returns:
+            list[ChecksumAddress]: The checksummed addresses, in input order.
+        """
+        cache = cls.checksum_cache
+        pool = cls.intern_pool
+        match_normalized = _NORMALIZED_ADDRESS.fullmatch
+        validate = cls.__eth_pydantic_validate__
+        results: list = []
+        pending: dict[str, list[int]] = {}
+
+        for value in values:
+            if isinstance(value, str):
+                key = (value if value[:2] == "0x" else f"0x{value}").lower()
+                if (cached := cache.get(key)) is not None:
+                    results.append(cached if pool is None else pool.intern(cached))
+                    continue
+
+                elif match_normalized(key):
+                    pending.setdefault(key, []).append(len(results))
+                    results.append(None)
+                    continue
+
+            results.append(validate(value))
+
+        if pending:
+            keys = list(pending)
+            for key, checksummed in zip(keys, cls.to_checksum_address_many(keys)):
+                if pool is not None:
+                    checksummed = pool.intern(checksummed)
+
+                cache.put(key, checksummed)
+                for index in pending[key]:
+                    results[index] = checksummed
+
+        return results
+
+    validate_many = checksum_many
+
+    @classmethod
+    def from_valid_bytes(cls, data: bytes | memoryview) -> str:
+        # NOTE: Checksummed (and cached) like any other input, as only the
+        #   lowercase hex is known from the bytes.
+        return cls.__eth_pydantic_validate__(f"0x{data.hex()}")
 
     @classmethod
     def update_schema(cls):
@@ -61,23 +168,31 @@ class Address(HexStr20):
     def to_checksum_address(cls, value: str) -> ChecksumAddress:
         return to_checksum_address(value)
 
+    @classmethod
+    def to_checksum_address_many(cls, values: list[str]) -> list[ChecksumAddress]:
+        # NOTE: The cchecksum batch function only stands in for the default
+        #   ``to_checksum_address``, not for an overridden one.
+        to_checksum = cls.to_checksum_address.__func__  # type: ignore[attr-defined]
+        if _to_checksum_address_many is None or to_checksum is not _to_checksum_default:
+            return [cls.to_checksum_address(v) for v in values]
+
+        return _to_checksum_address_many(values)
 
-class _AddressTypeFactory:
-    @cached_property
-    def address_type(self):
-        # Lazy define for performance reasons.
-        AddressType = Annotated[ChecksumAddress, Address]
-        AddressType.__doc__ = """
-        A type that can be used in place of ``eth_typing.ChecksumAddress``.
 
-        **NOTE**: We are unable to subclass ``eth_typing.ChecksumAddress``
-          in :class:`~eth_pydantic_types.address.Address` because it is
-          a NewType; that is why we offer this annotated approach.
-        """
-        return AddressType
+_to_checksum_default = Address.to_checksum_address.__func__  # type: ignore[attr-defined]
+_lock = threading.Lock()
 
 
-_factory = _AddressTypeFactory()
+def _create_address_type():
+    AddressType = Annotated[ChecksumAddress, Address]
+    AddressType.__doc__ = """
+    A type that can be used in place of ``eth_typing.ChecksumAddress``.
+
+    **NOTE**: We are unable to subclass ``eth_typing.ChecksumAddress``
+      in :class:`~eth_pydantic_types.address.Address` because it is
+      a NewType; that is why we offer this annotated approach.
+    """
+    return AddressType
 
 
 def __getattr__(name: str):
@@ -85,7 +200,15 @@ def __getattr__(name: str):
         return Address
 
     elif name == "AddressType":
-        return _factory.address_type
+        # Lazy define for performance reasons. Once defined, it is a module global
+        # (so this is no longer called); the lock makes sure it is only defined once.
+        with _lock:
+            if name not in globals():
+                globals()[name] = _create_address_type()
+
+        return globals()[name]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 __all__ = [
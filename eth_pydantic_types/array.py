@@ -0,0 +1,287 @@
+"""
+Columnar arrays of fixed-width values (hashes, addresses and uint256 values),
+stored contiguously in a single ``bytearray`` rather than as one object per
+value. Items are validated in bulk and only become objects on access.
+
+Usage example::
+
+    class Block(BaseModel):
+        transactions: HexBytes32Array  # Instead of ``list[HexBytes32]``.
+"""
+
+from abc import abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, overload
+
+from pydantic_core.core_schema import (
+    list_schema,
+    no_info_plain_validator_function,
+    plain_serializer_function_ser_schema,
+    str_schema,
+)
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex.bytes import BoundHexBytes, HexBytes20, HexBytes32
+from eth_pydantic_types.hex.int import HexInt32
+from eth_pydantic_types.utils import get_hash_pattern
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
+
+
+ArraySelf = TypeVar("ArraySelf", bound="FixedWidthArray")
+
+
+class FixedWidthArray(Sequence):
+    """
+    A sequence of values that are each ``item_size`` bytes wide, backed by one
+    ``bytearray``. Subclasses define how values are converted to and from
+    their raw bytes.
+    """
+
+    __slots__ = ("_data",)
+
+    item_size: ClassVar[int] = 32
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self._data = self.encode_many(values)
+
+    @classmethod
+    def from_buffer(cls: type[ArraySelf], data: bytes | bytearray | memoryview) -> ArraySelf:
+        """
+        Create an array from raw, concatenated items, without validating them.
+        """
+        if len(data) % cls.item_size:
+            raise ValueError(f"Buffer size must be a multiple of {cls.item_size}.")
+
+        array = cls.__new__(cls)
+        array._data = bytearray(data)
+        return array
+
+    @classmethod
+    def encode_many(cls, values: Iterable[Any]) -> bytearray:
+        """
+        Validate values, returning their raw, concatenated bytes.
+        """
+        if isinstance(values, cls):
+            return bytearray(values._data)
+
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        if (data := cls._encode_hex_strs(values)) is not None:
+            return data
+
+        encode = cls.encode
+        return bytearray(b"".join([encode(v) for v in values]))
+
+    @classmethod
+    @abstractmethod
+    def encode(cls, value: Any) -> bytes:
+        """
+        Validate a single value, returning its raw bytes.
+        """
+
+    @classmethod
+    @abstractmethod
+    def decode(cls, data: bytes) -> Any:
+        """
+        Create the value of an item from its raw bytes.
+        """
+
+    @classmethod
+    def _encode_hex_strs(cls, values: Sequence[Any]) -> bytearray | None:
+        # perf: Full-size, 0x-prefixed hex strs (the common JSON-RPC case) are
+        #   decoded all at once. ``None`` means the values need the slow path.
+        width = cls.item_size * 2 + 2
+        try:
+            joined = "".join(values)
+        except TypeError:
+            return None  # Not all strs.
+
+        count = len(values)
+        if len(joined) != width * count or joined[1::width] != "x" * count:
+            return None
+
+        elif joined[::width] != "0" * count:
+            return None
+
+        try:
+            # NOTE: "x" is not a hex digit, so only prefixes are removed.
+            data = bytearray.fromhex(joined.replace("0x", ""))
+        except ValueError:
+            return None
+
+        # Whitespace, which ``fromhex()`` skips, leaves the data short.
+        return data if len(data) == cls.item_size * count else None
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        A read-only view of the raw, concatenated items.
+        """
+        return memoryview(self._data).toreadonly()
+
+    def tobytes(self) -> bytes:
+        return bytes(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data) // self.item_size
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self: ArraySelf, index: slice) -> ArraySelf: ...
+
+    def __getitem__(self, index):
+        size = self.item_size
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.from_buffer(self._data[start * size : stop * size])
+
+            return self.from_buffer(
+                b"".join(self._data[i * size : (i + 1) * size] for i in range(start, stop, step))
+            )
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range.")
+
+        return self.decode(bytes(self._data[index * size : (index + 1) * size]))
+
+    def __iter__(self) -> Iterator[Any]:
+        decode = self.decode
+        data = bytes(self._data)
+        size = self.item_size
+        for start in range(0, len(data), size):
+            yield decode(data[start : start + size])
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self._data == other._data
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def to_hex_list(self) -> list[str]:
+        """
+        The items as (full-size) 0x-prefixed hex strs.
+        """
+        hex_data = self._data.hex()
+        width = self.item_size * 2
+        return [f"0x{hex_data[i : i + width]}" for i in range(0, len(hex_data), width)]
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        return no_info_plain_validator_function(
+            cls.__eth_pydantic_validate__,
+            serialization=plain_serializer_function_ser_schema(cls.to_hex_list),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        pattern = get_hash_pattern(cls.item_size * 2)
+        return handler(list_schema(str_schema(pattern=pattern)))
+
+    @classmethod
+    def __eth_pydantic_validate__(cls: type[ArraySelf], value: Any, **kwargs) -> ArraySelf:
+        if type(value) is cls:
+            return value
+
+        elif isinstance(value, (str, bytes, bytearray, dict)) or not isinstance(value, Iterable):
+            # NOTE: A str or bytes would otherwise validate as its characters.
+            raise ValueError(f"Expected a sequence of values, not '{type(value).__name__}'.")
+
+        return cls(value)
+
+
+class _HexBytesArray(FixedWidthArray):
+    __slots__ = ()
+
+    item_type: ClassVar[type[BoundHexBytes]] = HexBytes32
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return cls.item_type.to_raw_bytes(cls.item_type.__eth_pydantic_validate__(value))
+
+    @classmethod
+    def decode(cls, data: bytes) -> BoundHexBytes:
+        return cls.item_type.from_valid_bytes(data)
+
+
+class HexBytes32Array(_HexBytesArray):
+    """An array of ``HexBytes32`` values (e.g. hashes)."""
+
+    __slots__ = ()
+
+    item_size: ClassVar[int] = 32
+    item_type: ClassVar[type[BoundHexBytes]] = HexBytes32
+
+
+class HexBytes20Array(_HexBytesArray):
+    """An array of ``HexBytes20`` values."""
+
+    __slots__ = ()
+
+    item_size: ClassVar[int] = 20
+    item_type: ClassVar[type[BoundHexBytes]] = HexBytes20
+
+
+class AddressArray(FixedWidthArray):
+    """
+    An array of addresses, stored as their 20 raw bytes. Items are checksummed
+    on access (through the ``Address`` checksum cache).
+    """
+
+    __slots__ = ()
+
+    item_size: ClassVar[int] = 20
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return Address.to_raw_bytes(Address.__eth_pydantic_validate__(value))
+
+    @classmethod
+    def decode(cls, data: bytes) -> str:
+        return Address.from_valid_bytes(data)
+
+    def to_hex_list(self) -> list[str]:
+        # The checksummed addresses, like ``Address`` serializes.
+        return list(Address.checksum_many(super().to_hex_list()))
+
+
+class UInt256Array(FixedWidthArray):
+    """
+    An array of ``HexInt32`` (``uint256``) values, stored as 32-byte
+    big-endian words. Serializes full-size, like ``HexInt32``.
+    """
+
+    __slots__ = ()
+
+    item_size: ClassVar[int] = 32
+
+    @classmethod
+    def encode_many(cls, values: Iterable[Any]) -> bytearray:
+        if isinstance(values, cls):
+            return bytearray(values._data)
+
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        try:
+            # perf: In-range ints (the common case) need no further validation.
+            return bytearray(b"".join([v.to_bytes(32, "big") for v in values]))
+        except (AttributeError, OverflowError):
+            pass  # Not all (in-range) ints.
+
+        return super().encode_many(values)
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return HexInt32.to_raw_bytes(HexInt32.__eth_pydantic_validate__(value))
+
+    @classmethod
+    def decode(cls, data: bytes) -> HexInt32:
+        return HexInt32.from_valid_bytes(data)
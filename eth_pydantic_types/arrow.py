@@ -0,0 +1,372 @@
+"""
+Apache Arrow integration: convert validated values and models to Arrow arrays
+and record batches (e.g. for DuckDB or Parquet) as raw bytes rather than hex
+strs, and build validated values back from Arrow buffers. Requires
+``pyarrow`` (``pip install eth-pydantic-types[arrow]``).
+
+Usage example::
+
+    from eth_pydantic_types.arrow import from_record_batch, to_record_batch
+
+    batch = to_record_batch(logs)  # A list of ``Log`` models.
+    logs = from_record_batch(Log, batch)
+"""
+
+import re
+import types
+from collections.abc import Callable, Sequence
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+
+try:
+    import pyarrow as pa
+except ImportError as err:
+    raise ImportError(
+        "Arrow integration requires pyarrow. Install with `pip install eth-pydantic-types[arrow]`."
+    ) from err
+
+from eth_pydantic_types import abi
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.array import FixedWidthArray
+from eth_pydantic_types.hex.bytes import BoundHexBytes, HexBytes
+from eth_pydantic_types.hex.int import BoundHexInt, HexInt
+from eth_pydantic_types.hex.str import BoundHexStr
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+IntFormat = Literal["binary", "decimal"]
+"""
+How hex ints are stored: as big-endian binary (the default, exact for the
+full range), i.e. ``fixed_size_binary`` for sized ones like ``HexInt32`` and
+the fewest (two's complement) bytes for ``HexInt``, or as
+``decimal256(76, 0)``, which SQL engines can do arithmetic on but which only
+holds values below ``10**76``.
+"""
+
+DECIMAL_TYPE = pa.decimal256(76, 0)
+
+_INT_TYPE_NAME = re.compile(r"(u?)int(\d+)")
+
+
+def get_arrow_type(type_: Any, int_format: IntFormat = "binary") -> "pa.DataType":
+    """
+    The Arrow type values of ``type_`` are stored as.
+
+    Args:
+        type_ (Any): An eth-pydantic-types type, e.g. ``HexBytes32`` or
+          ``abi.uint256``, a list of one, e.g. ``list[HexBytes32]``, or an array
+          type, e.g. ``HexBytes32Array``.
+        int_format (:class:`~eth_pydantic_types.arrow.IntFormat`): How to store
+          hex ints.
+
+    Returns:
+        pyarrow.DataType
+    """
+    type_ = _unwrap_alias(type_)
+    if get_origin(type_) is list and len(args := get_args(type_)) == 1:
+        return pa.list_(get_arrow_type(args[0], int_format=int_format))
+
+    elif int_spec := _get_int_spec(type_):
+        return DECIMAL_TYPE if int_format == "decimal" else pa.binary(int_spec[0])
+
+    elif not isinstance(type_, type):
+        raise TypeError(f"Unsupported type '{type_}'.")
+
+    elif issubclass(type_, FixedWidthArray):
+        return pa.list_(pa.binary(type_.item_size))
+
+    elif issubclass(type_, BoundHexBytes):
+        return pa.binary(type_.size)
+
+    elif issubclass(type_, HexBytes):
+        return pa.binary()
+
+    elif issubclass(type_, Address):
+        return pa.binary(20)
+
+    elif issubclass(type_, BoundHexStr):
+        return pa.binary(type_.size)
+
+    elif issubclass(type_, HexInt):
+        return DECIMAL_TYPE if int_format == "decimal" else pa.binary()
+
+    raise TypeError(f"Unsupported type '{type_.__name__}'.")
+
+
+def to_arrow(type_: Any, values: Sequence[Any], int_format: IntFormat = "binary") -> "pa.Array":
+    """
+    Convert validated values of ``type_`` (``None`` for nulls) to an Arrow array.
+    Fixed-width values are joined into a single buffer.
+
+    Args:
+        type_ (Any): The values' type, e.g. ``HexBytes32``.
+        values (Sequence[Any]): The (validated) values.
+        int_format (:class:`~eth_pydantic_types.arrow.IntFormat`): How to store
+          hex ints.
+
+    Returns:
+        pyarrow.Array
+    """
+    type_ = _unwrap_alias(type_)
+    arrow_type = get_arrow_type(type_, int_format=int_format)
+    if isinstance(type_, type) and issubclass(type_, FixedWidthArray):
+        # perf: The arrays' buffers are the Arrow data as-is.
+        data = b"".join([v.buffer for v in values if v is not None])
+        items = _to_fixed_size_array(arrow_type.value_type, data)
+        return _to_list_array(arrow_type, values, items)
+
+    elif pa.types.is_list(arrow_type):
+        item_type = get_args(type_)[0]
+        items = to_arrow(item_type, [item for v in values if v for item in v], int_format)
+        return _to_list_array(arrow_type, values, items)
+
+    elif pa.types.is_decimal(arrow_type):
+        return pa.array(values, type=arrow_type)
+
+    elif not pa.types.is_fixed_size_binary(arrow_type):
+        to_raw_bytes = type_.to_raw_bytes
+        return pa.array([None if v is None else to_raw_bytes(v) for v in values], arrow_type)
+
+    encode = _get_encoder(type_)
+    if None in values:
+        empty = bytes(arrow_type.byte_width)
+        data = b"".join([empty if v is None else encode(v) for v in values])
+        return _to_fixed_size_array(arrow_type, data, validity=_get_validity(values))
+
+    return _to_fixed_size_array(arrow_type, b"".join([encode(v) for v in values]))
+
+
+def from_arrow(type_: Any, array: "pa.Array | pa.ChunkedArray") -> list[Any]:
+    """
+    Build validated values of ``type_`` from an Arrow array (e.g. one created
+    by :func:`~eth_pydantic_types.arrow.to_arrow`), with ``None`` for nulls.
+    Fixed-width values are sliced straight out of the array's data buffer.
+
+    Args:
+        type_ (Any): The values' type, e.g. ``HexBytes32``.
+        array (pyarrow.Array | pyarrow.ChunkedArray): The Arrow data.
+
+    Returns:
+        list[Any]
+    """
+    if isinstance(array, pa.ChunkedArray):
+        return [value for chunk in array.chunks for value in from_arrow(type_, chunk)]
+
+    type_ = _unwrap_alias(type_)
+    int_format: IntFormat = "decimal" if pa.types.is_decimal(array.type) else "binary"
+    expected_type = get_arrow_type(type_, int_format=int_format)
+    if array.type != expected_type:
+        raise TypeError(f"Expected an Arrow array of {expected_type}, not {array.type}.")
+
+    elif isinstance(type_, type) and issubclass(type_, FixedWidthArray):
+        return _from_list_array(array, _get_data(array.values), type_.item_size, type_.from_buffer)
+
+    elif pa.types.is_list(array.type):
+        return _from_list_array(array, from_arrow(get_args(type_)[0], array.values), 1, list)
+
+    elif pa.types.is_decimal(array.type):
+        create = _get_int_factory(type_)
+        return [None if v is None else create(int(v)) for v in array.to_pylist()]
+
+    elif not pa.types.is_fixed_size_binary(array.type):
+        from_valid_bytes = type_.from_valid_bytes
+        return [None if v is None else from_valid_bytes(v) for v in array.to_pylist()]
+
+    values = _decode_many(type_, _get_data(array), array.type.byte_width)
+    if array.null_count:
+        values = [v if valid else None for v, valid in zip(values, array.is_valid().to_pylist())]
+
+    return values
+
+
+def to_record_batch(
+    models: Sequence["BaseModel"],
+    model_type: type["BaseModel"] | None = None,
+    int_format: IntFormat = "binary",
+) -> "pa.RecordBatch":
+    """
+    Convert models to an Arrow record batch, one column per field. Fields of
+    eth-pydantic-types types are stored as raw bytes (see
+    :func:`~eth_pydantic_types.arrow.to_arrow`), others as pyarrow infers.
+
+    Args:
+        models (Sequence[BaseModel]): The models, all of the same class.
+        model_type (type[BaseModel] | None): The model class. Defaults to the
+          class of the first model (required when there are no models).
+        int_format (:class:`~eth_pydantic_types.arrow.IntFormat`): How to store
+          hex ints.
+
+    Returns:
+        pyarrow.RecordBatch
+    """
+    if model_type is None:
+        if not models:
+            raise ValueError("model_type is required when there are no models.")
+
+        model_type = type(models[0])
+
+    columns = {}
+    for name, field in model_type.model_fields.items():
+        values = [getattr(model, name) for model in models]
+        type_, _ = _unwrap_optional(field.annotation)
+        if _is_supported(type_):
+            columns[name] = to_arrow(type_, values, int_format=int_format)
+        else:
+            columns[name] = pa.array(values)
+
+    return pa.RecordBatch.from_pydict(columns)
+
+
+def from_record_batch(
+    model_type: type["BaseModel"], batch: "pa.RecordBatch | pa.Table"
+) -> list["BaseModel"]:
+    """
+    Build models from an Arrow record batch (or table), e.g. one created by
+    :func:`~eth_pydantic_types.arrow.to_record_batch`. Columns of
+    eth-pydantic-types fields are converted with
+    :func:`~eth_pydantic_types.arrow.from_arrow`, then every model is validated.
+
+    Args:
+        model_type (type[BaseModel]): The model class.
+        batch (pyarrow.RecordBatch | pyarrow.Table): The Arrow data.
+
+    Returns:
+        list[BaseModel]
+    """
+    columns = {}
+    for name, field in model_type.model_fields.items():
+        if name not in batch.column_names:
+            continue  # Left to the field's default (or a validation error).
+
+        type_, _ = _unwrap_optional(field.annotation)
+        column = batch.column(name)
+        columns[name] = from_arrow(type_, column) if _is_supported(type_) else column.to_pylist()
+
+    names = list(columns)
+    validate = model_type.model_validate
+    # NOTE: Already-validated values (e.g. ``HexBytes32``) return early from
+    #   their validators, so this is cheap for them.
+    return [validate(dict(zip(names, row))) for row in zip(*columns.values())]
+
+
+def _is_supported(type_: Any) -> bool:
+    try:
+        get_arrow_type(type_)
+    except TypeError:
+        return False
+
+    return True
+
+
+def _unwrap_alias(type_: Any) -> Any:
+    # ``abi`` aliases are ``TypeAliasType``s, e.g. ``abi.address`` is ``Address``.
+    # The ``abi.intN`` / ``abi.uintN`` ones (``Annotated[int, Field(...)]``) are
+    # kept, as only the alias itself carries a known width.
+    if _get_int_spec(type_):
+        return type_
+
+    return getattr(type_, "__value__", type_)
+
+
+def _get_int_spec(type_: Any) -> tuple[int, bool] | None:
+    # The byte size and signedness of fixed-size int types.
+    if isinstance(type_, type):
+        return (type_.size, type_.signed) if issubclass(type_, BoundHexInt) else None
+
+    name = getattr(type_, "__name__", "")
+    if not (match := _INT_TYPE_NAME.fullmatch(name)) or getattr(abi, name, None) is not type_:
+        return None
+
+    unsigned, bits = match.groups()
+    return int(bits) // 8, not unsigned
+
+
+def _get_int_factory(type_: Any) -> Callable[[int], Any]:
+    # NOTE: Values of the ``abi`` int aliases are plain ints.
+    if isinstance(type_, type):
+        return type_.__eth_pydantic_validate__  # type: ignore[attr-defined]
+
+    return int
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    # Returns ``T`` and whether it is nullable, for ``T``, ``T | None`` and
+    # ``Optional[T]`` annotations.
+    if get_origin(annotation) not in (Union, types.UnionType):
+        return annotation, False
+
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if len(args) == 1:
+        return args[0], True
+
+    return annotation, False
+
+
+def _get_encoder(type_: Any) -> Callable[[Any], bytes]:
+    # Returns a function producing the raw bytes of a (validated) value.
+    if int_spec := _get_int_spec(type_):
+        size, signed = int_spec
+        return lambda value: value.to_bytes(size, "big", signed=signed)
+
+    return type_.to_raw_bytes
+
+
+def _decode_many(type_: Any, data: bytes, width: int) -> list[Any]:
+    chunks = [data[start : start + width] for start in range(0, len(data), width)]
+    if int_spec := _get_int_spec(type_):
+        create = type_ if isinstance(type_, type) else int
+        signed = int_spec[1]
+        return [create(int.from_bytes(chunk, "big", signed=signed)) for chunk in chunks]
+
+    elif issubclass(type_, Address):
+        # perf: Checksum the (cache-missing) addresses in one batch.
+        return list(type_.checksum_many([f"0x{chunk.hex()}" for chunk in chunks]))
+
+    from_valid_bytes = type_.from_valid_bytes
+    return [from_valid_bytes(chunk) for chunk in chunks]
+
+
+def _get_data(array: "pa.Array") -> bytes:
+    # The (fixed-width) values of an array, accounting for slicing.
+    width = array.type.byte_width
+    buffer = array.buffers()[1]
+    if buffer is None:
+        return b""
+
+    start = array.offset * width
+    return memoryview(buffer)[start : start + len(array) * width].tobytes()
+
+
+def _get_validity(values: Sequence[Any]) -> "pa.Buffer":
+    # perf: A boolean array's data is a bitmap, just like a validity bitmap.
+    return pa.array([v is not None for v in values], type=pa.bool_()).buffers()[1]
+
+
+def _to_fixed_size_array(
+    arrow_type: "pa.FixedSizeBinaryType", data: bytes, validity: "pa.Buffer | None" = None
+) -> "pa.FixedSizeBinaryArray":
+    count = len(data) // arrow_type.byte_width
+    return pa.FixedSizeBinaryArray.from_buffers(arrow_type, count, [validity, pa.py_buffer(data)])
+
+
+def _to_list_array(
+    arrow_type: "pa.ListType", values: Sequence[Any], items: "pa.Array"
+) -> "pa.ListArray":
+    # ``items`` are the values of all (non-null) lists in ``values``, flattened.
+    offsets = pa.array([0, *accumulate(len(v) if v else 0 for v in values)], pa.int32())
+    mask = pa.array([v is None for v in values]) if None in values else None
+    return pa.ListArray.from_arrays(offsets, items, type=arrow_type, mask=mask)
+
+
+def _from_list_array(
+    array: "pa.ListArray", items: Sequence[Any], width: int, create: Callable[[Any], Any]
+) -> list[Any]:
+    # ``items`` are the whole child array: its raw data (``width`` bytes per
+    # value) or its decoded values (``width`` 1). Offsets index into them.
+    offsets = array.offsets.to_pylist()
+    valid = array.is_valid().to_pylist()
+    return [
+        create(items[start * width : end * width]) if is_valid else None
+        for start, end, is_valid in zip(offsets, offsets[1:], valid)
+    ]
@@ -0,0 +1,30 @@
+"""
+A micro-benchmark suite for the eth-pydantic-types validators and serializers.
+
+Run it with ``python -m eth_pydantic_types.bench``; save results with
+``--output`` and catch regressions with ``--baseline``.
+"""
+
+from eth_pydantic_types.bench.runner import (
+    benchmark,
+    compare,
+    get_names,
+    load_results,
+    measurement,
+    register_benchmark,
+    run,
+    save_results,
+    time_callable,
+)
+
+__all__ = [
+    "benchmark",
+    "compare",
+    "get_names",
+    "load_results",
+    "measurement",
+    "register_benchmark",
+    "run",
+    "save_results",
+    "time_callable",
+]
@@ -0,0 +1,99 @@
+"""
+Run the benchmark suite: ``python -m eth_pydantic_types.bench --help``.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from eth_pydantic_types.bench.runner import (
+    compare,
+    get_names,
+    load_results,
+    run,
+    save_results,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m eth_pydantic_types.bench",
+        description="Benchmark the eth-pydantic-types validators and serializers.",
+    )
+    parser.add_argument("-k", "--filter", help="Only run benchmarks matching a substring or glob.")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit.")
+    parser.add_argument("-o", "--output", help="Write JSON results to this file.")
+    parser.add_argument("--baseline", help="Compare against JSON results saved earlier.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative slow-down versus the baseline (default: 0.1).",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum seconds per timed repeat (default: 0.2).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats (default: 5).")
+    parser.add_argument(
+        "--quick", action="store_true", help="Use smaller inputs for the measurements."
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON results to stdout.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(get_names(args.filter)))
+        return 0
+
+    callback = None if args.json else (lambda r: print(_format_result(r), flush=True))
+    results = run(
+        args.filter,
+        min_time=args.min_time,
+        repeat=args.repeat,
+        quick=args.quick,
+        callback=callback,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.output:
+        save_results(results, args.output)
+
+    if not args.baseline:
+        return 0
+
+    rows = compare(results, load_results(args.baseline), threshold=args.threshold)
+    regressions = [r for r in rows if r["regression"]]
+    stream = sys.stderr if args.json else sys.stdout
+    print(f"\nCompared {len(rows)} benchmarks against {args.baseline}:", file=stream)
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<64} {row['baseline_ns_per_op']:>11.1f} -> "
+            f"{row['ns_per_op']:>11.1f} ns/op ({row['ratio']:.2f}x){flag}",
+            file=stream,
+        )
+
+    return 1 if regressions else 0
+
+
+def _format_result(result: dict) -> str:
+    if "ns_per_op" in result:
+        return (
+            f"{result['name']:<64} {result['ns_per_op']:>11.1f} ns/op "
+            f"{result['ops_per_sec']:>14,.0f} ops/s"
+        )
+
+    metrics = ", ".join(f"{k}={_format_metric(v)}" for k, v in result["metrics"].items())
+    return f"{result['name']:<64} {metrics}"
+
+
+def _format_metric(value: Any) -> str:
+    return f"{value:,.2f}" if isinstance(value, float) else str(value)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Cold-start latency of the first validations in a fresh interpreter, with and
+without :func:`~eth_pydantic_types.adapters.warmup`.
+"""
+
+import json
+import subprocess
+import sys
+
+from eth_pydantic_types.bench.runner import measurement
+
+# Validates a few values the way a request handler would, after an optional
+# warm-up, and prints the timings (in milliseconds).
+_SCRIPT = """
+import json
+import time
+
+from eth_pydantic_types import Address, HexBytes32
+from eth_pydantic_types.adapters import get_adapter, warmup
+from eth_pydantic_types.hex import HexInt
+
+start = time.perf_counter()
+if {warm}:
+    warmup()
+
+warmup_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+get_adapter(list[HexBytes32]).validate_python(["0x" + "11" * 32])
+get_adapter(Address).validate_python("0x0837207e343277cbd6c114a45ec0e9ec56a1ad84")
+get_adapter(HexInt | None).validate_python("0x1b4")
+first_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"warmup_ms": warmup_ms, "first_validation_ms": first_ms}}))
+"""
+
+
+def get_first_validation_times(warm: bool) -> dict[str, float]:
+    """
+    Run the first validations in a fresh interpreter and return the timings.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(warm=warm)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+@measurement("adapters.first_validation")
+def _first_validation(quick: bool) -> dict[str, float]:
+    runs = 1 if quick else 3
+    cold = min(get_first_validation_times(False)["first_validation_ms"] for _ in range(runs))
+    warm_runs = [get_first_validation_times(True) for _ in range(runs)]
+    warm = min(run["first_validation_ms"] for run in warm_runs)
+    return {
+        "cold_ms": cold,
+        "warm_ms": warm,
+        "warmup_ms": min(run["warmup_ms"] for run in warm_runs),
+        "speedup": cold / warm,
+    }
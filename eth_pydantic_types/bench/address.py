@@ -0,0 +1,45 @@
+"""
+Address checksumming benchmarks: per-item validation versus the batch API.
+"""
+
+import random
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.bench.runner import benchmark
+
+BATCH_SIZE = 1_000
+
+
+def _random_addresses(count: int) -> list[str]:
+    rng = random.Random(0)
+    return [f"0x{rng.getrandbits(160):040x}" for _ in range(count)]
+
+
+@benchmark(f"address.checksum.loop[{BATCH_SIZE}]")
+def _checksum_loop():
+    values = _random_addresses(BATCH_SIZE)
+    validate = Address.__eth_pydantic_validate__
+
+    def fn():
+        Address.checksum_cache.clear()
+        return [validate(v) for v in values]
+
+    return fn
+
+
+@benchmark(f"address.checksum_many[{BATCH_SIZE}]")
+def _checksum_many():
+    values = _random_addresses(BATCH_SIZE)
+
+    def fn():
+        Address.checksum_cache.clear()
+        return Address.checksum_many(values)
+
+    return fn
+
+
+@benchmark(f"address.checksum.cached[{BATCH_SIZE}]")
+def _checksum_cached():
+    values = _random_addresses(BATCH_SIZE)
+    Address.checksum_many(values)  # Warm the cache.
+    return lambda: Address.checksum_many(values)
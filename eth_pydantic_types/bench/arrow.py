@@ -0,0 +1,48 @@
+"""
+Exporting validated logs to Arrow (and importing them back) as raw bytes with
+:mod:`eth_pydantic_types.arrow`, against going through hex strs
+(``model_dump(mode="json")``). Needs ``pyarrow``.
+"""
+
+import time
+
+import pyarrow as pa
+
+from eth_pydantic_types.arrow import from_record_batch, to_record_batch
+from eth_pydantic_types.bench.logs import Log, LogList, make_raw_logs
+from eth_pydantic_types.bench.runner import measurement
+
+LOGS = 100_000
+LOGS_QUICK = 10_000
+
+
+@measurement("arrow.logs")
+def _logs(quick: bool) -> dict[str, float]:
+    logs = LogList.validate_python(make_raw_logs(LOGS_QUICK if quick else LOGS))
+
+    start = time.perf_counter()
+    hex_table = pa.Table.from_pylist([log.model_dump(mode="json") for log in logs])
+    hex_export_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = to_record_batch(logs)
+    export_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    LogList.validate_python(hex_table.to_pylist())
+    hex_import_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from_record_batch(Log, batch)
+    import_s = time.perf_counter() - start
+
+    return {
+        "hex.export_s": hex_export_s,
+        "arrow.export_s": export_s,
+        "export_speedup": hex_export_s / export_s,
+        "hex.import_s": hex_import_s,
+        "arrow.import_s": import_s,
+        "import_speedup": hex_import_s / import_s,
+        "hex.bytes": float(hex_table.nbytes),
+        "arrow.bytes": float(batch.nbytes),
+    }
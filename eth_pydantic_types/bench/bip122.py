@@ -0,0 +1,66 @@
+"""
+BIP-122 URI parsing benchmarks, for valid and malformed inputs.
+"""
+
+import random
+
+from pydantic_core import PydanticCustomError
+
+from eth_pydantic_types.bench.runner import benchmark
+from eth_pydantic_types.bip122 import Bip122Uri
+
+BATCH_SIZE = 1_000
+GENESIS_HASH = "d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
+BLOCK_HASH = "752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
+
+MALFORMED = {
+    "prefix": f"bitcoin://{GENESIS_HASH}/block/{BLOCK_HASH}",
+    "hex": f"blockchain://{GENESIS_HASH}/block/{BLOCK_HASH[:-1]}z",
+    "type": f"blockchain://{GENESIS_HASH}/blocks/{BLOCK_HASH}",
+    "parts": f"blockchain://{GENESIS_HASH}/block/{BLOCK_HASH}/tx/{BLOCK_HASH}",
+}
+
+
+def _random_uris(count: int) -> list[str]:
+    rng = random.Random(0)
+    return [
+        f"blockchain://{GENESIS_HASH}/{rng.choice(('block', 'tx'))}/{rng.getrandbits(256):064x}"
+        for _ in range(count)
+    ]
+
+
+@benchmark(f"bip122.validate.valid[{BATCH_SIZE}]")
+def _validate_valid():
+    values = _random_uris(BATCH_SIZE)
+    validate = Bip122Uri.__eth_pydantic_validate__
+    return lambda: [validate(v) for v in values]
+
+
+@benchmark(f"bip122.parsed[{BATCH_SIZE}]")
+def _parsed():
+    values = _random_uris(BATCH_SIZE)
+    return lambda: [Bip122Uri(v).parsed for v in values]
+
+
+@benchmark(f"bip122.parse_many[{BATCH_SIZE}]")
+def _parse_many():
+    values = _random_uris(BATCH_SIZE)
+    return lambda: Bip122Uri.parse_many(values)
+
+
+def _register_malformed(kind: str, value: str):
+    @benchmark(f"bip122.validate.malformed.{kind}")
+    def setup():
+        validate = Bip122Uri.__eth_pydantic_validate__
+
+        def fn():
+            try:
+                validate(value)
+            except PydanticCustomError:
+                pass
+
+        return fn
+
+
+for _kind, _value in MALFORMED.items():
+    _register_malformed(_kind, _value)
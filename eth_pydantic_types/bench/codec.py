@@ -0,0 +1,62 @@
+"""
+ABI encoding and decoding benchmarks for models typed with :mod:`eth_pydantic_types.abi`.
+"""
+
+from functools import partial
+
+from pydantic import BaseModel
+
+from eth_pydantic_types import abi
+from eth_pydantic_types.bench.runner import benchmark
+from eth_pydantic_types.codec import decode_abi, encode_abi
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Transfer(BaseModel):
+    to: abi.address
+    amount: abi.uint256
+
+
+class Swap(BaseModel):
+    amount_in: abi.uint256
+    amount_out_min: abi.uint256
+    path: list[abi.address]
+    to: abi.address
+    deadline: abi.uint256
+    data: abi.bytes
+
+
+def _transfer() -> Transfer:
+    return Transfer(to=ADDRESS, amount=10**18)
+
+
+def _swap() -> Swap:
+    return Swap(
+        amount_in=10**18,
+        amount_out_min=10**17,
+        path=[ADDRESS, 2, 3],
+        to=ADDRESS,
+        deadline=2**32,
+        data=b"\x01" * 100,
+    )
+
+
+@benchmark("codec.encode.transfer")
+def _encode_transfer():
+    return partial(encode_abi, _transfer())
+
+
+@benchmark("codec.encode.swap")
+def _encode_swap():
+    return partial(encode_abi, _swap())
+
+
+@benchmark("codec.decode.transfer")
+def _decode_transfer():
+    return partial(decode_abi, Transfer, encode_abi(_transfer()))
+
+
+@benchmark("codec.decode.swap")
+def _decode_swap():
+    return partial(decode_abi, Swap, encode_abi(_swap()))
@@ -0,0 +1,34 @@
+"""
+HexBytes validation benchmarks on 32-byte hashes and 24 KB bytecode blobs
+(the EIP-170 contract size limit), across buffer input types.
+"""
+
+import os
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from eth_pydantic_types.bench.runner import register_benchmark
+from eth_pydantic_types.hex import HexBytes, HexBytes32
+
+BYTECODE_SIZE = 24 * 1024
+
+INPUTS: dict[str, Callable[[bytes], Any]] = {
+    "bytes": bytes,
+    "bytearray": bytearray,
+    "memoryview": memoryview,
+    "str": lambda b: f"0x{b.hex()}",
+}
+
+
+def _setup(hex_type, size: int, kind: str):
+    raw = os.urandom(size)
+    value = hex_type(raw) if kind == "instance" else INPUTS[kind](raw)
+    return partial(hex_type.__eth_pydantic_validate__, value)
+
+
+for _kind in (*INPUTS, "instance"):
+    register_benchmark(f"hexbytes.hash32.{_kind}", partial(_setup, HexBytes32, 32, _kind))
+    register_benchmark(
+        f"hexbytes.bytecode24k.{_kind}", partial(_setup, HexBytes, BYTECODE_SIZE, _kind)
+    )
@@ -0,0 +1,37 @@
+"""
+Import-time measurements, taken in fresh interpreters with ``-X importtime``.
+"""
+
+import re
+import subprocess
+import sys
+
+from eth_pydantic_types.bench.runner import measurement
+
+# Lines look like: "import time:  <self us> | <cumulative us> | <module>".
+_IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)$")
+
+
+def get_import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import ``module`` in a fresh interpreter and return the self and
+    cumulative import time (in microseconds) of every module it loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        m.group(3): (int(m.group(1)), int(m.group(2)))
+        for line in result.stderr.splitlines()
+        if (m := _IMPORT_TIME.match(line.strip()))
+    }
+
+
+@measurement("import.abi")
+def _import_abi(quick: bool) -> dict[str, float]:
+    runs = [get_import_times("eth_pydantic_types.abi")["eth_pydantic_types.abi"] for _ in range(3)]
+    self_us, cumulative_us = min(runs)
+    return {"self_us": float(self_us), "cumulative_us": float(cumulative_us)}
@@ -0,0 +1,302 @@
+"""
+Benchmarks over batches of synthetic ``eth_getLogs`` results.
+"""
+
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from functools import partial
+from pathlib import Path
+from typing import IO, ClassVar
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic.alias_generators import to_camel
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.bench.runner import measurement, register_benchmark
+from eth_pydantic_types.hex import HexBytes, HexBytes32, HexInt
+from eth_pydantic_types.serializers import SerializationMode
+from eth_pydantic_types.stream import avalidate_stream, validate_stream
+from eth_pydantic_types.utils import InternPool
+
+BATCH_SIZE = 10_000
+STREAM_SIZE = 1_000_000
+STREAM_SIZE_QUICK = 20_000
+# The whole-document baseline holds everything in memory, so keep it smaller.
+LOAD_SIZE = 100_000
+# The interval of the event loop heartbeat in the async latency measurement.
+HEARTBEAT_S = 0.001
+
+
+class Log(BaseModel):
+    # NOTE: Aliases match the JSON-RPC field names.
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    address: Address
+    topics: list[HexBytes32]
+    data: HexBytes
+    block_number: HexInt
+    block_hash: HexBytes32
+    transaction_hash: HexBytes32
+    transaction_index: HexInt
+    log_index: HexInt
+    removed: bool
+
+
+class NativeHexBytes(HexBytes):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.NATIVE
+
+
+class NativeHexBytes32(HexBytes32):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.NATIVE
+
+
+class NativeHexInt(HexInt):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.NATIVE
+
+
+class NativeLog(Log):
+    """The same log, keeping ``bytes`` / ``int`` values in python-mode dumps."""
+
+    topics: list[NativeHexBytes32]
+    data: NativeHexBytes
+    block_number: NativeHexInt
+    block_hash: NativeHexBytes32
+    transaction_hash: NativeHexBytes32
+    transaction_index: NativeHexInt
+    log_index: NativeHexInt
+
+
+LogList = TypeAdapter(list[Log])
+NativeLogList = TypeAdapter(list[NativeLog])
+
+
+def make_raw_logs(count: int, seed: int = 0) -> list[dict]:
+    """
+    Build ``count`` raw (JSON-RPC shaped) logs, with the block hashes,
+    transaction hashes and contract addresses repeating like they do in a
+    real block range.
+    """
+    rng = random.Random(seed)
+    addresses = [f"0x{rng.getrandbits(160):040x}" for _ in range(50)]
+    topics = [f"0x{rng.getrandbits(256):064x}" for _ in range(20)]
+    logs = []
+    for index in range(count):
+        block_number = 18_000_000 + index // 200
+        tx_index = (index // 4) % 50
+        logs.append(
+            {
+                "address": addresses[rng.randrange(len(addresses))],
+                "topics": rng.sample(topics, 3),
+                "data": f"0x{rng.getrandbits(512):0128x}",
+                "blockNumber": hex(block_number),
+                "blockHash": f"0x{block_number:064x}",
+                "transactionHash": f"0x{block_number:032x}{tx_index:032x}",
+                "transactionIndex": hex(tx_index),
+                "logIndex": hex(index % 200),
+                "removed": False,
+            }
+        )
+
+    return logs
+
+
+def write_raw_logs(file: IO[str], count: int):
+    """
+    Write a JSON-RPC ``eth_getLogs`` response with ``count`` logs to ``file``,
+    a batch at a time.
+    """
+    file.write('{"jsonrpc":"2.0","id":1,"result":[')
+    for start in range(0, count, BATCH_SIZE):
+        logs = make_raw_logs(min(BATCH_SIZE, count - start), seed=start)
+        prefix = "," if start else ""
+        file.write(prefix + ",".join(json.dumps(log) for log in logs))
+
+    file.write("]}")
+
+
+def stream_logs(path: Path | str):
+    with open(path, "rb") as file:
+        for _ in validate_stream(Log, file, chunk_size=1000):
+            pass
+
+
+def load_logs(path: Path | str):
+    with open(path, "rb") as file:
+        LogList.validate_python(json.load(file)["result"])
+
+
+# NOTE: Runs in a fresh interpreter: one timed run, then one traced run,
+#   reporting the peak memory allocated during the latter. The peak is
+#   relative to a baseline taken after the imports and setup, unlike
+#   ``ru_maxrss``, whose high-water mark already includes them. It only
+#   counts Python allocations (``tracemalloc``), not pydantic-core's native ones.
+_PEAK_SCRIPT = """
+import sys, time, tracemalloc
+from eth_pydantic_types.bench import logs
+fn = getattr(logs, sys.argv[1])
+start = time.perf_counter()
+fn(sys.argv[2])
+elapsed = time.perf_counter() - start
+tracemalloc.start()
+tracemalloc.reset_peak()
+fn(sys.argv[2])
+print(tracemalloc.get_traced_memory()[1], elapsed)
+"""
+
+
+def _measure_peak(fn_name: str, path: Path) -> tuple[float, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", _PEAK_SCRIPT, fn_name, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    peak, elapsed = result.stdout.split()
+    return int(peak) / 2**20, float(elapsed)
+
+
+@measurement("logs.stream.memory")
+def _stream_memory(quick: bool) -> dict[str, float]:
+    count = STREAM_SIZE_QUICK if quick else STREAM_SIZE
+    load_count = min(count, LOAD_SIZE)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "logs.json"
+        with open(path, "w") as file:
+            write_raw_logs(file, count)
+
+        load_path = Path(temp_dir) / "load.json"
+        with open(load_path, "w") as file:
+            write_raw_logs(file, load_count)
+
+        stream_peak_mb, stream_s = _measure_peak("stream_logs", path)
+        load_peak_mb, load_s = _measure_peak("load_logs", load_path)
+        return {
+            "logs": float(count),
+            "file_mb": path.stat().st_size / 2**20,
+            "stream_peak_mb": stream_peak_mb,
+            "stream_s": stream_s,
+            "load_logs": float(load_count),
+            "load_file_mb": load_path.stat().st_size / 2**20,
+            "load_peak_mb": load_peak_mb,
+            "load_s": load_s,
+        }
+
+
+def _validate_retained(raw_logs: list[dict]) -> tuple[float, float]:
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        logs = LogList.validate_python(raw_logs)
+        elapsed = time.perf_counter() - start
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del logs
+    return retained / 2**20, elapsed
+
+
+@measurement("logs.intern")
+def _intern(quick: bool) -> dict[str, float]:
+    raw_logs = make_raw_logs(BATCH_SIZE)
+    retained_mb, validate_s = _validate_retained(raw_logs)
+
+    pool = InternPool()
+    pooled = (Address, HexBytes32, HexInt)
+    for cls in pooled:
+        cls.intern_pool = pool
+
+    try:
+        pooled_mb, pooled_s = _validate_retained(raw_logs)
+    finally:
+        for cls in pooled:
+            cls.intern_pool = None
+
+    return {
+        "retained_mb": retained_mb,
+        "pooled_retained_mb": pooled_mb,
+        "validate_s": validate_s,
+        "pooled_validate_s": pooled_s,
+        "interned": float(pool.interned),
+        "new": float(pool.new),
+    }
+
+
+async def _measure_loop_latency(work: Callable[[], Awaitable]) -> tuple[float, float]:
+    # Run ``work`` next to a heartbeat task, returning the longest interval
+    # between heartbeats (how long the loop was blocked) and the total time.
+    max_interval = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_interval
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(HEARTBEAT_S)
+            now = time.perf_counter()
+            max_interval = max(max_interval, now - last)
+            last = now
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await task
+    return max_interval * 1000, elapsed
+
+
+async def _validate_inline(raw_logs: list[dict]):
+    LogList.validate_python(raw_logs)
+
+
+async def _validate_async(raw_logs: list[dict]):
+    async for _ in avalidate_stream(Log, raw_logs):
+        pass
+
+
+@measurement("logs.async.latency")
+def _async_latency(quick: bool) -> dict[str, float]:
+    raw_logs = make_raw_logs(BATCH_SIZE)
+    # Build the adapters first, like a long-running service would have.
+    asyncio.run(_validate_async(raw_logs[:1]))
+    inline_ms, inline_s = asyncio.run(_measure_loop_latency(partial(_validate_inline, raw_logs)))
+    async_ms, async_s = asyncio.run(_measure_loop_latency(partial(_validate_async, raw_logs)))
+    return {
+        "inline_max_blocking_ms": inline_ms,
+        "inline_s": inline_s,
+        "async_max_blocking_ms": async_ms,
+        "async_s": async_s,
+    }
+
+
+def _setup_dump(mode: str):
+    logs = LogList.validate_python(make_raw_logs(BATCH_SIZE))
+    return partial(LogList.dump_json if mode == "json" else LogList.dump_python, logs)
+
+
+def _setup_validate(mode: str):
+    raw_logs = make_raw_logs(BATCH_SIZE)
+    if mode == "json":
+        return partial(LogList.validate_json, LogList.dump_json(LogList.validate_python(raw_logs)))
+
+    return partial(LogList.validate_python, raw_logs)
+
+
+def _setup_dump_native():
+    logs = NativeLogList.validate_python(make_raw_logs(BATCH_SIZE))
+    return partial(NativeLogList.dump_python, logs)
+
+
+register_benchmark(f"logs.dump.python.native[{BATCH_SIZE}]", _setup_dump_native)
+for _mode in ("python", "json"):
+    register_benchmark(f"logs.validate.{_mode}[{BATCH_SIZE}]", partial(_setup_validate, _mode))
+    register_benchmark(f"logs.dump.{_mode}[{BATCH_SIZE}]", partial(_setup_dump, _mode))
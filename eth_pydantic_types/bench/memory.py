@@ -0,0 +1,114 @@
+"""
+Memory measurements, taken with ``tracemalloc``.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.array import HexBytes32Array
+from eth_pydantic_types.bench.runner import measurement
+from eth_pydantic_types.bip122 import Bip122Uri
+from eth_pydantic_types.hex import (
+    HexBytes,
+    HexBytes20,
+    HexBytes32,
+    HexInt,
+    HexInt32,
+    HexStr,
+    HexStr20,
+    HexStr32,
+)
+
+INSTANCES = 100_000
+INSTANCES_QUICK = 10_000
+GENESIS_HASH = "d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
+
+
+def _bip122_uri(value: int) -> Bip122Uri:
+    return Bip122Uri(f"blockchain://{GENESIS_HASH}/block/{value:064x}")
+
+
+# NOTE: Each factory creates an instance from a distinct (large) int. The builtin
+#   entries are the baselines of the same values without any wrapper type.
+FACTORIES: dict[str, Callable[[int], Any]] = {
+    "HexBytes": HexBytes.__eth_pydantic_validate__,
+    "HexBytes20": HexBytes20.__eth_pydantic_validate__,
+    "HexBytes32": HexBytes32.__eth_pydantic_validate__,
+    "HexStr": HexStr.__eth_pydantic_validate__,
+    "HexStr20": HexStr20.__eth_pydantic_validate__,
+    "HexStr32": HexStr32.__eth_pydantic_validate__,
+    "HexInt": HexInt.__eth_pydantic_validate__,
+    "HexInt32": HexInt32.__eth_pydantic_validate__,
+    "Address": Address.__eth_pydantic_validate__,
+    "Bip122Uri": _bip122_uri,
+    "builtin.bytes32": lambda value: value.to_bytes(32, "big"),
+    "builtin.str32": lambda value: f"0x{value:064x}",
+    "builtin.int": lambda value: value + 1,
+}
+
+
+def get_bytes_per_instance(factory: Callable[[int], Any], count: int) -> float:
+    """
+    The traced memory, in bytes, held per instance created by ``factory``.
+    """
+    # Values are offset so none of them are cached small ints.
+    inputs = [(1 << 150) + i for i in range(count)]
+    instances: list[Any] = [None] * count
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for index, value in enumerate(inputs):
+            instances[index] = factory(value)
+
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / count
+
+
+@measurement("memory.bytes_per_instance")
+def _bytes_per_instance(quick: bool) -> dict[str, float]:
+    count = INSTANCES_QUICK if quick else INSTANCES
+    return {name: get_bytes_per_instance(fn, count) for name, fn in FACTORIES.items()}
+
+
+def get_traced_bytes(factory: Callable[[], Any]) -> tuple[Any, int]:
+    """
+    Call ``factory``, returning its result and the traced memory it holds.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = factory()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, after - before
+
+
+@measurement("memory.columnar")
+def _columnar(quick: bool) -> dict[str, float]:
+    # A block's worth (or more) of transaction hashes: one object per hash
+    # against a single ``HexBytes32Array``.
+    count = INSTANCES_QUICK if quick else INSTANCES
+    raw_hashes = [f"0x{(1 << 150) + i:064x}" for i in range(count)]
+    validate = HexBytes32.__eth_pydantic_validate__
+    factories: dict[str, Callable[[], Any]] = {
+        "list": lambda: [validate(v) for v in raw_hashes],
+        "array": lambda: HexBytes32Array(raw_hashes),
+    }
+
+    metrics: dict[str, float] = {}
+    for name, factory in factories.items():
+        # NOTE: Timed separately; ``tracemalloc`` slows down allocations.
+        start = time.perf_counter()
+        factory()
+        metrics[f"{name}.validate_ns_per_value"] = (time.perf_counter() - start) / count * 1e9
+        metrics[f"{name}.bytes_per_value"] = get_traced_bytes(factory)[1] / count
+
+    return metrics
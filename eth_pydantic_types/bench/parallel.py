@@ -0,0 +1,43 @@
+"""
+Process-pool scaling of ``validate_parallel()`` over a batch of raw hashes,
+against validating them one by one in this process.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+
+from eth_pydantic_types.bench.runner import measurement
+from eth_pydantic_types.hex import HexBytes32
+from eth_pydantic_types.parallel import validate_parallel
+
+BATCH_SIZE = 400_000
+BATCH_SIZE_QUICK = 40_000
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def make_raw_hashes(count: int) -> list[str]:
+    return [f"0x{sha256(i.to_bytes(8, 'big')).hexdigest()}" for i in range(count)]
+
+
+@measurement("parallel.scaling")
+def _scaling(quick: bool) -> dict[str, float]:
+    raw_hashes = make_raw_hashes(BATCH_SIZE_QUICK if quick else BATCH_SIZE)
+    start = time.perf_counter()
+    for value in raw_hashes:
+        HexBytes32.__eth_pydantic_validate__(value)
+
+    sequential_s = time.perf_counter() - start
+    metrics = {"values": float(len(raw_hashes)), "sequential_s": sequential_s}
+    for workers in WORKER_COUNTS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Start the workers (outside of the timing).
+            validate_parallel(HexBytes32, raw_hashes[:workers], executor=executor, chunk_size=1)
+            start = time.perf_counter()
+            validate_parallel(HexBytes32, raw_hashes, workers=workers, executor=executor)
+            elapsed = time.perf_counter() - start
+
+        metrics[f"workers_{workers}_s"] = elapsed
+        metrics[f"workers_{workers}_speedup"] = sequential_s / elapsed
+
+    return metrics
@@ -0,0 +1,219 @@
+import importlib
+import importlib.util
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+# Modules (relative to this package) that register benchmarks when imported.
+SUITES = (
+    "validation",
+    "address",
+    "hexbytes",
+    "imports",
+    "codec",
+    "logs",
+    "memory",
+    "bip122",
+    "unions",
+    "threads",
+    "parallel",
+    "adapters",
+)
+
+# Suites needing an optional dependency, loaded only when it is installed.
+OPTIONAL_SUITES = {
+    "uint256": "numpy",
+    "arrow": "pyarrow",
+}
+
+_BENCHMARKS: dict[str, Callable[[], Callable[[], Any]]] = {}
+_MEASUREMENTS: dict[str, Callable[[bool], dict[str, float]]] = {}
+
+
+def register_benchmark(name: str, setup: Callable[[], Callable[[], Any]]):
+    """
+    Register a timed benchmark.
+
+    Args:
+        name (str): The unique, dotted name of the benchmark.
+        setup (Callable): A function that prepares any inputs and returns
+          the zero-argument callable to time.
+    """
+    if name in _BENCHMARKS:
+        raise ValueError(f"Benchmark '{name}' already registered.")
+
+    _BENCHMARKS[name] = setup
+
+
+def benchmark(name: str):
+    """
+    Decorator form of :func:`register_benchmark`.
+    """
+
+    def decorator(setup):
+        register_benchmark(name, setup)
+        return setup
+
+    return decorator
+
+
+def measurement(name: str):
+    """
+    Register a measurement: a benchmark reporting its own metrics (memory,
+    latency, scaling, ...) rather than an op time. The decorated function
+    receives ``quick`` and returns a flat ``dict`` of metrics.
+    """
+
+    def decorator(fn):
+        if name in _MEASUREMENTS:
+            raise ValueError(f"Measurement '{name}' already registered.")
+
+        _MEASUREMENTS[name] = fn
+        return fn
+
+    return decorator
+
+
+def load_suites():
+    for suite in SUITES:
+        importlib.import_module(f"{__package__}.{suite}")
+
+    for suite, dependency in OPTIONAL_SUITES.items():
+        if importlib.util.find_spec(dependency) is not None:
+            importlib.import_module(f"{__package__}.{suite}")
+
+
+def get_names(pattern: str | None = None) -> list[str]:
+    load_suites()
+    return [n for n in (*_BENCHMARKS, *_MEASUREMENTS) if _matches(n, pattern)]
+
+
+def time_callable(fn: Callable[[], Any], min_time: float = 0.2, repeat: int = 5) -> dict:
+    timer = timeit.Timer(fn)
+    number = 1
+    # Find a loop count that takes at least ``min_time`` (like ``timeit.autorange``).
+    while (elapsed := timer.timeit(number)) < min_time:
+        number *= 2 if elapsed * 10 > min_time else 10
+
+    best = min([elapsed, *timer.repeat(repeat=repeat - 1, number=number)])
+    ns_per_op = best / number * 1e9
+    return {
+        "ns_per_op": ns_per_op,
+        "ops_per_sec": 1e9 / ns_per_op if ns_per_op else float("inf"),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(
+    pattern: str | None = None,
+    min_time: float = 0.2,
+    repeat: int = 5,
+    quick: bool = False,
+    callback: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Run the registered benchmarks.
+
+    Args:
+        pattern (str | None): Only run benchmarks whose name contains this
+          substring or matches this glob.
+        min_time (float): The minimum time, in seconds, of each timed repeat.
+        repeat (int): How many times to repeat each benchmark. The best run
+          is reported.
+        quick (bool): Let measurements use smaller inputs.
+        callback (Callable | None): Called with each result as it completes.
+
+    Returns:
+        dict: Machine-readable results, see :func:`save_results`.
+    """
+    load_suites()
+    results = []
+    for name, setup in _BENCHMARKS.items():
+        if not _matches(name, pattern):
+            continue
+
+        fn = setup()
+        result = {"name": name, **time_callable(fn, min_time=min_time, repeat=repeat)}
+        results.append(result)
+        if callback:
+            callback(result)
+
+    for name, measure in _MEASUREMENTS.items():
+        if not _matches(name, pattern):
+            continue
+
+        result = {"name": name, "metrics": measure(quick)}
+        results.append(result)
+        if callback:
+            callback(result)
+
+    return {"meta": _get_meta(), "results": results}
+
+
+def save_results(results: dict, path: Path | str):
+    Path(path).write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def load_results(path: Path | str) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.1) -> list[dict]:
+    """
+    Compare timed results against a baseline.
+
+    Args:
+        current (dict): Results from :func:`run`.
+        baseline (dict): Previously saved results.
+        threshold (float): The allowed relative slow-down before a
+          benchmark counts as a regression (``0.1`` is 10%).
+
+    Returns:
+        list[dict]: One row per benchmark present in both results, with the
+        ``ratio`` of current to baseline ns/op and a ``regression`` flag.
+    """
+    baseline_times = {
+        r["name"]: r["ns_per_op"] for r in baseline.get("results", []) if "ns_per_op" in r
+    }
+    rows = []
+    for result in current.get("results", []):
+        name = result["name"]
+        if "ns_per_op" not in result or name not in baseline_times:
+            continue
+
+        ratio = result["ns_per_op"] / baseline_times[name]
+        rows.append(
+            {
+                "name": name,
+                "baseline_ns_per_op": baseline_times[name],
+                "ns_per_op": result["ns_per_op"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+
+    return rows
+
+
+def _matches(name: str, pattern: str | None) -> bool:
+    return not pattern or pattern in name or fnmatch(name, pattern)
+
+
+def _get_meta() -> dict:
+    try:
+        from eth_pydantic_types.version import version
+    except ImportError:
+        version = "unknown"
+
+    return {
+        "eth_pydantic_types": version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
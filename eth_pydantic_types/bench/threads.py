@@ -0,0 +1,69 @@
+"""
+Multi-thread scaling: a fixed corpus of logs validated across 1, 2, 4 and 8
+threads. On a GIL build the speedup stays around 1x; on free-threaded builds
+it shows how close validation gets to linear scaling.
+"""
+
+import sys
+import threading
+import time
+
+from eth_pydantic_types.bench.logs import LogList, make_raw_logs
+from eth_pydantic_types.bench.runner import measurement
+
+CORPUS_SIZE = 40_000
+CORPUS_SIZE_QUICK = 4_000
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def validate_threaded(raw_logs: list[dict], threads: int) -> float:
+    """
+    Validate ``raw_logs``, split evenly across ``threads`` threads started
+    together, and return the wall time in seconds.
+    """
+    size = -(-len(raw_logs) // threads)
+    chunks = [raw_logs[i : i + size] for i in range(0, len(raw_logs), size)]
+    barrier = threading.Barrier(len(chunks) + 1)
+    errors: list[BaseException] = []
+
+    def run(chunk: list[dict]):
+        barrier.wait()
+        try:
+            LogList.validate_python(chunk)
+        except BaseException as err:
+            errors.append(err)
+
+    workers = [threading.Thread(target=run, args=(chunk,)) for chunk in chunks]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+
+    return elapsed
+
+
+@measurement("threads.scaling")
+def _scaling(quick: bool) -> dict[str, float]:
+    raw_logs = make_raw_logs(CORPUS_SIZE_QUICK if quick else CORPUS_SIZE)
+    # Warm up (schemas, the checksum cache) so every thread count starts equal.
+    LogList.validate_python(raw_logs)
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    metrics: dict[str, float] = {"gil_enabled": float(is_gil_enabled())}
+    baseline = 0.0
+    for threads in THREAD_COUNTS:
+        elapsed = min(validate_threaded(raw_logs, threads) for _ in range(3))
+        baseline = baseline or elapsed
+        metrics[f"threads_{threads}_s"] = elapsed
+        metrics[f"threads_{threads}_ops_per_sec"] = len(raw_logs) / elapsed
+        # Efficiency is the speedup over one thread, per thread (1.0 is linear).
+        metrics[f"threads_{threads}_efficiency"] = baseline / elapsed / threads
+
+    return metrics
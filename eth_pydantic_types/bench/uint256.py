@@ -0,0 +1,48 @@
+"""
+Aggregating ``uint256`` amounts as a :class:`~eth_pydantic_types.uint256.UInt256Column`
+against the same work over a list of ``HexInt32`` values. Needs ``numpy``.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from eth_pydantic_types.bench.runner import measurement
+from eth_pydantic_types.hex import HexInt32
+from eth_pydantic_types.uint256 import UInt256Column
+
+AMOUNTS = 1_000_000
+AMOUNTS_QUICK = 100_000
+THRESHOLD = 10**18
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@measurement("uint256.aggregate")
+def _aggregate(quick: bool) -> dict[str, float]:
+    count = AMOUNTS_QUICK if quick else AMOUNTS
+    # Token amounts of (up to) 18 decimals, some large.
+    amounts = [HexInt32(i * 10**15 + (i % 7) * 2**130) for i in range(count)]
+    column = UInt256Column.from_values(amounts)
+    metrics: dict[str, float] = {
+        "from_values_s": _time(lambda: UInt256Column.from_values(amounts)),
+        "to_values_s": _time(column.tolist),
+    }
+    operations: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        "sum": (lambda: sum(amounts), column.sum),
+        "max": (lambda: max(amounts), column.max),
+        "compare": (lambda: [v > THRESHOLD for v in amounts], lambda: column > THRESHOLD),
+        "add": (lambda: [v + v for v in amounts], lambda: column + column),
+    }
+    for name, (python_fn, column_fn) in operations.items():
+        python_s = min(_time(python_fn) for _ in range(3))
+        column_s = min(_time(column_fn) for _ in range(3))
+        metrics[f"{name}.python_s"] = python_s
+        metrics[f"{name}.column_s"] = column_s
+        metrics[f"{name}.speedup"] = python_s / column_s
+
+    return metrics
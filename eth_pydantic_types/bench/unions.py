@@ -0,0 +1,48 @@
+"""
+Union validation benchmarks, over mixed (valid and invalid) inputs, for
+plain unions and their ``hex_union()`` equivalents.
+"""
+
+from functools import partial
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.bench.runner import register_benchmark
+from eth_pydantic_types.hex import HexBytes, HexStr32
+from eth_pydantic_types.union import hex_union
+
+HASH = "0x9b70bd98ccb5b6434c2ead14d68d15f392435a06ff469f8d1f8cf38b2ae0b0e2"
+ADDRESS = "0x0837207e343277cbd6c114a45ec0e9ec56a1ad84"
+
+UNIONS: dict[str, tuple[Any, Any, list[Any]]] = {
+    "HexBytes|int|None": (
+        HexBytes | int | None,
+        hex_union(HexBytes, int, None),
+        [None, 5, "0x01", bytes.fromhex(HASH[2:]), HASH, 1.5, "hello", [1]],
+    ),
+    "Address|HexStr32": (
+        Address | HexStr32,
+        hex_union(Address, HexStr32),
+        [ADDRESS, HASH, 5, bytes.fromhex(ADDRESS[2:]), None, 1.5, "hello", [1]],
+    ),
+}
+
+
+def _setup(annotation: Any, inputs: list[Any]):
+    validate = TypeAdapter(annotation).validate_python
+
+    def fn():
+        for value in inputs:
+            try:
+                validate(value)
+            except ValidationError:
+                pass
+
+    return fn
+
+
+for _name, (_plain, _discriminated, _inputs) in UNIONS.items():
+    register_benchmark(f"union.{_name}.plain[mixed]", partial(_setup, _plain, _inputs))
+    register_benchmark(f"union.{_name}.hex_union[mixed]", partial(_setup, _discriminated, _inputs))
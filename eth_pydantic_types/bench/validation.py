@@ -0,0 +1,142 @@
+"""
+Validation and serialization benchmarks for every public type, across input
+kinds (0x-prefixed str, unprefixed str, bytes, int, already-validated
+instance) and pydantic modes (python and JSON).
+"""
+
+import json
+from functools import partial
+from typing import Any
+
+from pydantic import TypeAdapter, create_model
+
+from eth_pydantic_types import abi
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.bench.runner import register_benchmark
+from eth_pydantic_types.bip122 import Bip122Uri
+from eth_pydantic_types.hex import (
+    HexBytes,
+    HexBytes20,
+    HexBytes32,
+    HexInt,
+    HexInt32,
+    HexStr,
+    HexStr20,
+    HexStr32,
+)
+
+HASH = "0x9b70bd98ccb5b6434c2ead14d68d15f392435a06ff469f8d1f8cf38b2ae0b0e2"
+ADDRESS = "0x0837207e343277cbd6c114a45ec0e9ec56a1ad84"
+QUANTITY = "0x1b4"
+# The number of quantities validated per op in the bulk benchmarks.
+QUANTITIES = 10_000
+BIP122_URI = (
+    "blockchain://d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
+    "/block/752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
+)
+
+
+def _hex_samples(value: str) -> dict[str, Any]:
+    body = value[2:]
+    return {
+        "str": value,
+        "str-no-0x": body,
+        "bytes": bytes.fromhex(body.zfill(len(body) + len(body) % 2)),
+        "int": int(value, 16),
+    }
+
+
+# NOTE: Keys are the names used in the benchmark names.
+TYPES: dict[str, tuple[Any, dict[str, Any]]] = {
+    "HexBytes": (HexBytes, _hex_samples("0xd4e56740f876aef8")),
+    "HexBytes20": (HexBytes20, _hex_samples(ADDRESS)),
+    "HexBytes32": (HexBytes32, _hex_samples(HASH)),
+    "HexStr": (HexStr, _hex_samples("0xd4e56740f876aef8")),
+    "HexStr20": (HexStr20, _hex_samples(ADDRESS)),
+    "HexStr32": (HexStr32, _hex_samples(HASH)),
+    "HexInt": (HexInt, _hex_samples(QUANTITY)),
+    "HexInt32": (HexInt32, _hex_samples(QUANTITY)),
+    "Address": (Address, _hex_samples(ADDRESS)),
+    "Bip122Uri": (Bip122Uri, {"str": BIP122_URI}),
+    "abi.uint256": (abi.uint256, {"int": 2**200}),
+    "abi.int128": (abi.int128, {"int": -(2**100)}),
+    "abi.bool": (abi.bool, {"bool": True}),
+    "abi.address": (abi.address, _hex_samples(ADDRESS)),
+    "abi.bytes": (abi.bytes, _hex_samples("0xd4e56740f876aef8")),
+    "abi.bytes4": (abi.bytes4, _hex_samples("0xa9059cbb")),
+    "abi.bytes32": (abi.bytes32, _hex_samples(HASH)),
+}
+
+
+def _model_for(name: str, annotation: Any):
+    return create_model(f"Bench_{name.replace('.', '_')}", value=(annotation, ...))
+
+
+def _is_json_input(value: Any) -> bool:
+    return isinstance(value, (str, int)) and not isinstance(value, bytes)
+
+
+def _register_type(name: str, annotation: Any, samples: dict[str, Any]):
+    samples = {
+        **samples,
+        "instance": TypeAdapter(annotation).validate_python(next(iter(samples.values()))),
+    }
+    for kind, sample in samples.items():
+        register_benchmark(
+            f"validate.python.{name}.{kind}",
+            partial(_setup_validate_python, name, annotation, sample),
+        )
+        if _is_json_input(sample):
+            register_benchmark(
+                f"validate.json.{name}.{kind}",
+                partial(_setup_validate_json, name, annotation, sample),
+            )
+
+    register_benchmark(
+        f"dump.python.{name}", partial(_setup_dump, name, annotation, samples["instance"], "python")
+    )
+    register_benchmark(
+        f"dump.json.{name}", partial(_setup_dump, name, annotation, samples["instance"], "json")
+    )
+
+
+def _setup_validate_python(name: str, annotation: Any, sample: Any):
+    return partial(_model_for(name, annotation).model_validate, {"value": sample})
+
+
+def _setup_validate_json(name: str, annotation: Any, sample: Any):
+    return partial(_model_for(name, annotation).model_validate_json, json.dumps({"value": sample}))
+
+
+def _setup_dump(name: str, annotation: Any, sample: Any, mode: str):
+    instance = _model_for(name, annotation)(value=sample)
+    return instance.model_dump_json if mode == "json" else instance.model_dump
+
+
+for _name, (_annotation, _samples) in TYPES.items():
+    _register_type(_name, _annotation, _samples)
+
+
+def make_quantities(count: int) -> list[str]:
+    """
+    Typical JSON-RPC quantities: block numbers, gas, gas prices, nonces and
+    wei amounts, as the (unpadded) hex str nodes return them.
+    """
+    kinds = (0x1B4, 18_000_000, 21_000, 30 * 10**9, 0, 10**18)
+    return [hex(kinds[i % len(kinds)] + i) for i in range(count)]
+
+
+def _setup_validate_quantities(mode: str):
+    adapter = TypeAdapter(list[HexInt32])
+    quantities = make_quantities(QUANTITIES)
+    if mode == "json":
+        return partial(adapter.validate_json, json.dumps(quantities))
+
+    return partial(adapter.validate_python, quantities)
+
+
+for _mode in ("python", "json"):
+    register_benchmark(
+        f"validate.{_mode}.HexInt32.quantities[{QUANTITIES}]",
+        partial(_setup_validate_quantities, _mode),
+    )
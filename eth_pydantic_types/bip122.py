@@ -1,5 +1,7 @@
+import re
+from collections.abc import Iterable
 from enum import Enum
-from functools import cached_property
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from pydantic_core.core_schema import (
@@ -8,8 +10,9 @@ from pydantic_core.core_schema import (
     with_info_before_validator_function,
 )
 
+import eth_pydantic_types.instrumentation as instrumentation
 from eth_pydantic_types._error import Bip122UriFormatError
-from eth_pydantic_types.hex import validate_hex_str
+from eth_pydantic_types.utils import normalize_hex
 
 if TYPE_CHECKING:
     from pydantic_core import CoreSchema
@@ -21,7 +24,23 @@ class Bip122UriType(Enum):
     ADDRESS = "address"
 
 
+_URI_TYPES = {t.value: t for t in Bip122UriType}
+
+
+@cache
+def _get_uri_pattern(prefix: str) -> re.Pattern:
+    # Matches ``<prefix><hex>/<type>/<hex>``, where the hashes may be 0x-prefixed
+    # and the type is case-insensitive.
+    uri_types = "|".join(_URI_TYPES)
+    hex_str = "(?:0x)?([0-9a-fA-F]*)"
+    return re.compile(f"{re.escape(prefix)}{hex_str}/((?i:{uri_types}))/{hex_str}")
+
+
 class Bip122Uri(str):
+    # NOTE: A slot (rather than ``__dict__``) holds the lazily parsed parts.
+    __slots__ = ("_parsed",)
+    _parsed: tuple[str, Bip122UriType, str]
+
     prefix: str = "blockchain://"
 
     @classmethod
@@ -47,33 +66,72 @@ class Bip122Uri(str):
     def __eth_pydantic_validate__(
         cls, value: Any, info: ValidationInfo | None = None, **kwargs
     ) -> str:
-        if not value.startswith(cls.prefix):
-            raise Bip122UriFormatError(value)
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
 
-        genesis_hash, block_keyword, block_hash = cls.parse(value)
-        return f"{cls.prefix}{genesis_hash[2:]}/{block_keyword.value}/{block_hash[2:]}"
+        return cls._format(cls.parse(value))
 
     @classmethod
     def parse(cls, value: str) -> tuple[str, Bip122UriType, str]:
-        protocol_suffix = value.replace(cls.prefix, "")
-        protocol_parsed = protocol_suffix.split("/")
-        if len(protocol_parsed) != 3:
-            raise Bip122UriFormatError(value)
-
-        genesis_hash, block_keyword, block_hash = protocol_parsed
-        block_keyword = block_keyword.lower()
-        if block_keyword not in [x.value for x in Bip122UriType]:
+        """
+        Validate and split a URI into its (normalized) genesis hash, type
+        and hash, in a single pass.
+
+        Args:
+            value (str): The URI.
+
+        Returns:
+            tuple[str, :class:`~eth_pydantic_types.bip122.Bip122UriType`, str]
+        """
+        if not isinstance(value, str) or not (
+            match := _get_uri_pattern(cls.prefix).fullmatch(value)
+        ):
             raise Bip122UriFormatError(value)
 
+        genesis_hash, uri_type, block_hash = match.groups()
         return (
-            validate_hex_str(genesis_hash),
-            Bip122UriType(block_keyword),
-            validate_hex_str(block_hash),
+            normalize_hex(genesis_hash),
+            _URI_TYPES[uri_type.lower()],
+            normalize_hex(block_hash),
         )
 
-    @cached_property
+    @classmethod
+    def parse_many(cls, values: Iterable[str]) -> list["Bip122Uri"]:
+        """
+        Validate many URIs, returning normalized instances that have their
+        parsed parts already stored (so :attr:`parsed` does not parse again).
+
+        Args:
+            values (Iterable[str]): The URIs.
+
+        Returns:
+            list[:class:`~eth_pydantic_types.bip122.Bip122Uri`]
+        """
+        parse = cls.parse
+        format_uri = cls._format
+        results = []
+        for value in values:
+            parsed = parse(value)
+            uri = cls(format_uri(parsed))
+            uri._parsed = parsed
+            results.append(uri)
+
+        return results
+
+    @classmethod
+    def _format(cls, parsed: tuple[str, Bip122UriType, str]) -> str:
+        genesis_hash, uri_type, block_hash = parsed
+        return f"{cls.prefix}{genesis_hash[2:]}/{uri_type.value}/{block_hash[2:]}"
+
+    @property
     def parsed(self) -> tuple[str, Bip122UriType, str]:
-        return self.parse(self)
+        try:
+            return self._parsed
+        except AttributeError:
+            self._parsed = self.parse(self)
+            return self._parsed
 
     @property
     def chain(self) -> str:
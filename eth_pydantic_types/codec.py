@@ -0,0 +1,377 @@
+"""
+ABI encoding and decoding for pydantic models whose fields use
+:mod:`eth_pydantic_types.abi` (or the equivalent hex / address) types.
+
+The fields of a model are encoded, in order, as the arguments of a function
+call (the standard head / tail layout). The per-field codecs are resolved
+once per model class and cached, so repeated encodes and decodes do no type
+introspection.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+from eth_pydantic_types import abi
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex.bytes import BoundHexBytes
+from eth_pydantic_types.hex.int import BoundHexInt
+from eth_pydantic_types.hex.str import BoundHexStr
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+_ModelT = TypeVar("_ModelT", bound="BaseModel")
+
+WORD_SIZE = 32
+
+_INT_TYPE_NAME = re.compile(r"(u?)int(\d+)")
+
+
+class _Codec(ABC):
+    dynamic: ClassVar[bool] = False
+
+    @abstractmethod
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        pass
+
+    @abstractmethod
+    def decode(self, data: memoryview, offset: int) -> Any:
+        """
+        Decode the value whose head word starts at ``offset``.
+        """
+
+
+class _UIntCodec(_Codec):
+    def __init__(self, bits: int):
+        self.bits = bits
+        self.max_value = 2**bits - 1
+
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        if not 0 <= value <= self.max_value:
+            raise ValueError(f"Value {value} out of range for uint{self.bits}.")
+
+        buf[offset : offset + WORD_SIZE] = value.to_bytes(WORD_SIZE, "big")
+
+    def decode(self, data: memoryview, offset: int) -> int:
+        value = int.from_bytes(_read_word(data, offset), "big")
+        if value > self.max_value:
+            raise ValueError(f"Value {value} out of range for uint{self.bits}.")
+
+        return value
+
+
+class _IntCodec(_Codec):
+    def __init__(self, bits: int):
+        self.bits = bits
+        self.min_value = -(2 ** (bits - 1))
+        self.max_value = 2 ** (bits - 1) - 1
+
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        if not self.min_value <= value <= self.max_value:
+            raise ValueError(f"Value {value} out of range for int{self.bits}.")
+
+        buf[offset : offset + WORD_SIZE] = value.to_bytes(WORD_SIZE, "big", signed=True)
+
+    def decode(self, data: memoryview, offset: int) -> int:
+        value = int.from_bytes(_read_word(data, offset), "big", signed=True)
+        if not self.min_value <= value <= self.max_value:
+            raise ValueError(f"Value {value} out of range for int{self.bits}.")
+
+        return value
+
+
+class _BoolCodec(_Codec):
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        # NOTE: The buffer is zero-initialized.
+        if value:
+            buf[offset + WORD_SIZE - 1] = 1
+
+    def decode(self, data: memoryview, offset: int) -> bool:
+        value = int.from_bytes(_read_word(data, offset), "big")
+        if value > 1:
+            raise ValueError(f"Value {value} is not a valid bool.")
+
+        return value == 1
+
+
+class _FixedBytesCodec(_Codec):
+    def __init__(self, size: int, factory: Callable[[memoryview], Any], left_pad: bool = False):
+        self.size = size
+        self.factory = factory
+        # Addresses (like ints) are left-padded; bytesN are right-padded.
+        self.start = WORD_SIZE - size if left_pad else 0
+        self.padding = bytes(WORD_SIZE - size)
+
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        if isinstance(value, str):
+            value = bytes.fromhex(value[2:] if value[:2] == "0x" else value)
+
+        if len(value) != self.size:
+            raise ValueError(f"Expected {self.size} bytes, got {len(value)}.")
+
+        start = offset + self.start
+        buf[start : start + self.size] = value
+
+    def decode(self, data: memoryview, offset: int) -> Any:
+        word = _read_word(data, offset)
+        if self.start:
+            padding, value = word[: self.start], word[self.start :]
+        else:
+            value, padding = word[: self.size], word[self.size :]
+
+        if padding != self.padding:
+            raise ValueError(f"Non-zero padding for {self.size}-byte value.")
+
+        return self.factory(value)
+
+
+class _DynamicCodec(_Codec):
+    dynamic: ClassVar[bool] = True
+
+    @abstractmethod
+    def prepare(self, value: Any) -> tuple[Any, int]:
+        """
+        Returns the value to pass to :meth:`encode` and its encoded size.
+        """
+
+
+class _BytesCodec(_DynamicCodec):
+    def __init__(self, factory: Callable[[memoryview], Any]):
+        self.factory = factory
+
+    def prepare(self, value: Any) -> tuple[Any, int]:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+
+        return value, WORD_SIZE + _ceil32(len(value))
+
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        size = len(value)
+        buf[offset : offset + WORD_SIZE] = size.to_bytes(WORD_SIZE, "big")
+        buf[offset + WORD_SIZE : offset + WORD_SIZE + size] = value
+
+    def decode(self, data: memoryview, offset: int) -> Any:
+        start = _read_offset(data, offset) + WORD_SIZE
+        end = start + _read_length(data, start - WORD_SIZE)
+        if end > len(data):
+            raise ValueError("Dynamic value extends past the end of the data.")
+
+        return self.factory(data[start:end])
+
+
+class _ArrayCodec(_DynamicCodec):
+    def __init__(self, item: _Codec):
+        self.item = item
+
+    def prepare(self, value: Any) -> tuple[Any, int]:
+        return value, WORD_SIZE * (len(value) + 1)
+
+    def encode(self, buf: bytearray, offset: int, value: Any):
+        buf[offset : offset + WORD_SIZE] = len(value).to_bytes(WORD_SIZE, "big")
+        encode_item = self.item.encode
+        for item in value:
+            offset += WORD_SIZE
+            encode_item(buf, offset, item)
+
+    def decode(self, data: memoryview, offset: int) -> list:
+        start = _read_offset(data, offset) + WORD_SIZE
+        length = _read_length(data, start - WORD_SIZE)
+        if start + length * WORD_SIZE > len(data):
+            raise ValueError("Array extends past the end of the data.")
+
+        decode_item = self.item.decode
+        return [decode_item(data, start + i * WORD_SIZE) for i in range(length)]
+
+
+class _Layout:
+    def __init__(self, fields: list[tuple[str, _Codec]]):
+        self.fields = fields
+        self.head_size = WORD_SIZE * len(fields)
+        self.has_dynamic = any(c.dynamic for _, c in fields)
+
+
+_LAYOUTS: "WeakKeyDictionary[type, _Layout]" = WeakKeyDictionary()
+
+
+def encode_abi(model: "BaseModel") -> bytes:
+    """
+    ABI-encode the fields of a model, in order, like the arguments of a
+    function call.
+
+    Args:
+        model (BaseModel): A model whose fields are all ABI-compatible types,
+          such as ``abi.uint256``, ``abi.address``, ``abi.bytes32``,
+          ``abi.bytes``, ``abi.string`` or ``list[abi.uint256]``.
+
+    Returns:
+        bytes: The encoded data.
+    """
+    layout = get_layout(type(model))
+    fields = layout.fields
+
+    if not layout.has_dynamic:
+        buf = bytearray(layout.head_size)
+        for index, (name, codec) in enumerate(fields):
+            codec.encode(buf, index * WORD_SIZE, getattr(model, name))
+
+        return bytes(buf)
+
+    # Size every dynamic value first so the buffer is only allocated once.
+    values = []
+    sizes = []
+    total = layout.head_size
+    for name, codec in fields:
+        value = getattr(model, name)
+        if isinstance(codec, _DynamicCodec):
+            value, size = codec.prepare(value)
+            sizes.append(size)
+            total += size
+
+        values.append(value)
+
+    buf = bytearray(total)
+    tail_offset = layout.head_size
+    tail_sizes = iter(sizes)
+    for index, ((_, codec), value) in enumerate(zip(fields, values)):
+        head_offset = index * WORD_SIZE
+        if codec.dynamic:
+            buf[head_offset : head_offset + WORD_SIZE] = tail_offset.to_bytes(WORD_SIZE, "big")
+            codec.encode(buf, tail_offset, value)
+            tail_offset += next(tail_sizes)
+        else:
+            codec.encode(buf, head_offset, value)
+
+    return bytes(buf)
+
+
+def decode_abi(model_cls: type[_ModelT], data: bytes | bytearray | memoryview | str) -> _ModelT:
+    """
+    Decode ABI-encoded data (e.g. ``eth_call`` return data or log ``data``)
+    into a model. The values are built straight from the 32-byte words; once
+    the word-level checks (ranges, padding, bounds) pass, the model is
+    constructed without re-running the per-field validators.
+
+    Args:
+        model_cls (type[BaseModel]): A model whose fields are all ABI-compatible
+          types (see :func:`encode_abi`).
+        data (bytes | bytearray | memoryview | str): The encoded data, as raw
+          bytes or a hex string.
+
+    Returns:
+        BaseModel: The decoded model.
+    """
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data[:2] == "0x" else data)
+
+    layout = get_layout(model_cls)
+    view = memoryview(data).cast("B")
+    if len(view) < layout.head_size:
+        raise ValueError(
+            f"Expected at least {layout.head_size} bytes of ABI data, got {len(view)}."
+        )
+
+    values = {
+        name: codec.decode(view, index * WORD_SIZE)
+        for index, (name, codec) in enumerate(layout.fields)
+    }
+    return model_cls.model_construct(**values)
+
+
+def get_layout(model_cls: type["BaseModel"]) -> _Layout:
+    try:
+        return _LAYOUTS[model_cls]
+    except KeyError:
+        pass
+
+    fields = [(name, _get_codec(f.annotation)) for name, f in model_cls.model_fields.items()]
+    layout = _LAYOUTS[model_cls] = _Layout(fields)
+    return layout
+
+
+def _get_codec(annotation: Any) -> _Codec:
+    if get_origin(annotation) is list:
+        (item_type,) = get_args(annotation)
+        item = _get_codec(item_type)
+        if item.dynamic:
+            raise TypeError(f"Arrays of dynamic types are not supported: {annotation}.")
+
+        return _ArrayCodec(item)
+
+    elif annotation is abi.address or annotation is abi.bool or annotation is abi.bytes:
+        annotation = annotation.__value__
+
+    elif annotation is abi.string:
+        annotation = str
+
+    elif int_codec := _get_int_codec(annotation):
+        return int_codec
+
+    if not isinstance(annotation, type):
+        raise TypeError(f"Unsupported ABI field type: {annotation}.")
+
+    elif issubclass(annotation, bool):
+        return _BoolCodec()
+
+    elif issubclass(annotation, Address):
+        return _FixedBytesCodec(20, annotation.from_valid_bytes, left_pad=True)
+
+    elif issubclass(annotation, (BoundHexBytes, BoundHexStr)) and annotation.size <= WORD_SIZE:
+        return _FixedBytesCodec(annotation.size, annotation.from_valid_bytes)
+
+    elif issubclass(annotation, BoundHexInt) and annotation.size <= WORD_SIZE:
+        bits = annotation.size * 8
+        return _IntCodec(bits) if annotation.signed else _UIntCodec(bits)
+
+    elif issubclass(annotation, bytes):
+        return _BytesCodec(_bytes_factory(annotation))
+
+    elif issubclass(annotation, str):
+        return _BytesCodec(_to_str)
+
+    raise TypeError(f"Unsupported ABI field type: {annotation}.")
+
+
+def _get_int_codec(annotation: Any) -> _Codec | None:
+    # Only the ``abi.intN`` / ``abi.uintN`` aliases themselves carry a known width.
+    name = getattr(annotation, "__name__", "")
+    if not (match := _INT_TYPE_NAME.fullmatch(name)) or getattr(abi, name, None) is not annotation:
+        return None
+
+    unsigned, bits = match.groups()
+    return _UIntCodec(int(bits)) if unsigned else _IntCodec(int(bits))
+
+
+def _bytes_factory(cls: type[bytes]) -> Callable[[Any], bytes]:
+    # NOTE: ``bytes.__new__`` copies the buffer once, skipping ``HexBytes`` conversion.
+    return cls if cls is bytes else lambda value: bytes.__new__(cls, value)
+
+
+def _to_str(value: memoryview) -> str:
+    return str(value, "utf-8")
+
+
+def _read_word(data: memoryview, offset: int) -> memoryview:
+    word = data[offset : offset + WORD_SIZE]
+    if len(word) != WORD_SIZE:
+        raise ValueError("Unexpected end of ABI data.")
+
+    return word
+
+
+def _read_offset(data: memoryview, offset: int) -> int:
+    value = int.from_bytes(_read_word(data, offset), "big")
+    if value + WORD_SIZE > len(data):
+        raise ValueError(f"Offset {value} is out of bounds.")
+
+    return value
+
+
+def _read_length(data: memoryview, offset: int) -> int:
+    return int.from_bytes(_read_word(data, offset), "big")
+
+
+def _ceil32(size: int) -> int:
+    return size + (-size % WORD_SIZE)
@@ -1,5 +1,8 @@
 from typing import ClassVar
 
+from eth_pydantic_types.serializers import SerializationMode
+from eth_pydantic_types.utils import InternPool
+
 schema_pattern = "^0x([0-9a-f][0-9a-f])*$"
 schema_examples = (
     "0x",  # empty bytes
@@ -13,9 +16,28 @@ schema_examples = (
 
 
 class BaseHex:
+    # NOTE: Every class in the hierarchy declares ``__slots__`` so that
+    #   instances of the (builtin-based) subclasses carry no ``__dict__``.
+    __slots__ = ()
+
     size: ClassVar[int] = 0
     schema_pattern: ClassVar[str] = schema_pattern
     schema_examples: ClassVar[tuple[str, ...]] = schema_examples
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.HEX
+    # Set to an ``InternPool`` to have equal validated values share one instance.
+    # NOTE: str and int based types pool the exact ``str`` / ``int`` value,
+    #   as pydantic stores those (rather than the subclass) on models.
+    intern_pool: ClassVar[InternPool | None] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Compute the schema metadata once, when the (sized) class is defined,
+        # so that validating values never has to mutate the class.
+        cls.update_schema()
+
+    @classmethod
+    def update_schema(cls):
+        pass  # Override.
 
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
+from hexbytes._utils import to_bytes
 from hexbytes.main import HexBytes as BaseHexBytes
 from pydantic_core.core_schema import (
     ValidationInfo,
@@ -7,8 +8,10 @@ from pydantic_core.core_schema import (
     with_info_before_validator_function,
 )
 
+import eth_pydantic_types.instrumentation as instrumentation
+from eth_pydantic_types._error import HexValueError
 from eth_pydantic_types.hex.base import BaseHex
-from eth_pydantic_types.serializers import hex_serializer
+from eth_pydantic_types.serializers import create_hex_serializer
 from eth_pydantic_types.utils import (
     PadDirection,
     get_hash_examples,
@@ -28,12 +31,15 @@ class HexBytes(BaseHexBytes, BaseHex):
     """
     Use when receiving ``hexbytes.HexBytes`` values. Includes
     a pydantic validator and serializer.
+
+    **NOTE**: Unlike the other hex types, instances carry a ``__dict__``,
+    as ``hexbytes.HexBytes`` does not declare ``__slots__``.
     """
 
     @classmethod
     def __get_pydantic_core_schema__(cls: type[HexBytesSelf], value, handle=None) -> "CoreSchema":
         schema = with_info_before_validator_function(cls.__eth_pydantic_validate__, bytes_schema())
-        schema["serialization"] = hex_serializer
+        schema["serialization"] = create_hex_serializer(mode=cls.serialization_mode)
         return schema
 
     @classmethod
@@ -48,10 +54,37 @@ class HexBytes(BaseHexBytes, BaseHex):
         info: ValidationInfo | None = None,
         **kwargs,
     ) -> HexBytesSelf:
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
+
+        if type(value) is cls and (not cls.size or len(value) == cls.size):
+            # Already validated.
+            return value
+
         if not (pad := kwargs.pop("pad", None)):
             pad = PadDirection.LEFT if isinstance(value, int) else PadDirection.RIGHT
 
-        return cls(cls.validate_size(HexBytes(value), pad_direction=pad))
+        if isinstance(value, (str, int)):
+            if instrumentation.collector is not None:
+                instrumentation.collector.event("coerce.to_bytes")
+
+            value = to_bytes(value)
+        elif not isinstance(value, (bytes, bytearray, memoryview)):
+            # Reject other kinds of input before any conversion work.
+            raise HexValueError(value)
+        elif isinstance(value, memoryview) and (value.ndim != 1 or value.itemsize != 1):
+            value = bytes(value)
+
+        if cls.size and len(value) != cls.size and not isinstance(value, bytes):
+            # Padding or trimming is needed, which requires the bytes API.
+            value = bytes(value)
+
+        # NOTE: Use ``bytes.__new__`` directly so the buffer is copied exactly once;
+        #   ``HexBytes.__new__`` would convert (and copy) the value again.
+        result = bytes.__new__(cls, cls.validate_size(value, pad_direction=pad))
+        return result if cls.intern_pool is None else cls.intern_pool.intern(result)
 
     @classmethod
     def validate_size(
@@ -59,6 +92,22 @@ class HexBytes(BaseHexBytes, BaseHex):
     ) -> bytes:
         return value
 
+    @classmethod
+    def from_valid_bytes(cls: type[HexBytesSelf], data: bytes | memoryview) -> HexBytesSelf:
+        """
+        Create a value from the raw bytes of an already-validated one, e.g. read
+        back from a buffer or an Arrow array, without validating it again.
+        """
+        # perf: The data is already the right size; skip ``HexBytes.__new__``.
+        return bytes.__new__(cls, data)
+
+    @classmethod
+    def to_raw_bytes(cls, value: bytes) -> bytes:
+        """
+        The raw bytes of a validated value.
+        """
+        return value
+
 
 class BoundHexBytes(HexBytes):
     """
@@ -74,17 +123,20 @@ class BoundHexBytes(HexBytes):
             cls.__eth_pydantic_validate__,
             bytes_schema(max_length=cls.size, min_length=cls.size),
         )
-        schema["serialization"] = hex_serializer
+        schema["serialization"] = create_hex_serializer(mode=cls.serialization_mode)
         return schema
 
     @classmethod
     def validate_size(
         cls: type[HexBytesSelf], value: bytes, pad_direction: PadDirection = PadDirection.LEFT
     ) -> bytes:
+        return validate_bytes_size(value, cls.size, pad_direction=pad_direction)
+
+    @classmethod
+    def update_schema(cls):
         str_size = cls.size * 2
         cls.schema_pattern = get_hash_pattern(str_size)
         cls.schema_examples = get_hash_examples(str_size)
-        return validate_bytes_size(value, cls.size, pad_direction=pad_direction)
 
 
 class HexBytes20(BoundHexBytes):
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
 
 from pydantic_core.core_schema import (
     ValidationInfo,
@@ -7,15 +7,16 @@ from pydantic_core.core_schema import (
     with_info_before_validator_function,
 )
 
-from eth_pydantic_types._error import HexValueError
+import eth_pydantic_types.instrumentation as instrumentation
+from eth_pydantic_types._error import HexValueError, SizeError
 from eth_pydantic_types.hex.base import BaseHex
-from eth_pydantic_types.serializers import create_hex_serializer, hex_serializer
+from eth_pydantic_types.serializers import create_hex_serializer
 from eth_pydantic_types.utils import (
     PadDirection,
     get_hash_examples,
     get_hash_pattern,
-    validate_hex_str,
-    validate_int_size,
+    get_int_bounds,
+    parse_hex_int,
 )
 
 if TYPE_CHECKING:
@@ -23,7 +24,12 @@ if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
 
+HexIntSelf = TypeVar("HexIntSelf", bound="BoundHexInt")
+
+
 class BaseHexInt(int, BaseHex):
+    __slots__ = ()
+
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None):
         return no_info_before_validator_function(cls.__eth_pydantic_validate__, int_schema())
@@ -33,8 +39,10 @@ class BaseHexInt(int, BaseHex):
         return value  # Override.
 
     @classmethod
-    def from_bytes(cls, data, byteorder: str = "big", signed: bool = False) -> "BaseHexInt":
-        int_value = int.from_bytes(data, byteorder="big", signed=signed)
+    def from_bytes(
+        cls, data, byteorder: Literal["big", "little"] = "big", signed: bool = False
+    ) -> "BaseHexInt":
+        int_value = int.from_bytes(data, byteorder=byteorder, signed=signed)
         return cls(int_value)
 
     @classmethod
@@ -43,10 +51,16 @@ class BaseHexInt(int, BaseHex):
             return cls(data)
 
         elif isinstance(data, bytes):
+            if instrumentation.collector is not None:
+                instrumentation.collector.event("coerce.bytes_to_int")
+
             return cls.from_bytes(data)
 
         elif isinstance(data, str):
-            return cls(int(validate_hex_str(data), 16))
+            if instrumentation.collector is not None:
+                instrumentation.collector.event("coerce.hex_to_int")
+
+            return cls(parse_hex_int(data))
 
         raise HexValueError(data)
 
@@ -57,34 +71,60 @@ class BaseHexInt(int, BaseHex):
 class HexInt(BaseHexInt):
     """A hex int value."""
 
+    __slots__ = ()
+
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
         schema = with_info_before_validator_function(cls.__eth_pydantic_validate__, int_schema())
-        schema["serialization"] = hex_serializer
+        schema["serialization"] = create_hex_serializer(mode=cls.serialization_mode)
         return schema
 
     @classmethod
     def __eth_pydantic_validate__(
         cls, value: Any, info: ValidationInfo | None = None, **kwargs
     ) -> int:
-        return cls(cls.validate_hex(value))
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
+
+        result = cls.validate_hex(value)
+        return result if cls.intern_pool is None else cls.intern_pool.intern(int(result))
+
+    @classmethod
+    def from_valid_bytes(cls, data: bytes | memoryview) -> "HexInt":
+        """
+        Create a value from the raw (big-endian, two's complement) bytes of an
+        already-validated one, e.g. read back from an Arrow array.
+        """
+        return cls(int.from_bytes(data, "big", signed=True))
+
+    @classmethod
+    def to_raw_bytes(cls, value: int) -> bytes:
+        """
+        The raw bytes of a validated value: as few as hold it, big-endian and
+        two's complement (so negative values survive).
+        """
+        return value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
 
 
 class BoundHexInt(BaseHexInt):
     """A hex string value, that is required to be a specific size."""
 
+    __slots__ = ()
+
     size: ClassVar[int] = 32
     signed: ClassVar[bool] = False
+    # The (inclusive) min and max values, computed once per class.
+    bounds: ClassVar[tuple[int, int]] = get_int_bounds(32, False)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.bounds = get_int_bounds(cls.size, cls.signed)
 
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
-        if cls.signed:
-            min_int = -(2 ** (8 * cls.size - 1))
-            max_int = 2 ** (8 * cls.size - 1) - 1
-        else:
-            min_int = 0
-            max_int = 2 ** (8 * cls.size) - 1
-
+        min_int, max_int = cls.bounds
         schema = with_info_before_validator_function(
             cls.__eth_pydantic_validate__,
             int_schema(le=max_int, ge=min_int),
@@ -92,7 +132,10 @@ class BoundHexInt(BaseHexInt):
 
         # NOTE: Integers should always pad left; else the value increases.
         schema["serialization"] = create_hex_serializer(
-            size=cls.size, pad=PadDirection.LEFT, force_even_length=False
+            size=cls.size,
+            pad=PadDirection.LEFT,
+            force_even_length=False,
+            mode=cls.serialization_mode,
         )
 
         return schema
@@ -101,14 +144,38 @@ class BoundHexInt(BaseHexInt):
     def __eth_pydantic_validate__(
         cls, value: Any, info: ValidationInfo | None = None, **kwargs
     ) -> int:
-        hex_int = cls.validate_hex(value)
-        sized_value = cls.validate_size(hex_int)
-        return cls(sized_value)
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
+
+        # NOTE: ``validate_hex()`` already returns an instance of this class.
+        result = cls.validate_size(cls.validate_hex(value))
+        return result if cls.intern_pool is None else cls.intern_pool.intern(int(result))
 
     @classmethod
     def validate_size(cls, value: int) -> int:
-        cls.update_schema()
-        return validate_int_size(value, cls.size, cls.signed)
+        min_value, max_value = cls.bounds
+        if min_value <= value <= max_value:
+            return value
+
+        raise SizeError(cls.size, value)
+
+    @classmethod
+    def from_valid_bytes(cls: type[HexIntSelf], data: bytes | memoryview) -> HexIntSelf:
+        """
+        Create a value from the raw (big-endian) bytes of an already-validated
+        one, e.g. read back from a buffer or an Arrow array, without validating
+        it again.
+        """
+        return cls(int.from_bytes(data, "big", signed=cls.signed))
+
+    @classmethod
+    def to_raw_bytes(cls, value: int) -> bytes:
+        """
+        The raw (``size``, big-endian) bytes of a validated value.
+        """
+        return value.to_bytes(cls.size, "big", signed=cls.signed)
 
     @classmethod
     def update_schema(cls):
@@ -118,6 +185,8 @@ class BoundHexInt(BaseHexInt):
 
 
 class HexInt32(BoundHexInt):
+    __slots__ = ()
+
     size: ClassVar[int] = 32
 
 
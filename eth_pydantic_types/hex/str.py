@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from hexbytes.main import HexBytes as BaseHexBytes
 from pydantic_core.core_schema import (
     ValidationInfo,
     no_info_before_validator_function,
@@ -8,13 +7,13 @@ from pydantic_core.core_schema import (
     with_info_before_validator_function,
 )
 
-from eth_pydantic_types._error import HexValueError
+import eth_pydantic_types.instrumentation as instrumentation
 from eth_pydantic_types.hex.base import BaseHex
 from eth_pydantic_types.utils import (
     PadDirection,
     get_hash_examples,
     get_hash_pattern,
-    validate_hex_str,
+    normalize_hex,
     validate_str_size,
 )
 
@@ -24,6 +23,8 @@ if TYPE_CHECKING:
 
 
 class BaseHexStr(str, BaseHex):
+    __slots__ = ()
+
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None):
         return no_info_before_validator_function(cls.__eth_pydantic_validate__, str_schema())
@@ -40,20 +41,8 @@ class BaseHexStr(str, BaseHex):
 
     @classmethod
     def validate_hex(cls, data: bytes | str | int, prefixed: bool = True):
-        if isinstance(data, bytes):
-            result = cls.from_bytes(data)
-        elif isinstance(data, str):
-            result = cls(validate_hex_str(data))
-        elif isinstance(data, int):
-            hex_value = BaseHexBytes(data).hex()
-            result = cls(hex_value if hex_value.startswith("0x") else f"0x{hex_value}")
-        else:
-            raise HexValueError(data)
-
-        if not prefixed and result.startswith("0x"):
-            return result[2:]
-
-        return result
+        hex_str = normalize_hex(data)
+        return cls(hex_str) if prefixed else hex_str[2:]
 
     def __int__(self) -> int:
         return int(self, 16)
@@ -65,6 +54,8 @@ class BaseHexStr(str, BaseHex):
 class HexStr(BaseHexStr):
     """A hex string value."""
 
+    __slots__ = ()
+
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
         return with_info_before_validator_function(
@@ -76,9 +67,13 @@ class HexStr(BaseHexStr):
     def __eth_pydantic_validate__(
         cls, value: Any, info: ValidationInfo | None = None, **kwargs
     ) -> str:
-        hex_str = cls.validate_hex(value)
-        hex_value = hex_str[2:] if hex_str.startswith("0x") else hex_str
-        return cls(f"0x{hex_value}")
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
+
+        result = cls(normalize_hex(value))
+        return result if cls.intern_pool is None else cls.intern_pool.intern(str(result))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "HexStr":
@@ -90,6 +85,8 @@ class HexStr(BaseHexStr):
 class BoundHexStr(BaseHexStr):
     """A hex string value, that is required to be a specific size."""
 
+    __slots__ = ()
+
     size: ClassVar[int] = 32
 
     @classmethod
@@ -104,21 +101,39 @@ class BoundHexStr(BaseHexStr):
     def __eth_pydantic_validate__(
         cls, value: Any, info: ValidationInfo | None = None, **kwargs
     ) -> str:
+        if instrumentation.collector is not None and not kwargs.pop("recorded", False):
+            return instrumentation.collector.record(
+                cls.__eth_pydantic_validate__, cls, value, info, kwargs
+            )
+
         if not (pad := kwargs.pop("pad", None)):
             # Integers are always padded to the left, but bytes-types are padded to the right
             # to be ABI-encode compliant.
             pad = PadDirection.LEFT if isinstance(value, int) else PadDirection.RIGHT
 
-        prefixed = kwargs.pop("prefixed", True)
-        hex_str = cls.validate_hex(value, prefixed=False)
-        sized_value = cls.validate_size(hex_str, pad_direction=pad)
-        return cls(f"0x{sized_value}") if prefixed else cls(sized_value)
+        hex_str = normalize_hex(value, cls.size, pad_direction=pad)
+        result = cls(hex_str) if kwargs.pop("prefixed", True) else cls(hex_str[2:])
+        return result if cls.intern_pool is None else cls.intern_pool.intern(str(result))
 
     @classmethod
     def validate_size(cls, value: str, pad_direction: PadDirection = PadDirection.LEFT) -> str:
-        cls.update_schema()
         return validate_str_size(value, cls.size * 2, pad_direction=pad_direction)
 
+    @classmethod
+    def from_valid_bytes(cls, data: bytes | memoryview) -> str:
+        """
+        Create a value from the raw bytes of an already-validated one, e.g. read
+        back from a buffer or an Arrow array, without validating it again.
+        """
+        return cls(f"0x{data.hex()}")
+
+    @classmethod
+    def to_raw_bytes(cls, value: str) -> bytes:
+        """
+        The raw (``size``) bytes of a validated value.
+        """
+        return bytes.fromhex(value[2:])
+
     @classmethod
     def update_schema(cls):
         str_size = cls.size * 2
@@ -127,6 +142,8 @@ class BoundHexStr(BaseHexStr):
 
 
 class HexStr20(BoundHexStr):
+    __slots__ = ()
+
     size: ClassVar[int] = 20
 
 
@@ -0,0 +1,160 @@
+"""
+Opt-in instrumentation of the validators: per-type call counts, cumulative
+time, input-kind histograms and coercion (slow-path) events.
+
+Usage example::
+
+    from eth_pydantic_types import instrumentation
+
+    with instrumentation.collect() as collector:
+        MyModel.model_validate(data)
+
+    collector.snapshot()
+    # {"Address": {"calls": 1, "time_ns": ..., "kinds": {"str": 1},
+    #              "events": {"checksum": 1}}, ...}
+
+**NOTE**: When disabled (the default), the only cost is a single ``None``
+check at the start of each validator.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# The active collector, if any. Validators check this before recording anything.
+collector: "Collector | None" = None
+
+
+class _TypeStats:
+    __slots__ = ("calls", "time_ns", "kinds", "events")
+
+    def __init__(self):
+        self.calls = 0
+        self.time_ns = 0
+        self.kinds: Counter = Counter()
+        self.events: Counter = Counter()
+
+
+class Collector:
+    """
+    Collects statistics for every validation while it is the active collector.
+
+    **NOTE**: Collectors may be shared by many threads; updates to the
+    statistics take a lock (only while collecting, never when disabled).
+    """
+
+    def __init__(self):
+        self._stats: defaultdict[str, _TypeStats] = defaultdict(_TypeStats)
+        self._lock = threading.Lock()
+        # The type being validated, per thread, so events can be attributed to it.
+        self._local = threading.local()
+
+    def record(
+        self, validate: Callable, cls: type, value: Any, info: Any, kwargs: dict[str, Any]
+    ) -> Any:
+        """
+        Run (and record) a validation. ``validate`` is called with ``recorded=True``
+        so the validator knows not to record itself again.
+        """
+        kind = get_input_kind(value, cls)
+        with self._lock:
+            stats = self._stats[cls.__name__]
+            stats.calls += 1
+            stats.kinds[kind] += 1
+
+        previous = getattr(self._local, "current", None)
+        self._local.current = stats
+        start = time.perf_counter_ns()
+        try:
+            return validate(value, info, recorded=True, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            self._local.current = previous
+            with self._lock:
+                stats.time_ns += elapsed
+
+    def event(self, name: str):
+        """
+        Record a coercion event for the type currently being validated.
+        """
+        if (stats := getattr(self._local, "current", None)) is not None:
+            with self._lock:
+                stats.events[name] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        The statistics so far, per type name.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "time_ns": stats.time_ns,
+                    "kinds": dict(stats.kinds),
+                    "events": dict(stats.events),
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def get_input_kind(value: Any, cls: type) -> str:
+    if isinstance(value, cls):
+        return "instance"
+
+    elif isinstance(value, str):
+        return "str"
+
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return "bytes"
+
+    elif isinstance(value, int):
+        return "int"
+
+    return type(value).__name__
+
+
+def enable() -> Collector:
+    """
+    Start collecting into a new collector, which stays active until :func:`disable`.
+    """
+    global collector
+    collector = Collector()
+    return collector
+
+
+def disable():
+    global collector
+    collector = None
+
+
+def is_enabled() -> bool:
+    return collector is not None
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """
+    The statistics of the active collector (empty when disabled).
+    """
+    return {} if collector is None else collector.snapshot()
+
+
+@contextmanager
+def collect() -> Iterator[Collector]:
+    """
+    Collect into a new collector for the duration of the block. Whatever
+    collector was active before (if any) is restored afterwards.
+    """
+    global collector
+    previous = collector
+    collector = Collector()
+    try:
+        yield collector
+    finally:
+        collector = previous
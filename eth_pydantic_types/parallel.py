@@ -0,0 +1,202 @@
+"""
+Bulk validation of raw values across a pool of processes.
+
+Usage example::
+
+    from eth_pydantic_types import HexBytes32
+    from eth_pydantic_types.parallel import validate_parallel
+
+    values, errors = validate_parallel(HexBytes32, raw_hashes, workers=8)
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, NamedTuple
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex.bytes import BoundHexBytes
+from eth_pydantic_types.hex.int import BoundHexInt
+from eth_pydantic_types.hex.str import BoundHexStr
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class ParallelResult(NamedTuple):
+    values: list[Any]
+    """The validated values, in input order (``None`` where validation failed)."""
+
+    errors: dict[int, Exception]
+    """The validation error of each failed item, by its index in the input."""
+
+
+def validate_parallel(
+    type_: type,
+    values: Iterable[Any],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> ParallelResult:
+    """
+    Validate many raw values with ``type_.__eth_pydantic_validate__``, in
+    chunks spread over a pool of worker processes.
+
+    Fixed-width results (``HexBytes20``, ``HexBytes32``, ``Address``,
+    ``HexStr32``, ``HexInt32``, ...) come back from the workers through one
+    shared-memory block per chunk rather than being pickled one by one.
+    Failed items do not abort the batch; their errors are returned instead.
+
+    **NOTE**: Workers do not use the types' ``intern_pool``.
+
+    Args:
+        type_ (type): An eth-pydantic-types type, e.g. ``HexBytes32``.
+        values (Iterable[Any]): The raw values. Only ``2 * workers`` chunks
+          are in flight at a time, so this may be a (large) iterator.
+        workers (int | None): The number of processes. Defaults to the
+          number of CPUs. Ignored when given an ``executor``.
+        chunk_size (int): The number of values each task validates.
+        executor (Executor | None): A (process pool) executor to reuse across
+          calls. By default, a new pool is started (and shut down) per call.
+
+    Returns:
+        :class:`~eth_pydantic_types.parallel.ParallelResult`: The values in
+        input order and the errors by index.
+    """
+    if not hasattr(type_, "__eth_pydantic_validate__"):
+        raise TypeError(f"Unsupported type '{type_}'.")
+
+    elif chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    workers = workers or os.cpu_count() or 1
+    if executor is not None:
+        return _validate_chunks(executor, type_, values, chunk_size, workers * 2)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _validate_chunks(pool, type_, values, chunk_size, workers * 2)
+
+
+def _validate_chunks(
+    executor: Executor, type_: type, values: Iterable[Any], chunk_size: int, max_pending: int
+) -> ParallelResult:
+    width = _get_width(type_)
+    result = ParallelResult([], {})
+    pending: deque[tuple[Future, SharedMemory | None, int]] = deque()
+    try:
+        for chunk in _iter_chunks(values, chunk_size):
+            memory = None if width is None else SharedMemory(create=True, size=len(chunk) * width)
+            name = None if memory is None else memory.name
+            future = executor.submit(_validate_chunk, type_, chunk, name, width)
+            pending.append((future, memory, len(chunk)))
+            if len(pending) >= max_pending:
+                _collect(result, type_, width, *pending.popleft())
+
+        while pending:
+            _collect(result, type_, width, *pending.popleft())
+
+    finally:
+        # Release any shared memory left over after an error.
+        for future, memory, _ in pending:
+            future.cancel()
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+
+    return result
+
+
+def _collect(
+    result: ParallelResult,
+    type_: type,
+    width: int | None,
+    future: Future,
+    memory: SharedMemory | None,
+    count: int,
+):
+    offset = len(result.values)
+    try:
+        values, errors = future.result()
+        if memory is not None and width:
+            decode = _get_decoder(type_)
+            data = bytes(memory.buf[: count * width])  # type: ignore[index]
+            values = [
+                None if index in errors else decode(data[start : start + width])
+                for index, start in enumerate(range(0, count * width, width))
+            ]
+
+    finally:
+        if memory is not None:
+            memory.close()
+            memory.unlink()
+
+    result.values.extend(values)
+    result.errors.update((offset + index, error) for index, error in errors.items())
+
+
+def _validate_chunk(
+    type_: type, chunk: list[Any], name: str | None, width: int | None
+) -> tuple[list[Any], dict[int, Exception]]:
+    # NOTE: Runs in the worker processes.
+    validate = type_.__eth_pydantic_validate__  # type: ignore[attr-defined]
+    errors: dict[int, Exception] = {}
+    results: list[Any] = []
+    for index, value in enumerate(chunk):
+        try:
+            results.append(validate(value))
+        except (ValueError, TypeError) as err:
+            errors[index] = err
+            results.append(None)
+
+    if name is None or not width:
+        return results, errors
+
+    encode = _get_encoder(type_)
+    # perf: Write the whole chunk at once; failed items are left as zeroes.
+    empty = bytes(width)
+    data = b"".join(empty if result is None else encode(result) for result in results)
+    memory = SharedMemory(name=name)
+    try:
+        memory.buf[: len(data)] = data  # type: ignore[index]
+    finally:
+        memory.close()
+
+    # The values themselves are in the shared memory.
+    return [], errors
+
+
+def _iter_chunks(values: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _get_width(type_: type) -> int | None:
+    # The number of bytes each (valid) result takes in shared memory, if fixed.
+    if issubclass(type_, Address):
+        # The checksummed hex digits, as ASCII.
+        return type_.size * 2
+
+    elif issubclass(type_, (BoundHexBytes, BoundHexStr, BoundHexInt)):
+        return type_.size
+
+    return None
+
+
+def _get_encoder(type_: type) -> Callable[[Any], bytes]:
+    if issubclass(type_, Address):
+        return lambda value: value[2:].encode("ascii")
+
+    return type_.to_raw_bytes  # type: ignore[attr-defined]
+
+
+def _get_decoder(type_: type) -> Callable[[bytes], Any]:
+    # NOTE: Results are rebuilt, without validating them again, as the same
+    #   types the validators return.
+    if issubclass(type_, Address):
+        # perf: Addresses are passed checksummed, so they are not checksummed again.
+        return lambda data: f"0x{data.decode('ascii')}"
+
+    return type_.from_valid_bytes  # type: ignore[attr-defined]
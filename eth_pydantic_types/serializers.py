@@ -1,7 +1,33 @@
-from pydantic_core.core_schema import plain_serializer_function_ser_schema
+from collections.abc import Callable
+from enum import Enum
+from functools import cache, partial
+from typing import Any
+
+from pydantic_core.core_schema import SerializationInfo, plain_serializer_function_ser_schema
 
 from eth_pydantic_types.utils import PadDirection, validate_str_size
 
+# The serialization context key used by types in ``SerializationMode.CONTEXT``.
+SERIALIZATION_CONTEXT_KEY = "hex_serialization"
+
+
+class SerializationMode(str, Enum):
+    """
+    How hex types (``HexBytes``, ``HexInt`` and their sized variants) serialize.
+    """
+
+    HEX = "hex"
+    """Always serialize to a ``0x``-prefixed hex str (default)."""
+
+    NATIVE = "native"
+    """Keep the ``bytes`` / ``int`` value in python mode; use hex str only for JSON."""
+
+    CONTEXT = "context"
+    """
+    Decide per call, from the ``"hex_serialization"`` key of the serialization context
+    (e.g. ``model.model_dump(context={"hex_serialization": "native"})``). Defaults to hex.
+    """
+
 
 def serialize_hex(
     value: int | bytes,
@@ -9,13 +35,80 @@ def serialize_hex(
     pad: PadDirection | None = None,
     force_even_length: bool | None = None,
 ) -> str:
-    hex_value = value.hex() if isinstance(value, bytes) else hex(value)
-    hex_value = hex_value[2:] if hex_value.startswith("0x") else hex_value
+    return get_hex_serializer(size=size, pad=pad, force_even_length=force_even_length)(value)
 
+
+@cache
+def get_hex_serializer(
+    size: int | None = None,
+    pad: PadDirection | None = None,
+    force_even_length: bool | None = None,
+) -> Callable[[int | bytes], str]:
+    """
+    Get a hex serializer function specialized for the given signature.
+    The functions are cached, so types with the same signature share one.
+    Uncommon values (e.g. negative or oversized ints) take the general path.
+    """
     if pad is not None and force_even_length is not None:
         # If padding at all and force_even_length not specified, assume True.
         force_even_length = True
 
+    general = partial(_serialize_hex, size=size, pad=pad, force_even_length=force_even_length)
+
+    if size is not None and pad is not None:
+        if pad is not PadDirection.LEFT:
+            return general
+
+        int_format = f"0{size * 2}x"
+        int_limit = 1 << (size * 8)
+
+        def serialize_sized(value: int | bytes) -> str:
+            if isinstance(value, bytes):
+                if len(value) == size:
+                    return f"0x{bytes.hex(value)}"
+
+            elif 0 <= value < int_limit:
+                return f"0x{value:{int_format}}"
+
+            return general(value)
+
+        return serialize_sized
+
+    elif force_even_length:
+
+        def serialize_even(value: int | bytes) -> str:
+            if isinstance(value, bytes):
+                return f"0x{bytes.hex(value)}"
+
+            elif value >= 0:
+                hex_value = f"{value:x}"
+                return f"0x0{hex_value}" if len(hex_value) % 2 else f"0x{hex_value}"
+
+            return general(value)
+
+        return serialize_even
+
+    def serialize(value: int | bytes) -> str:
+        if isinstance(value, bytes):
+            return f"0x{bytes.hex(value)}"
+
+        elif value >= 0:
+            return f"0x{value:x}"
+
+        return general(value)
+
+    return serialize
+
+
+def _serialize_hex(
+    value: int | bytes,
+    size: int | None = None,
+    pad: PadDirection | None = None,
+    force_even_length: bool | None = None,
+) -> str:
+    hex_value = value.hex() if isinstance(value, bytes) else hex(value)
+    hex_value = hex_value[2:] if hex_value.startswith("0x") else hex_value
+
     # Ensure even number of left-padded zeroes.
     if force_even_length and len(hex_value) % 2 != 0:
         hex_value = f"0{hex_value}"
@@ -26,16 +119,37 @@ def serialize_hex(
     return f"0x{hex_value}"
 
 
+@cache
 def create_hex_serializer(
     size: int | None = None,
     pad: PadDirection | None = None,
     force_even_length: bool | None = None,
+    mode: SerializationMode = SerializationMode.HEX,
 ):
-    return plain_serializer_function_ser_schema(
-        function=lambda value: serialize_hex(
-            value, size=size, pad=pad, force_even_length=force_even_length
+    serializer = get_hex_serializer(size=size, pad=pad, force_even_length=force_even_length)
+    if mode is SerializationMode.NATIVE:
+        # perf: Pydantic skips the function entirely in python mode.
+        return plain_serializer_function_ser_schema(function=serializer, when_used="json")
+
+    elif mode is SerializationMode.CONTEXT:
+        return plain_serializer_function_ser_schema(
+            function=partial(_serialize_from_context, serializer=serializer), info_arg=True
         )
-    )
+
+    return plain_serializer_function_ser_schema(function=serializer)
+
+
+def _serialize_from_context(
+    value: int | bytes, info: SerializationInfo, serializer: Callable[[int | bytes], str]
+) -> Any:
+    if (
+        (context := info.context)
+        and context.get(SERIALIZATION_CONTEXT_KEY) == SerializationMode.NATIVE
+        and not info.mode_is_json()
+    ):
+        return value
+
+    return serializer(value)
 
 
 hex_serializer = create_hex_serializer()
@@ -0,0 +1,331 @@
+"""
+Incrementally validate the items of large JSON arrays, such as the ``result``
+of an ``eth_getLogs`` or ``trace_filter`` JSON-RPC response, without loading
+the whole document into memory.
+"""
+
+import asyncio
+import codecs
+import io
+import json
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable, Iterator
+from concurrent.futures import Executor
+from typing import IO, Any
+
+from eth_pydantic_types.adapters import get_adapter
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+# The longest JSON token that is not a string, i.e. how far before the end of
+# the buffer a (non-string) value cut off by it can fail to decode.
+_MAX_TOKEN_SIZE = len("-Infinity")
+
+JSONSource = bytes | bytearray | memoryview | str | IO[bytes] | IO[str]
+
+
+class _Reader:
+    """
+    A text buffer over a (binary or text) file-like object, that only ever
+    holds the unconsumed part of the document plus one read.
+    """
+
+    def __init__(self, source: JSONSource, read_size: int):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            # NOTE: ``BytesIO`` shares the buffer of a ``bytes`` object until written to.
+            source = io.BytesIO(source)
+        elif isinstance(source, str):
+            source = io.StringIO(source)
+
+        self.source = source
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self, min_size: int = 0) -> bool:
+        """
+        Append (at least) one more read to the buffer, dropping the consumed part.
+        Returns ``False`` when the source is exhausted.
+        """
+        if self.eof:
+            return False
+
+        chunk = self.source.read(max(self.read_size, min_size))
+        if isinstance(chunk, (bytes, bytearray)):
+            text = self.decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+
+        self.eof = not chunk
+        self.buffer = f"{self.buffer[self.pos :]}{text}"
+        self.pos = 0
+        return not self.eof or bool(text)
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character (empty at the end).
+        """
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+
+            self.pos = pos
+            if pos < len(buffer) or not self.read_more():
+                return buffer[pos : pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            expected = " or ".join(repr(c) for c in chars)
+            raise ValueError(f"Expecting {expected}, got {char or 'end of data'!r}.")
+
+        self.pos += 1
+        return char
+
+    def decode_value(self) -> Any:
+        """
+        Decode the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            # NOTE: A value ending at the very end of the buffer may be truncated
+            #   (e.g. the number ``12`` of ``123``, or ``1`` of ``1.5``), so only
+            #   accept it once more data (or the end of the source) follows it.
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as err:
+                if self.eof or not _is_truncated(err):
+                    raise
+
+            else:
+                if self.eof or not _may_continue(value, self.buffer, end):
+                    self.pos = end
+                    return value
+
+            # Grow geometrically, so large values do not get re-parsed too many times.
+            self.read_more(min_size=len(self.buffer) - self.pos)
+
+
+def _is_truncated(err: json.JSONDecodeError) -> bool:
+    # Whether decoding may have failed only because the document is cut off,
+    # rather than invalid (which would otherwise read the whole source first).
+    return len(err.doc) - err.pos <= _MAX_TOKEN_SIZE or err.msg == "Unterminated string starting at"
+
+
+def _may_continue(value: Any, buffer: str, end: int) -> bool:
+    # Whether the buffer may end inside a value decoded up to ``end``.
+    if end == len(buffer):
+        return True
+
+    # E.g. ``1.`` or ``1e-``, of which the number pattern only matches ``1``.
+    return isinstance(value, (int, float)) and len(buffer) - end <= 2 and buffer[end] in ".eE"
+
+
+def iter_json_array(
+    source: JSONSource, key: str | None = "result", read_size: int = 65536
+) -> Iterator[Any]:
+    """
+    Iterate over the (decoded, unvalidated) items of a JSON array.
+
+    Args:
+        source (JSONSource): The JSON document, either as bytes, a str or a
+          binary or text file-like object.
+        key (str | None): When the document is an object (e.g. a JSON-RPC
+          response), the key holding the array. Defaults to ``"result"``.
+        read_size (int): The number of bytes (or characters) to read at a time.
+
+    Returns:
+        Iterator[Any]
+    """
+    reader = _Reader(source, read_size)
+    if reader.expect("[{") == "{":
+        _find_key(reader, key)
+        reader.expect("[")
+
+    if reader.peek() == "]":
+        return
+
+    while True:
+        yield reader.decode_value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def _find_key(reader: _Reader, key: str | None):
+    if reader.peek() == "}":
+        raise ValueError(f"Key '{key}' not found.")
+
+    while True:
+        name = reader.decode_value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            return
+
+        value = reader.decode_value()
+        if name == "error":
+            raise ValueError(f"JSON-RPC error: {value}")
+
+        elif name == key:
+            raise ValueError(f"Expecting '{key}' to be an array, got {value!r}.")
+
+        elif reader.expect(",}") == "}":
+            raise ValueError(f"Key '{key}' not found.")
+
+
+def validate_stream(
+    type_: Any,
+    source: JSONSource,
+    key: str | None = "result",
+    chunk_size: int | None = None,
+    read_size: int = 65536,
+) -> Iterator[Any]:
+    """
+    Validate the items of a (large) JSON array one at a time, keeping memory
+    bounded by the size of a single read plus the item (or chunk) in flight.
+
+    Usage example::
+
+        with open("logs.json", "rb") as file:
+            for log in validate_stream(Log, file):
+                ...
+
+    Args:
+        type_ (Any): The type of each item, e.g. a model or ``HexBytes32``.
+        source (JSONSource): The JSON document, either as bytes, a str or a
+          binary or text file-like object.
+        key (str | None): When the document is an object (e.g. a JSON-RPC
+          response), the key holding the array. Defaults to ``"result"``.
+        chunk_size (int | None): When given, yield lists of up to this many
+          validated items instead of single items.
+        read_size (int): The number of bytes (or characters) to read at a time.
+
+    Returns:
+        Iterator[Any]
+    """
+    items = iter_json_array(source, key=key, read_size=read_size)
+    if not chunk_size:
+        validate = get_adapter(type_).validate_python
+        for item in items:
+            yield validate(item)
+
+        return
+
+    validate_chunk = get_adapter(list[type_]).validate_python  # type: ignore[valid-type]
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield validate_chunk(chunk)
+            chunk = []
+
+    if chunk:
+        yield validate_chunk(chunk)
+
+
+async def avalidate_stream(
+    type_: Any,
+    source: AsyncIterable[Any] | Iterable[Any],
+    chunk_size: int = 100,
+    executor: Executor | None = None,
+    max_pending: int = 2,
+) -> AsyncGenerator[Any, None]:
+    """
+    Validate (raw, already decoded) items without blocking the event loop:
+    items are validated in chunks in an executor, while the loop only ever
+    collects and hands out items. A chunk with an invalid item raises its
+    ``ValidationError`` in place of yielding that chunk's items.
+
+    Usage example::
+
+        async for log in avalidate_stream(Log, response["result"]):
+            ...
+
+    Args:
+        type_ (Any): The type of each item, e.g. a model or ``HexBytes32``.
+        source (AsyncIterable[Any] | Iterable[Any]): The raw items.
+        chunk_size (int): The number of items validated per executor call.
+          Smaller chunks hand the GIL back to the event loop more often.
+        executor (Executor | None): The executor to validate in. Defaults to
+          the loop's default (thread pool) executor. Process pools work too,
+          as long as ``type_`` can be pickled.
+        max_pending (int): The number of chunks that may be validated (or
+          waiting to be consumed) at a time. Once reached, the source is not
+          read any further until the consumer catches up.
+
+    Returns:
+        AsyncGenerator[Any, None]
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    elif max_pending < 1:
+        raise ValueError("max_pending must be at least 1.")
+
+    loop = asyncio.get_running_loop()
+    # NOTE: A chunk holds a slot from before it is submitted until the consumer
+    #   has its result, so that at most ``max_pending`` are ever in flight.
+    slots = asyncio.Semaphore(max_pending)
+    # NOTE: A ``None`` marks the end of the source.
+    queue: asyncio.Queue[asyncio.Future | None] = asyncio.Queue()
+
+    async def submit(chunk: list[Any]):
+        await slots.acquire()
+        queue.put_nowait(loop.run_in_executor(executor, _validate_chunk, type_, chunk))
+
+    async def produce():
+        chunk = []
+        async for item in _aiter(source):
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                await submit(chunk)
+                chunk = []
+
+        if chunk:
+            await submit(chunk)
+
+        queue.put_nowait(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            # NOTE: Also wait on the producer, to fail (rather than hang) if reading
+            #   the source fails.
+            await asyncio.wait((getter, producer), return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done() and producer.exception() is not None:
+                getter.cancel()
+                producer.result()  # Raises the error.
+
+            if (future := await getter) is None:
+                break
+
+            try:
+                items = await future
+            finally:
+                slots.release()
+
+            for item in items:
+                yield item
+
+    finally:
+        producer.cancel()
+        while not queue.empty():
+            if (future := queue.get_nowait()) is not None:
+                future.cancel()
+
+
+async def _aiter(source: AsyncIterable[Any] | Iterable[Any]) -> AsyncIterator[Any]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+
+    else:
+        for item in source:
+            yield item
+
+
+def _validate_chunk(type_: Any, chunk: list[Any]) -> list[Any]:
+    # NOTE: Runs in the executor (and so may run in another process).
+    return get_adapter(list[type_]).validate_python(chunk)  # type: ignore[valid-type]
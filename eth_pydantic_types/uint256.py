@@ -0,0 +1,321 @@
+"""
+A compact ``uint256`` column: values stored as four ``uint64`` limbs in a
+NumPy array, with vectorized arithmetic, comparisons and aggregations that do
+not build a Python ``int`` per value. Requires ``numpy``
+(``pip install eth-pydantic-types[numpy]``).
+
+Usage example::
+
+    from eth_pydantic_types.uint256 import UInt256Column
+
+    amounts = UInt256Column.from_values(raw_amounts)  # Validated like ``HexInt32``.
+    total = amounts.sum()
+    large = amounts[amounts > 10**18]
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError as err:
+    raise ImportError(
+        "UInt256Column requires numpy. Install with `pip install eth-pydantic-types[numpy]`."
+    ) from err
+
+from pydantic_core.core_schema import (
+    no_info_plain_validator_function,
+    plain_serializer_function_ser_schema,
+)
+
+from eth_pydantic_types.array import UInt256Array
+from eth_pydantic_types.hex.int import HexInt32
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
+
+LIMBS = 4
+"""The number of 64-bit limbs per value, least significant first."""
+
+MAX_UINT256 = 2**256 - 1
+
+# Sums are accumulated per 32-bit half-limb, in ``uint64``; this many rows
+# can never overflow them.
+_SUM_CHUNK_SIZE = 1 << 32
+_LOW_MASK = np.uint64(0xFFFFFFFF)
+_HALF_SHIFT = np.uint64(32)
+
+
+class UInt256Column:
+    """
+    A column of ``uint256`` values, backed by a ``(n, 4)`` ``uint64`` array
+    (:attr:`limbs`) with the least significant limb first. The array is kept
+    in Fortran (column-major) order, so each limb is contiguous.
+
+    Arithmetic (``+``, ``-``) raises ``OverflowError`` when any value leaves
+    the ``uint256`` range; use :meth:`overflowing_add` and
+    :meth:`overflowing_sub` for wrapping results. Comparisons return NumPy
+    ``bool`` arrays, usable as masks. Operands are other columns of the same
+    length or single ``int`` values.
+    """
+
+    __slots__ = ("limbs",)
+
+    def __init__(self, limbs: Any = None):
+        if limbs is None:
+            limbs = np.zeros((0, LIMBS), dtype=np.uint64)
+
+        limbs = np.asarray(limbs)
+        if limbs.dtype != np.uint64 or limbs.ndim != 2 or limbs.shape[1] != LIMBS:
+            raise ValueError(f"Limbs must be a (n, {LIMBS}) uint64 array.")
+
+        # perf: The kernels work limb by limb; contiguous limbs make them
+        #   several times faster.
+        self.limbs = np.asfortranarray(limbs)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "UInt256Column":
+        """
+        Validate values like ``HexInt32`` (ints, hex strs, bytes).
+        """
+        return cls.from_array(UInt256Array(values))
+
+    @classmethod
+    def from_array(cls, array: UInt256Array) -> "UInt256Column":
+        return cls.from_words(array.buffer)
+
+    @classmethod
+    def from_words(cls, data: bytes | bytearray | memoryview) -> "UInt256Column":
+        """
+        Create a column from concatenated 32-byte big-endian words (e.g. ABI-encoded
+        ``uint256`` values or event data).
+        """
+        if len(data) % 32:
+            raise ValueError("Data size must be a multiple of 32.")
+
+        # Big-endian limbs, most significant first; reversed to native order.
+        words = np.frombuffer(data, dtype=">u8").reshape(-1, LIMBS)
+        return cls(np.asfortranarray(words[:, ::-1], dtype=np.uint64))
+
+    def to_words(self) -> bytes:
+        """
+        The values as concatenated 32-byte big-endian words.
+        """
+        return np.ascontiguousarray(self.limbs[:, ::-1], dtype=">u8").tobytes()
+
+    def to_array(self) -> UInt256Array:
+        return UInt256Array.from_buffer(self.to_words())
+
+    def tolist(self) -> list[HexInt32]:
+        return list(self.to_array())
+
+    def __len__(self) -> int:
+        return len(self.limbs)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            limbs = self.limbs[index]
+            return HexInt32(sum(int(limb) << (64 * i) for i, limb in enumerate(limbs)))
+
+        # Slices, index arrays and masks.
+        return type(self)(self.limbs[index])
+
+    def __iter__(self) -> Iterator[HexInt32]:
+        return iter(self.to_array())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.tolist()!r})"
+
+    def overflowing_add(self, other: Any) -> tuple["UInt256Column", Any]:
+        """
+        Add, wrapping around on overflow.
+
+        Returns:
+            tuple[:class:`~eth_pydantic_types.uint256.UInt256Column`, numpy.ndarray]:
+            The sums (modulo ``2**256``) and a mask of the values that overflowed.
+        """
+        a, b = self.limbs, _get_limbs(other)
+        result = _empty_like(a, b)
+        carry = None
+        for i in range(LIMBS):
+            limb = result[:, i]
+            np.add(a[:, i], b[:, i], out=limb)
+            overflow = limb < a[:, i]
+            if carry is not None:
+                limb += carry
+                overflow |= limb < carry
+
+            carry = overflow
+
+        return type(self)(result), carry
+
+    def overflowing_sub(self, other: Any) -> tuple["UInt256Column", Any]:
+        """
+        Subtract, wrapping around on underflow.
+
+        Returns:
+            tuple[:class:`~eth_pydantic_types.uint256.UInt256Column`, numpy.ndarray]:
+            The differences (modulo ``2**256``) and a mask of the values that
+            underflowed.
+        """
+        a, b = self.limbs, _get_limbs(other)
+        result = _empty_like(a, b)
+        borrow = None
+        for i in range(LIMBS):
+            limb = result[:, i]
+            underflow = a[:, i] < b[:, i]
+            np.subtract(a[:, i], b[:, i], out=limb)
+            if borrow is not None:
+                underflow |= limb < borrow
+                limb -= borrow
+
+            borrow = underflow
+
+        return type(self)(result), borrow
+
+    def __add__(self, other: Any) -> "UInt256Column":
+        result, overflow = self.overflowing_add(other)
+        _check_overflow(overflow, "addition")
+        return result
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> "UInt256Column":
+        result, underflow = self.overflowing_sub(other)
+        _check_overflow(underflow, "subtraction")
+        return result
+
+    def __rsub__(self, other: Any) -> "UInt256Column":
+        return UInt256Column(_get_limbs(other)) - self
+
+    def _compare(self, other: Any) -> tuple[Any, Any]:
+        # Returns the (less than, equal) masks, deciding from the most
+        # significant limb down.
+        a, b = np.broadcast_arrays(self.limbs, _get_limbs(other))
+        less = np.zeros(len(a), dtype=bool)
+        equal = np.ones(len(a), dtype=bool)
+        for i in reversed(range(LIMBS)):
+            less |= equal & (a[:, i] < b[:, i])
+            equal &= a[:, i] == b[:, i]
+
+        return less, equal
+
+    def __lt__(self, other: Any) -> Any:
+        return self._compare(other)[0]
+
+    def __le__(self, other: Any) -> Any:
+        less, equal = self._compare(other)
+        return less | equal
+
+    def __gt__(self, other: Any) -> Any:
+        less, equal = self._compare(other)
+        return ~(less | equal)
+
+    def __ge__(self, other: Any) -> Any:
+        return ~self._compare(other)[0]
+
+    def __eq__(self, other: Any) -> Any:  # type: ignore[override]
+        if not isinstance(other, (UInt256Column, int)):
+            return NotImplemented
+
+        return self._compare(other)[1]
+
+    def __ne__(self, other: Any) -> Any:  # type: ignore[override]
+        if not isinstance(other, (UInt256Column, int)):
+            return NotImplemented
+
+        return ~self._compare(other)[1]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def sum(self) -> HexInt32:
+        """
+        The sum of all values.
+
+        Raises:
+            OverflowError: When the sum does not fit in a ``uint256``.
+        """
+        total = 0
+        for start in range(0, len(self.limbs), _SUM_CHUNK_SIZE):
+            chunk = self.limbs[start : start + _SUM_CHUNK_SIZE]
+            for i in range(LIMBS):
+                limb = chunk[:, i]
+                low = int((limb & _LOW_MASK).sum(dtype=np.uint64))
+                high = int((limb >> _HALF_SHIFT).sum(dtype=np.uint64))
+                total += (low << (64 * i)) + (high << (64 * i + 32))
+
+        if total > MAX_UINT256:
+            raise OverflowError("uint256 sum overflow.")
+
+        return HexInt32(total)
+
+    def argmin(self) -> int:
+        return self._get_extreme_index(np.min)
+
+    def argmax(self) -> int:
+        return self._get_extreme_index(np.max)
+
+    def min(self) -> HexInt32:
+        return self[self.argmin()]
+
+    def max(self) -> HexInt32:
+        return self[self.argmax()]
+
+    def _get_extreme_index(self, reduce) -> int:
+        if not len(self):
+            raise ValueError(f"Empty {type(self).__name__}.")
+
+        # Narrow down the candidates from the most significant limb down.
+        limb = self.limbs[:, LIMBS - 1]
+        candidates = np.flatnonzero(limb == reduce(limb))
+        for i in reversed(range(LIMBS - 1)):
+            if len(candidates) == 1:
+                break
+
+            limb = self.limbs[candidates, i]
+            candidates = candidates[limb == reduce(limb)]
+
+        return int(candidates[0])
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        return no_info_plain_validator_function(
+            cls.__eth_pydantic_validate__,
+            serialization=plain_serializer_function_ser_schema(cls._to_hex_list),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        return UInt256Array.__get_pydantic_json_schema__(core_schema, handler)
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any, **kwargs) -> "UInt256Column":
+        if type(value) is cls:
+            return value
+
+        return cls.from_array(UInt256Array.__eth_pydantic_validate__(value))
+
+    def _to_hex_list(self) -> list[str]:
+        return self.to_array().to_hex_list()
+
+
+def _get_limbs(value: Any) -> Any:
+    if isinstance(value, UInt256Column):
+        return value.limbs
+
+    elif isinstance(value, int):
+        word = HexInt32.__eth_pydantic_validate__(value).to_bytes(32, "big")
+        return UInt256Column.from_words(word).limbs
+
+    raise TypeError(f"Unsupported operand type '{type(value).__name__}'.")
+
+
+def _empty_like(a: Any, b: Any) -> Any:
+    shape = np.broadcast_shapes(a.shape, b.shape)
+    return np.empty(shape, dtype=np.uint64, order="F")
+
+
+def _check_overflow(mask: Any, operation: str):
+    if mask.any():
+        index = int(np.argmax(mask))
+        raise OverflowError(f"uint256 {operation} overflow at index {index}.")
@@ -0,0 +1,129 @@
+"""
+Discriminated unions of hex types, dispatching on the shape of the input
+(its kind and length) instead of trying every member in turn.
+"""
+
+from typing import TYPE_CHECKING, Annotated, Any, Union, get_args, get_origin
+
+from pydantic import Discriminator, Tag
+
+from eth_pydantic_types.bip122 import Bip122Uri
+from eth_pydantic_types.hex.bytes import HexBytes
+from eth_pydantic_types.hex.int import BaseHexInt
+from eth_pydantic_types.hex.str import BaseHexStr
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_BYTES_KINDS = (bytes, bytearray, memoryview)
+
+# The "native" input kinds of each type, followed by the other kinds it validates.
+# NOTE: Inputs dispatch on their type, or else its closest base listed here
+#   (e.g. a ``HexBytes32`` value like ``bytes``), so ``bool`` is listed separately.
+_INPUT_KINDS: tuple[tuple[type, tuple[type, ...], tuple[type, ...]], ...] = (
+    (HexBytes, _BYTES_KINDS, (str, int, bool)),
+    (BaseHexStr, (str,), (bytes, int, bool)),
+    (BaseHexInt, (int, bool), (str, bytes)),
+    (Bip122Uri, (str,), ()),
+    (bool, (bool,), ()),
+    (int, (int,), (bool, str)),
+    (str, (str,), ()),
+    (bytes, _BYTES_KINDS, (str,)),
+    (type(None), (type(None),), ()),
+)
+
+
+def hex_union(*types: Any) -> Any:
+    """
+    Create a union of (hex) types that validates each input with a single
+    member, picked from the kind and length of the input.
+
+    An input goes to the first member for which its kind is native (e.g.
+    ``bytes`` to ``HexBytes``, ``int`` to ``int`` or ``HexInt``), else to the
+    first member that accepts that kind at all. However, for str and bytes
+    inputs, the first of those members whose ``size`` matches the input's
+    length wins. Inputs no member accepts fail right away, without running
+    any validator.
+
+    Usage example::
+
+        class Transaction(BaseModel):
+            to: hex_union(Address, HexStr32)
+            data: hex_union(HexBytes, int, None)
+
+    Args:
+        *types (Any): The members of the union. ``None`` is allowed.
+
+    Returns:
+        Any: An annotation to use in a model (or ``TypeAdapter``).
+    """
+    members = [type(None) if t is None else t for t in types]
+    routes: dict[type, list[tuple[str, int | None, bool]]] = {}
+    for index, member in enumerate(members):
+        native_kinds, other_kinds = _get_input_kinds(member)
+        size = getattr(member, "size", None) or None
+        for kind in (*native_kinds, *other_kinds):
+            routes.setdefault(kind, []).append((str(index), size, kind in native_kinds))
+
+    for candidates in routes.values():
+        # Native members first; otherwise members keep their order.
+        candidates.sort(key=lambda route: not route[2])
+
+    tagged = tuple(Annotated[m, Tag(str(i))] for i, m in enumerate(members))
+    return Annotated[Union[tagged], Discriminator(_create_discriminator(routes))]  # type: ignore[valid-type]
+
+
+def _get_input_kinds(member: Any) -> tuple[tuple[type, ...], tuple[type, ...]]:
+    annotation = getattr(member, "__value__", member)  # ``TypeAliasType``
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+
+    if isinstance(annotation, type):
+        for cls, native_kinds, other_kinds in _INPUT_KINDS:
+            if issubclass(annotation, cls):
+                return native_kinds, other_kinds
+
+    raise TypeError(f"Unsupported hex union member: {member}.")
+
+
+def _create_discriminator(
+    routes: dict[type, list[tuple[str, int | None, bool]]],
+) -> "Callable[[Any], str | None]":
+    def discriminate(value: Any) -> str | None:
+        if (candidates := _get_candidates(routes, type(value))) is None:
+            return None
+
+        elif len(candidates) == 1:
+            return candidates[0][0]
+
+        if isinstance(value, str):
+            # NOTE: Rounds up, as odd-length hex strs are padded with a nibble.
+            length = (len(value) - 1 if value[:2] == "0x" else len(value) + 1) // 2
+        elif isinstance(value, _BYTES_KINDS):
+            length = len(value)
+        else:
+            return candidates[0][0]
+
+        # Prefer the first member with a matching size, if any.
+        for tag, size, _ in candidates:
+            if size == length:
+                return tag
+
+        return candidates[0][0]
+
+    return discriminate
+
+
+def _get_candidates(
+    routes: dict[type, list[tuple[str, int | None, bool]]], kind: type
+) -> list[tuple[str, int | None, bool]] | None:
+    if (candidates := routes.get(kind)) is not None:
+        return candidates
+
+    # Subclasses (e.g. already-validated values) take the routes of their closest base.
+    for base in kind.__mro__[1:]:
+        if (candidates := routes.get(base)) is not None:
+            routes[kind] = candidates
+            return candidates
+
+    return None
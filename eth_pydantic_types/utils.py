@@ -1,7 +1,13 @@
-from collections.abc import Sized
+import re
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sized
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, TypeVar
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
+import eth_pydantic_types.instrumentation as instrumentation
 from eth_pydantic_types._error import HexValueError, SizeError
 
 if TYPE_CHECKING:
@@ -13,6 +19,197 @@ class PadDirection(str, Enum):
     RIGHT = "right"
 
 
+# NOTE: ``False`` on free-threaded builds (with the GIL disabled).
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class LRUCache:
+    """
+    A size-bounded, least-recently-used cache with hit / miss counters.
+    A ``maxsize`` of ``0`` disables caching entirely.
+
+    The cache is safe to use from many threads: adding and evicting entries
+    takes a lock, while lookups do not. On free-threaded builds, a hit only
+    refreshes the entry's recency if no other thread holds the lock, so hits
+    never wait. The counters are best-effort.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        # perf: With the GIL, ``move_to_end()`` is atomic, so hits skip the lock.
+        if _GIL_ENABLED:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another thread; the value is still valid.
+
+        elif (lock := self._lock).acquire(False):
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                pass  # Evicted before the lock was taken; the value is still valid.
+
+            lock.release()
+
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict(self.maxsize)
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict(max(maxsize, 0))
+
+    def _evict(self, maxsize: int):
+        # NOTE: Only called with the lock held.
+        while len(self._data) > maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+class InternPool:
+    """
+    Maps equal values to one shared instance, so values repeated across many
+    validations (e.g. the same block hash in every log of a block) are only
+    stored once and compare by identity.
+
+    **NOTE**: CPython cannot weakly reference ``bytes`` / ``int`` (or their
+    subclasses) nor exact ``str`` values, so rather than a weak-value table,
+    the pool holds values normally and, whenever it has doubled in size,
+    sweeps out the values nothing else references anymore.
+
+    The pool is safe to use from many threads: interning is lock-free (and
+    concurrent threads interning equal values get the same instance) while
+    sweeps take a lock, skipping the sweep if another thread is sweeping.
+    """
+
+    def __init__(self, sweep_size: int = 4096):
+        self.sweep_size = sweep_size
+        self.interned = 0
+        self.new = 0
+        self._tables: dict[type, dict] = {}
+        self._size = 0
+        self._next_sweep = sweep_size
+        self._sweep_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def intern(self, value: Any) -> Any:
+        """
+        Get the pooled instance equal to ``value`` (of the same type),
+        adding ``value`` to the pool if there is none yet.
+        """
+        if (table := self._tables.get(type(value))) is None:
+            table = self._tables.setdefault(type(value), {})
+
+        elif (existing := table.get(value)) is not None:
+            self.interned += 1
+            return existing
+
+        # NOTE: ``setdefault()`` is atomic, so if another thread added an equal
+        #   value in the meantime, that one is used instead.
+        if (existing := table.setdefault(value, value)) is not value:
+            self.interned += 1
+            return existing
+
+        self.new += 1
+        self._size += 1
+        if self._size >= self._next_sweep:
+            self.sweep()
+
+        return value
+
+    def sweep(self):
+        """
+        Drop the values that are only referenced by the pool.
+        """
+        if not self._sweep_lock.acquire(blocking=False):
+            return  # Another thread is already sweeping.
+
+        try:
+            for table in list(self._tables.values()):
+                for key, refcount in _get_refcounts(table):
+                    if refcount <= _UNREFERENCED:
+                        table.pop(key, None)
+
+            self._size = sum(len(t) for t in list(self._tables.values()))
+            self._next_sweep = max(self.sweep_size, self._size * 2)
+        finally:
+            self._sweep_lock.release()
+
+    def clear(self):
+        self._tables.clear()
+        self._size = 0
+        self._next_sweep = self.sweep_size
+        self.interned = 0
+        self.new = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"interned": self.interned, "new": self.new, "size": self._size}
+
+
+def _get_refcounts(table: dict) -> list[tuple[Any, int]]:
+    # NOTE: Pool tables map each value to itself. The items are copied first
+    #   as other threads may add values while the table is being swept.
+    items = list(table.items())
+    return [(key, sys.getrefcount(value)) for key, value in items]
+
+
+def _get_unreferenced_refcount() -> int:
+    # The reference count, as seen by ``_get_refcounts()``, of a value
+    # referenced by nothing but its table.
+    value = object()
+    table = {value: value}
+    del value
+    return _get_refcounts(table)[0][1]
+
+
+_UNREFERENCED = _get_unreferenced_refcount()
+
+
 def validate_size(value: "__SIZED_T", size: int, coerce: Callable | None = None) -> "__SIZED_T":
     if len(value) == size:
         return value
@@ -23,14 +220,22 @@ def validate_size(value: "__SIZED_T", size: int, coerce: Callable | None = None)
     raise SizeError(size, value)
 
 
-def validate_in_range(value: int, size: int, signed: bool = True) -> int:
+@cache
+def get_int_bounds(size: int, signed: bool) -> tuple[int, int]:
+    """
+    The (inclusive) minimum and maximum of a ``size``-byte integer.
+    """
+    bits = size * 8
     if signed:
-        if -(2**size) / 2 <= value < (2**size) / 2:
-            return value
+        return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+    return 0, (1 << bits) - 1
 
-    else:
-        if 0 <= value < 2 ** (size * 8):
-            return value
+
+def validate_in_range(value: int, size: int, signed: bool = True) -> int:
+    min_value, max_value = get_int_bounds(size, signed)
+    if min_value <= value <= max_value:
+        return value
 
     raise SizeError(size, value)
 
@@ -66,10 +271,13 @@ def validate_int_size(value: int, size: int, signed: bool) -> int:
 def _coerce_hexstr_size(
     val: str, length: int, pad_direction: PadDirection = PadDirection.LEFT
 ) -> str:
-    val = val.replace("0x", "") if val.startswith("0x") else val
+    val = val[2:] if val.startswith("0x") else val
     if len(val) == length:
         return val
 
+    if instrumentation.collector is not None:
+        instrumentation.collector.event("coerce.str_size")
+
     val_stripped = val.lstrip("0")
 
     # Ensure is still even.
@@ -92,22 +300,142 @@ def _coerce_hexbytes_size(
     if len(val) == num_bytes:
         return val
 
+    if instrumentation.collector is not None:
+        instrumentation.collector.event("coerce.bytes_size")
+
     val_stripped = val.lstrip(b"\x00")
-    num_zeroes = max(0, num_bytes - len(val_stripped))
-    zeroes = b"\x00" * num_zeroes
-    return zeroes + val_stripped if pad_direction is PadDirection.LEFT else val_stripped + zeroes
+    return (
+        val_stripped.rjust(num_bytes, b"\x00")
+        if pad_direction is PadDirection.LEFT
+        else val_stripped.ljust(num_bytes, b"\x00")
+    )
 
 
 def validate_hex_str(value: str) -> str:
-    hex_value = (value[2:] if value.startswith("0x") else value).lower()
-    if set(hex_value) - set("1234567890abcdef"):
+    return normalize_hex(value)
+
+
+def normalize_hex(
+    value: Any, size: int | None = None, pad_direction: PadDirection = PadDirection.LEFT
+) -> str:
+    """
+    Convert a hex str, bytes or (non-negative) int to a canonical hex str:
+    lowercase, ``0x``-prefixed and of an even length. With a ``size``, also
+    pad it to that many bytes (stripping leading zeroes first).
+
+    **NOTE**: A str already in canonical form (of the right size) is returned
+    as-is, without creating a new str.
+
+    Args:
+        value (Any): The value to normalize.
+        size (int | None): The number of bytes to pad to, if any.
+        pad_direction (PadDirection): The side to pad.
+
+    Returns:
+        str: The canonical hex str.
+    """
+    if (normalize := _HEX_NORMALIZERS.get(type(value))) is None:
+        if (normalize := _get_hex_normalizer(type(value))) is None:
+            raise HexValueError(value)
+
+    return normalize(value, size, pad_direction)
+
+
+def _normalize_hex_str(value: str, size: int | None, pad_direction: PadDirection) -> str:
+    if value.startswith("0x"):
+        length = len(value) - 2
+        if (length == size * 2 if size else length % 2 == 0) and _LOWER_HEX(value, 2):
+            return value
+
+        start = 2
+    else:
+        length = len(value)
+        start = 0
+
+    if not _HEX(value, start):
+        raise HexValueError(value)
+
+    return _pad_hex((value[start:] if start else value).lower(), length, size, pad_direction)
+
+
+def _normalize_hex_bytes(value: bytes, size: int | None, pad_direction: PadDirection) -> str:
+    if instrumentation.collector is not None:
+        instrumentation.collector.event("coerce.bytes_to_hex")
+
+    # NOTE: Not ``value.hex()``, which ``hexbytes.HexBytes`` overrides.
+    return _pad_hex(bytes.hex(value), len(value) * 2, size, pad_direction)
+
+
+def _normalize_hex_int(value: int, size: int | None, pad_direction: PadDirection) -> str:
+    if value < 0:
         raise HexValueError(value)
 
-    # Missing zero padding.
-    if len(hex_value) % 2 != 0:
-        hex_value = f"0{hex_value}"
+    if instrumentation.collector is not None:
+        instrumentation.collector.event("coerce.int_to_hex")
+
+    digits = f"{value:x}"
+    return _pad_hex(digits, len(digits), size, pad_direction)
+
+
+def _pad_hex(digits: str, length: int, size: int | None, pad_direction: PadDirection) -> str:
+    # NOTE: ``digits`` are valid, lowercase and unprefixed.
+    if size is None:
+        return f"0x{digits}" if length % 2 == 0 else f"0x0{digits}"
+
+    elif length == size * 2:
+        return f"0x{digits}"
+
+    if instrumentation.collector is not None:
+        instrumentation.collector.event("coerce.str_size")
+
+    digits = digits.lstrip("0")
+    if len(digits) % 2 != 0:
+        digits = f"0{digits}"
+
+    if len(digits) > size * 2:
+        raise SizeError(size * 2, digits)
+
+    elif pad_direction is PadDirection.LEFT:
+        return f"0x{digits.rjust(size * 2, '0')}"
+
+    return f"0x{digits.ljust(size * 2, '0')}"
+
+
+def _get_hex_normalizer(value_type: type) -> Callable | None:
+    # Subclasses (e.g. ``HexStr`` or ``HexBytes`` values) use the normalizer of
+    # their builtin base, which is then stored for their type, too.
+    for base in value_type.__mro__:
+        if (normalize := _HEX_NORMALIZERS.get(base)) is not None:
+            _HEX_NORMALIZERS[value_type] = normalize
+            return normalize
+
+    return None
+
+
+_LOWER_HEX = re.compile("[0-9a-f]*").fullmatch
+_HEX = re.compile("[0-9a-fA-F]*").fullmatch
+_HEX_NORMALIZERS: dict[type, Callable] = {
+    str: _normalize_hex_str,
+    bytes: _normalize_hex_bytes,
+    int: _normalize_hex_int,
+    bool: _normalize_hex_int,
+}
+
+
+def parse_hex_int(value: str) -> int:
+    """
+    Parse a hex str, with or without its ``0x`` prefix, into an int.
+    """
+    digits = value[2:] if value[:2] == "0x" else value
+    # perf: ``int()`` validates the digits itself; only rule out the other forms it
+    #   accepts: signs, whitespace, underscores, non-ASCII digits and a (second) prefix.
+    if digits.isascii() and digits.isalnum() and digits[1:2] not in ("x", "X"):
+        try:
+            return int(digits, 16)
+        except ValueError:
+            pass
 
-    return f"0x{hex_value}"
+    raise HexValueError(value)
 
 
 def get_hash_pattern(str_size: int) -> str:
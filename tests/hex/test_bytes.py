@@ -62,8 +62,38 @@ class TestHexBytes:
         model = BytesModel(value=value)
         assert model.value == HexBytes(value)
 
+    @pytest.mark.parametrize("value", (bytearray(b"\x01\x02"), memoryview(b"\x01\x02")))
+    def test_buffer_inputs(self, value):
+        actual = BytesModel(value=value)
+        assert actual.value == b"\x01\x02"
+        assert type(actual.value) is HexBytes
+
+    def test_already_validated(self):
+        value = HexBytes.__eth_pydantic_validate__("0x0102")
+        assert HexBytes.__eth_pydantic_validate__(value) is value
+        assert BytesModel(value=value).value is value
+
 
 class TestHexBytes32:
+    def test_already_validated(self, bytes32str):
+        value = HexBytes32.__eth_pydantic_validate__(bytes32str)
+        assert HexBytes32.__eth_pydantic_validate__(value) is value
+
+        # Other classes are converted.
+        converted = HexBytes20.__eth_pydantic_validate__(HexBytes32(b"\x01" * 20))
+        assert type(converted) is HexBytes20
+
+    @pytest.mark.parametrize("wrap", (bytes, bytearray, memoryview))
+    def test_buffer_inputs(self, bytes32str, wrap):
+        raw = bytes.fromhex(bytes32str[2:])
+        actual = HexBytes32.__eth_pydantic_validate__(wrap(raw))
+        assert actual == raw
+        assert type(actual) is HexBytes32
+
+        # Padding works on buffers too.
+        padded = HexBytes32.__eth_pydantic_validate__(wrap(b"\x05"))
+        assert padded == b"\x05" + b"\x00" * 31
+
     def test_fromhex(self, bytes32str):
         actual_with_0x = HexBytes32.fromhex(bytes32str)
         actual_without_0x = HexBytes32.fromhex(bytes32str[2:])
@@ -104,3 +134,11 @@ class TestBoundHexBytes:
 
         model = MyModel(my_bytes=1)
         assert model.my_bytes.startswith(HexBytes(1))
+
+
+@pytest.mark.parametrize("value", (None, 1.5, [1], {"a": 1}))
+def test_invalid_input_kind(value):
+    with pytest.raises(ValidationError) as err:
+        BytesModel(value=value)
+
+    assert err.value.errors()[0]["type"] == "HexValueError"
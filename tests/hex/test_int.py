@@ -74,6 +74,31 @@ class TestHexInt32:
         # The resulting size in bytes is 32.
         assert len(HexBytes(str_value)) == 32
 
+    @pytest.mark.parametrize(
+        "value,expected",
+        (("0x1b4", 436), ("1b4", 436), ("0x1B4", 436), ("0x0", 0), ("0x00ff", 255)),
+    )
+    def test_str(self, value, expected):
+        actual = HexInt32.__eth_pydantic_validate__(value)
+        assert actual == expected
+        assert type(actual) is HexInt32
+
+    @pytest.mark.parametrize(
+        "value", ("0x", "", "0X1b4", "0x0x1", " 0x1", "0x1_0", "-0x1", "0xg", "0x١")
+    )
+    def test_invalid_str(self, value):
+        with pytest.raises(ValidationError):
+            HexInt32Model(value=value)
+
+    @pytest.mark.parametrize("value", (0, 2**256 - 1))
+    def test_bounds(self, value):
+        assert HexInt32Model(value=value).value == value
+
+    @pytest.mark.parametrize("value", (-1, 2**256))
+    def test_out_of_bounds(self, value):
+        with pytest.raises(ValidationError):
+            HexInt32Model(value=value)
+
 
 # Even though UInt256 is a TypeAlias of HexInt32, we want to ensure it functions separately.
 class TestUInt256:
@@ -105,3 +130,28 @@ def test_custom_type():
 
     model_json = model.model_dump_json()
     assert model_json == '{"network_id":"0x0000000000aa36a7"}'
+
+
+@pytest.mark.parametrize("cls", (HexInt, HexInt32))
+def test_no_instance_dict(cls):
+    assert not hasattr(cls.__eth_pydantic_validate__(10), "__dict__")
+
+
+def test_signed_bounds():
+    class Int256(BoundHexInt):
+        size: ClassVar[int] = 32
+        signed: ClassVar[bool] = True
+
+    assert Int256.bounds == (-(2**255), 2**255 - 1)
+    for value in (-(2**255), 2**255 - 1, -1):
+        assert Int256.__eth_pydantic_validate__(value) == value
+
+    for value in (-(2**255) - 1, 2**255):
+        with pytest.raises(ValueError):
+            Int256.__eth_pydantic_validate__(value)
+
+
+def test_from_bytes():
+    assert HexInt.from_bytes(b"\x01\x02") == 0x0102
+    assert HexInt.from_bytes(b"\x01\x02", byteorder="little") == 0x0201
+    assert HexInt.from_bytes(b"\xff", signed=True) == -1
@@ -1,14 +1,24 @@
+from typing import Any
+
 import pytest
 from pydantic import BaseModel, ValidationError
 
+from eth_pydantic_types.address import Address
 from eth_pydantic_types.hex import (
+    BoundHexInt,
     HexBytes,
     HexBytes20,
     HexBytes32,
+    HexInt32,
     HexStr32,
 )
 
 
+class Int8(BoundHexInt):
+    size = 1
+    signed = True
+
+
 class SizedModel(BaseModel):
     valuebytes20: HexBytes20
     valuebytes32: HexBytes32
@@ -137,3 +147,43 @@ class TestSized:
         smaller_value_no_prefix = "0x58372ab62269a52fa636ad7f200d93999595dcaf"
         actual = SimpleModel(valuestr=smaller_value_no_prefix)
         assert len(actual.valuestr) == 66
+
+
+@pytest.mark.parametrize("hex_type", (HexBytes20, HexBytes32, HexStr32, HexInt32))
+def test_schema_metadata_set_on_definition(hex_type):
+    expected_pattern = f"^0x[a-fA-F0-9]{{{hex_type.size * 2}}}$"
+    assert hex_type.schema_pattern == expected_pattern
+
+    # Defining a new sized type computes its own metadata immediately.
+    sized_type: Any = type("Sized8", (hex_type,), {"size": 8})
+    assert sized_type.schema_pattern == "^0x[a-fA-F0-9]{16}$"
+    assert sized_type.schema_examples[0] == f"0x{'0' * 16}"
+
+    # Validating values does not touch the class.
+    class_dict = dict(vars(sized_type))
+    sized_type.__eth_pydantic_validate__(5)
+    assert dict(vars(sized_type)) == class_dict
+
+
+@pytest.mark.parametrize(
+    "hex_type,value,raw",
+    (
+        (HexBytes20, "0x01", b"\x01" + bytes(19)),
+        (HexBytes32, 5, bytes(31) + b"\x05"),
+        (HexStr32, 5, bytes(31) + b"\x05"),
+        (HexInt32, 5, bytes(31) + b"\x05"),
+        (Int8, -2, b"\xfe"),
+        (
+            Address,
+            "0x0837207e343277cbd6c114a45ec0e9ec56a1ad84",
+            bytes.fromhex("0837207e343277cbd6c114a45ec0e9ec56a1ad84"),
+        ),
+    ),
+)
+def test_raw_bytes(hex_type, value, raw):
+    validated = hex_type.__eth_pydantic_validate__(value)
+    assert hex_type.to_raw_bytes(validated) == raw
+    actual = hex_type.from_valid_bytes(raw)
+    assert actual == validated
+    assert type(actual) is type(validated)
+    assert hex_type.from_valid_bytes(memoryview(raw)) == validated
@@ -90,3 +90,8 @@ class TestHexStr:
 
         model = MyModel(my_str=1)
         assert model.my_str.startswith("0x01")
+
+
+@pytest.mark.parametrize("cls", (HexStr, HexStr20))
+def test_no_instance_dict(cls):
+    assert not hasattr(cls.__eth_pydantic_validate__(10), "__dict__")
@@ -1,7 +1,14 @@
+import pickle
+import subprocess
+import sys
+
 import pytest
 from pydantic import BaseModel, ValidationError
 
+from eth_pydantic_types import abi
 from eth_pydantic_types.abi import (
+    bytes4,
+    bytes32,
     int8,
     int16,
     int32,
@@ -166,3 +173,36 @@ def test_lower_bounds():
         )
     with pytest.raises(ValidationError):
         UnsignedModel.from_series(-1, -1, -1, -1, -1, -1)
+
+
+def test_lazy_types_identity():
+    assert abi.uint256 is uint256
+    assert abi.bytes32 is bytes32
+    assert bytes32.size == 32
+    assert bytes32.__module__ == "eth_pydantic_types.abi"
+    assert bytes32.schema_pattern == "^0x[a-fA-F0-9]{64}$"
+    assert {"bytes1", "int8", "uint256"} <= set(dir(abi))
+    assert len(abi.__all__) == 100
+
+
+def test_lazy_types_pickle():
+    value = bytes4(b"\xa9\x05\x9c\xbb")
+    actual = pickle.loads(pickle.dumps(value))  # noqa: S301
+    assert type(actual) is bytes4
+    assert actual == value
+
+
+@pytest.mark.parametrize("name", ("bytes0", "bytes33", "uint7", "int264", "uint"))
+def test_unknown_type(name):
+    with pytest.raises(AttributeError):
+        getattr(abi, name)
+
+
+def test_lazy_import():
+    # Importing the module must not create any sized types (nor pull in pydantic.fields).
+    code = (
+        "import sys, eth_pydantic_types.abi as abi; "
+        "assert not {'uint256', 'int8', 'bytes32'} & set(vars(abi)); "
+        "assert 'pydantic.fields' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
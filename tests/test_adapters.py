@@ -0,0 +1,59 @@
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+
+from eth_pydantic_types.adapters import (
+    PUBLIC_TYPES,
+    get_adapter,
+    get_warmup_types,
+    warmup,
+)
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex import HexBytes32, HexInt
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+@pytest.fixture
+def clear_adapters():
+    get_adapter.cache_clear()
+    yield
+    get_adapter.cache_clear()
+
+
+def test_get_adapter():
+    adapter = get_adapter(list[Address])
+    assert get_adapter(list[Address]) is adapter
+    assert adapter.validate_python([ADDRESS.lower()]) == [ADDRESS]
+    with pytest.raises(ValidationError):
+        adapter.validate_python(["0x01zz"])
+
+
+def test_get_adapter_optional():
+    adapter = get_adapter(Optional[HexInt])
+    assert get_adapter(HexInt | None) is adapter
+    assert adapter.validate_python(None) is None
+    assert adapter.validate_python("0x1b4") == 0x1B4
+
+
+def test_get_warmup_types():
+    assert get_warmup_types([HexBytes32]) == [HexBytes32, list[HexBytes32], HexBytes32 | None]
+    assert len(get_warmup_types()) == 3 * len(PUBLIC_TYPES)
+
+
+def test_warmup(clear_adapters):
+    assert warmup() is None
+    assert get_adapter.cache_info().currsize == 3 * len(PUBLIC_TYPES)
+
+
+def test_warmup_background(clear_adapters):
+    thread = warmup([HexBytes32], background=True)
+    assert thread is not None
+    assert thread.daemon
+
+    # Usable while warming up.
+    value = f"0x{'11' * 32}"
+    assert get_adapter(HexBytes32).validate_python(value) == HexBytes32(value)
+    thread.join()
+    assert get_adapter.cache_info().currsize == 3
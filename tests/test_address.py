@@ -13,6 +13,12 @@ LEADING_ZEROES_ADDRESS = "04444c5dc75cb358380d2e3de08a90"  # Uniswap v4 pool man
 CHECKSUM_LEADING_ZEROES_ADDRESS = "0x000000000004444c5dc75cB358380D2e3dE08A90"
 
 
+class LowerAddress(Address):
+    @classmethod
+    def to_checksum_address(cls, value):
+        return value.lower()
+
+
 class Model(BaseModel):
     address: Address
     address_type: AddressType
@@ -76,3 +82,113 @@ def test_leading_zeroes():
         "address_type": CHECKSUM_LEADING_ZEROES_ADDRESS,
     }
     assert actual == expected
+
+
+def test_checksum_cache():
+    cache = Address.checksum_cache
+    cache.clear()
+
+    assert Address.__eth_pydantic_validate__(ADDRESS) == CHECKSUM_ADDRESS
+    assert cache.stats["misses"] == 1
+    assert cache.stats["size"] == 1
+
+    # Differently formatted inputs of the same address hit the cache.
+    for value in (CHECKSUM_ADDRESS, CHECKSUM_ADDRESS.lower(), CHECKSUM_ADDRESS[2:].upper()):
+        assert Address.__eth_pydantic_validate__(value) == CHECKSUM_ADDRESS
+
+    assert cache.stats["hits"] == 3
+    assert cache.stats["size"] == 1
+
+
+def test_checksum_cache_eviction():
+    cache = Address.checksum_cache
+    original_size = cache.maxsize
+    cache.clear()
+    cache.resize(2)
+    try:
+        Address.__eth_pydantic_validate__(ADDRESS)
+        Address.__eth_pydantic_validate__(LEADING_ZEROES_ADDRESS)
+        Address.__eth_pydantic_validate__(1)
+        assert len(cache) == 2
+        assert CHECKSUM_ADDRESS.lower() not in cache
+        assert CHECKSUM_LEADING_ZEROES_ADDRESS.lower() in cache
+    finally:
+        cache.resize(original_size)
+        cache.clear()
+
+
+def test_checksum_cache_disabled():
+    cache = Address.checksum_cache
+    original_size = cache.maxsize
+    cache.clear()
+    cache.resize(0)
+    try:
+        assert Address.__eth_pydantic_validate__(ADDRESS) == CHECKSUM_ADDRESS
+        assert len(cache) == 0
+    finally:
+        cache.resize(original_size)
+
+
+def test_invalid_address_not_cached():
+    Address.checksum_cache.clear()
+    with pytest.raises(ValidationError):
+        Model(address="0X" + CHECKSUM_ADDRESS[2:], address_type=ADDRESS)
+
+    assert len(Address.checksum_cache) == 1  # Only the valid address_type value.
+
+
+def test_checksum_many():
+    Address.checksum_cache.clear()
+    values = [
+        CHECKSUM_ADDRESS,
+        ADDRESS,
+        f"0x0{ADDRESS}",
+        int(ADDRESS, 16),
+        HexBytes(ADDRESS),
+        LEADING_ZEROES_ADDRESS,
+        f"0x0{ADDRESS}".upper()[2:],
+    ]
+    actual = Address.checksum_many(values)
+    assert actual == [
+        CHECKSUM_ADDRESS,
+        CHECKSUM_ADDRESS,
+        CHECKSUM_ADDRESS,
+        CHECKSUM_ADDRESS,
+        CHECKSUM_ADDRESS,
+        CHECKSUM_LEADING_ZEROES_ADDRESS,
+        CHECKSUM_ADDRESS,
+    ]
+    assert Address.validate_many(iter(values)) == actual
+
+
+def test_checksum_cache_per_class():
+    Address.checksum_cache.clear()
+    assert LowerAddress.checksum_cache is not Address.checksum_cache
+    assert LowerAddress.checksum_cache.maxsize == Address.checksum_cache.maxsize
+
+    # The subclass' results must not leak into the base class (or vice versa).
+    assert LowerAddress.__eth_pydantic_validate__(CHECKSUM_ADDRESS) == CHECKSUM_ADDRESS.lower()
+    assert Address.__eth_pydantic_validate__(CHECKSUM_ADDRESS.lower()) == CHECKSUM_ADDRESS
+    assert LowerAddress.__eth_pydantic_validate__(CHECKSUM_ADDRESS) == CHECKSUM_ADDRESS.lower()
+
+
+def test_checksum_many_overridden():
+    values = [CHECKSUM_ADDRESS, CHECKSUM_LEADING_ZEROES_ADDRESS]
+    expected = [v.lower() for v in values]
+    assert LowerAddress.to_checksum_address_many(values) == expected
+    LowerAddress.checksum_cache.clear()
+    assert LowerAddress.checksum_many(values) == expected
+    assert [LowerAddress.__eth_pydantic_validate__(v) for v in values] == expected
+
+
+def test_checksum_many_invalid():
+    with pytest.raises(ValueError):
+        Address.checksum_many([CHECKSUM_ADDRESS, "foo"])
+
+
+def test_address_type_module_attribute():
+    import eth_pydantic_types.address as module
+
+    assert module.AddressType is AddressType
+    with pytest.raises(AttributeError):
+        _ = module.NotAType
@@ -0,0 +1,96 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.array import AddressArray, HexBytes20Array, HexBytes32Array, UInt256Array
+from eth_pydantic_types.hex import HexBytes20, HexBytes32, HexInt32
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASHES = [f"0x{i:064x}" for i in range(1, 6)]
+
+
+class Block(BaseModel):
+    transactions: HexBytes32Array
+    miners: AddressArray = AddressArray()
+    amounts: UInt256Array = UInt256Array()
+
+
+@pytest.mark.parametrize(
+    "array_type,item_type,values",
+    (
+        (HexBytes32Array, HexBytes32, HASHES),
+        (HexBytes32Array, HexBytes32, ["0x01", b"\x02", 3, HASHES[0], HASHES[1].upper()]),
+        (HexBytes20Array, HexBytes20, ["0x01", b"\x02" * 20, 3]),
+        (UInt256Array, HexInt32, [0, 1, 2**256 - 1]),
+        (UInt256Array, HexInt32, ["0x1b4", b"\x05", 6, *HASHES]),
+        (AddressArray, Address, [ADDRESS, ADDRESS.lower(), 1, b"\x01" * 20]),
+    ),
+)
+def test_array(array_type, item_type, values):
+    array = array_type(values)
+    expected = [item_type.__eth_pydantic_validate__(v) for v in values]
+    assert len(array) == len(values)
+    assert list(array) == expected
+    assert [type(v) for v in array] == [type(v) for v in expected]
+    assert array[-1] == expected[-1]
+    assert len(array.tobytes()) == len(values) * array_type.item_size
+
+
+@pytest.mark.parametrize(
+    "values",
+    (
+        [f"0x{'ff' * 33}"],
+        [f"0x{'zz' * 32}"],
+        [HASHES[0], f"0X{'00' * 32}", 2**256],
+        [f"0x{'00' * 31} 0"],
+        [HASHES[0], None],
+    ),
+)
+def test_array_invalid(values):
+    with pytest.raises((ValueError, TypeError)):
+        HexBytes32Array(values)
+
+
+def test_slice():
+    array = HexBytes32Array(HASHES)
+    assert array[1:3] == HexBytes32Array(HASHES[1:3])
+    assert array[::-2] == HexBytes32Array(HASHES[::-2])
+    assert isinstance(array[1:3], HexBytes32Array)
+    with pytest.raises(IndexError):
+        _ = array[len(HASHES)]
+
+
+def test_from_buffer():
+    array = HexBytes32Array(HASHES)
+    assert HexBytes32Array.from_buffer(array.buffer) == array
+    assert array.buffer.readonly
+    with pytest.raises(ValueError):
+        HexBytes32Array.from_buffer(b"\x01" * 33)
+
+
+def test_model():
+    block = Block(transactions=HASHES, miners=[ADDRESS.lower()], amounts=["0x01", 2])
+    assert isinstance(block.transactions, HexBytes32Array)
+    assert list(block.miners) == [ADDRESS]
+    assert list(block.amounts) == [1, 2]
+    assert Block.model_validate_json(block.model_dump_json()) == block
+
+    dumped = block.model_dump(mode="json")
+    assert dumped["transactions"] == HASHES
+    assert dumped["miners"] == [ADDRESS]
+    assert dumped["amounts"] == [f"0x{1:064x}", f"0x{2:064x}"]
+
+
+def test_model_invalid():
+    with pytest.raises(ValidationError):
+        Block(transactions=HASHES[0])
+
+    with pytest.raises(ValidationError):
+        Block(transactions=["0xzz"])
+
+
+def test_json_schema():
+    schema = Block.model_json_schema()["properties"]["transactions"]
+    assert schema["type"] == "array"
+    assert schema["items"]["type"] == "string"
+    assert schema["items"]["pattern"] == "^0x[a-fA-F0-9]{64}$"
@@ -0,0 +1,238 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+pa = pytest.importorskip("pyarrow")
+
+from eth_pydantic_types import abi  # noqa: E402
+from eth_pydantic_types.address import Address  # noqa: E402
+from eth_pydantic_types.array import AddressArray, HexBytes32Array  # noqa: E402
+from eth_pydantic_types.arrow import (  # noqa: E402
+    from_arrow,
+    from_record_batch,
+    get_arrow_type,
+    to_arrow,
+    to_record_batch,
+)
+from eth_pydantic_types.hex import (  # noqa: E402
+    HexBytes,
+    HexBytes20,
+    HexBytes32,
+    HexInt,
+    HexInt32,
+    HexStr20,
+    HexStr32,
+)
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASHES = [f"0x{i:064x}" for i in range(1, 4)]
+
+
+class Log(BaseModel):
+    address: Address
+    block_hash: HexBytes32
+    log_index: int
+    data: HexBytes
+    value: HexInt32
+    hashes: list[HexBytes32]
+    topics: HexBytes32Array
+    removed: Optional[bool] = None
+    transaction_hash: HexBytes32 | None = None
+
+
+class Transfer(BaseModel):
+    token: abi.address
+    topic: abi.bytes32
+    amount: abi.uint256
+    delta: abi.int128 | None = None
+
+
+def make_logs(count: int) -> list[Log]:
+    return [
+        Log(
+            address=ADDRESS,
+            block_hash=HASHES[i % 3],
+            log_index=i,
+            data=b"\x01" * i,
+            value=2**256 - 1 - i,
+            topics=HASHES[:i],
+            hashes=HASHES[i:],
+            transaction_hash=None if i % 2 else HASHES[0],
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "type_,expected",
+    (
+        (HexBytes32, pa.binary(32)),
+        (HexBytes20, pa.binary(20)),
+        (Address, pa.binary(20)),
+        (HexBytes, pa.binary()),
+        (HexInt32, pa.binary(32)),
+        (HexInt, pa.binary()),
+        (HexStr20, pa.binary(20)),
+        (HexBytes32Array, pa.list_(pa.binary(32))),
+        (list[Address], pa.list_(pa.binary(20))),
+        (abi.address, pa.binary(20)),
+        (abi.bytes32, pa.binary(32)),
+        (abi.bytes, pa.binary()),
+        (abi.uint256, pa.binary(32)),
+        (abi.int8, pa.binary(1)),
+        (list[abi.uint256], pa.list_(pa.binary(32))),
+    ),
+)
+def test_get_arrow_type(type_, expected):
+    assert get_arrow_type(type_) == expected
+
+
+def test_get_arrow_type_decimal():
+    assert get_arrow_type(HexInt32, int_format="decimal") == pa.decimal256(76, 0)
+    assert get_arrow_type(abi.uint256, int_format="decimal") == pa.decimal256(76, 0)
+    assert get_arrow_type(HexInt, int_format="decimal") == pa.decimal256(76, 0)
+
+
+def test_get_arrow_type_unsupported():
+    with pytest.raises(TypeError):
+        get_arrow_type(int)
+
+    with pytest.raises(TypeError):
+        get_arrow_type(abi.string)
+
+
+@pytest.mark.parametrize(
+    "type_,values",
+    (
+        (HexBytes32, HASHES),
+        (HexBytes20, ["0x01", b"\x02" * 20]),
+        (Address, [ADDRESS, ADDRESS.lower()]),
+        (HexBytes, ["0x", "0x0102"]),
+        (HexInt32, [0, 1, 2**256 - 1]),
+        (HexInt, [0, 255, -1, 10**20, 2**256]),
+        (HexStr20, ["0x01", b"\x02"]),
+        (HexStr32, HASHES),
+        (HexBytes32Array, [HASHES, [], HASHES[1:]]),
+        (AddressArray, [[ADDRESS], []]),
+    ),
+)
+def test_round_trip(type_, values):
+    validated = [type_.__eth_pydantic_validate__(v) for v in values]
+    assert_round_trip(type_, validated)
+
+
+@pytest.mark.parametrize(
+    "type_,values",
+    (
+        (abi.uint256, [0, 2**63, 2**256 - 1]),
+        (abi.int8, [-128, -1, 0, 127]),
+        (abi.address, [ADDRESS]),
+    ),
+)
+def test_round_trip_abi(type_, values):
+    assert_round_trip(type_, values)
+
+
+def test_round_trip_address_subclass():
+    class LowerAddress(Address):
+        @classmethod
+        def to_checksum_address(cls, value):
+            return value.lower()
+
+    array = to_arrow(LowerAddress, [LowerAddress.__eth_pydantic_validate__(ADDRESS)])
+    assert from_arrow(LowerAddress, array) == [ADDRESS.lower()]
+
+
+def test_round_trip_list():
+    validated = [[HexBytes32(h) for h in HASHES], [], [HexBytes32(HASHES[0])]]
+    assert_round_trip(list[HexBytes32], validated)
+
+
+def assert_round_trip(type_, validated):
+    array = to_arrow(type_, validated)
+    assert array.type == get_arrow_type(type_)
+    actual = from_arrow(type_, array)
+    assert actual == validated
+    assert [type(v) for v in actual] == [type(v) for v in validated]
+
+    # Slices and nulls.
+    assert from_arrow(type_, array.slice(1)) == validated[1:]
+    with_nulls = to_arrow(type_, [None, *validated, None])
+    assert with_nulls.null_count == 2
+    assert from_arrow(type_, with_nulls) == [None, *validated, None]
+
+
+def test_raw_bytes():
+    array = to_arrow(HexBytes32, [HexBytes32(h) for h in HASHES])
+    assert array.to_pylist() == [bytes.fromhex(h[2:]) for h in HASHES]
+    assert to_arrow(Address, [ADDRESS]).to_pylist() == [bytes.fromhex(ADDRESS[2:])]
+
+
+def test_decimal():
+    values = [HexInt32(0), HexInt32(2**200)]
+    array = to_arrow(HexInt32, values, int_format="decimal")
+    assert array.type == pa.decimal256(76, 0)
+    assert from_arrow(HexInt32, array) == values
+    with pytest.raises(pa.ArrowInvalid):
+        to_arrow(HexInt32, [HexInt32(2**256 - 1)], int_format="decimal")
+
+    amounts = [HexInt(10**20), None]
+    array = to_arrow(HexInt, amounts, int_format="decimal")
+    assert from_arrow(HexInt, array) == amounts
+
+
+def test_from_arrow_type_mismatch():
+    with pytest.raises(TypeError):
+        from_arrow(HexBytes32, pa.array([b"\x01" * 20], type=pa.binary(20)))
+
+
+def test_record_batch():
+    logs = make_logs(4)
+    batch = to_record_batch(logs)
+    assert batch.num_rows == 4
+    assert batch.schema.field("address").type == pa.binary(20)
+    assert batch.schema.field("value").type == pa.binary(32)
+    assert batch.schema.field("topics").type == pa.list_(pa.binary(32))
+    assert batch.schema.field("hashes").type == pa.list_(pa.binary(32))
+    assert batch.schema.field("log_index").type == pa.int64()
+    assert batch.column("transaction_hash").null_count == 2
+    assert from_record_batch(Log, batch) == logs
+    assert from_record_batch(Log, pa.Table.from_batches([batch, batch])) == logs * 2
+
+
+def test_record_batch_abi():
+    transfers = [
+        Transfer(token=ADDRESS, topic=HASHES[0], amount=2**256 - 1, delta=-(2**127)),
+        Transfer(token=ADDRESS.lower(), topic=HASHES[1], amount=2**63),
+    ]
+    batch = to_record_batch(transfers)
+    assert batch.schema.field("token").type == pa.binary(20)
+    assert batch.schema.field("topic").type == pa.binary(32)
+    assert batch.schema.field("amount").type == pa.binary(32)
+    assert batch.schema.field("delta").type == pa.binary(16)
+    actual = from_record_batch(Transfer, batch)
+    assert actual == transfers
+    assert type(actual[0].amount) is int  # type: ignore[attr-defined]
+
+    decimal = to_record_batch(transfers[1:], int_format="decimal")
+    assert decimal.schema.field("amount").type == pa.decimal256(76, 0)
+    assert from_record_batch(Transfer, decimal) == transfers[1:]
+
+
+def test_record_batch_hex_int():
+    class Payment(BaseModel):
+        amount: HexInt
+
+    payments = [Payment(amount=10**20), Payment(amount=1)]
+    batch = to_record_batch(payments)
+    assert batch.schema.field("amount").type == pa.binary()
+    assert from_record_batch(Payment, batch) == payments
+
+
+def test_record_batch_empty():
+    batch = to_record_batch([], model_type=Log)
+    assert batch.num_rows == 0
+    assert from_record_batch(Log, batch) == []
+    with pytest.raises(ValueError):
+        to_record_batch([])
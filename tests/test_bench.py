@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from eth_pydantic_types.bench import compare, get_names, run
+from eth_pydantic_types.bench.__main__ import main
+from eth_pydantic_types.bench.logs import _measure_peak, write_raw_logs
+
+
+@pytest.fixture(scope="module")
+def results():
+    return run("validate.*.HexBytes32.*", min_time=0.0001, repeat=1)
+
+
+def test_get_names():
+    names = get_names()
+    assert "validate.python.HexBytes32.str" in names
+    assert "validate.json.Address.str-no-0x" in names
+    assert "dump.json.HexInt32" in names
+
+    # Bytes inputs have no JSON representation.
+    assert "validate.json.HexBytes32.bytes" not in names
+
+
+def test_run(results):
+    names = [r["name"] for r in results["results"]]
+    assert names
+    assert all(".HexBytes32." in n for n in names)
+    for result in results["results"]:
+        assert result["ns_per_op"] > 0
+        assert result["ops_per_sec"] > 0
+
+    assert results["meta"]["python"]
+
+
+def test_compare(results):
+    baseline = json.loads(json.dumps(results))
+    first = baseline["results"][0]
+    first["ns_per_op"] = first["ns_per_op"] / 2
+
+    rows = compare(results, baseline, threshold=0.5)
+    assert len(rows) == len(results["results"])
+    assert [r["name"] for r in rows if r["regression"]] == [first["name"]]
+
+
+def test_cli(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["-k", "dump.json.HexInt32", "--min-time", "0.0001", "--repeat", "1"]
+    assert main([*args, "--output", str(output)]) == 0
+    assert "dump.json.HexInt32" in capsys.readouterr().out
+
+    saved = json.loads(output.read_text())
+    saved["results"][0]["ns_per_op"] /= 1000
+    output.write_text(json.dumps(saved))
+    assert main([*args, "--baseline", str(output)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_measure_peak(tmp_path):
+    path = tmp_path / "logs.json"
+    with open(path, "w") as file:
+        write_raw_logs(file, 5000)
+
+    stream_peak_mb, stream_s = _measure_peak("stream_logs", path)
+    load_peak_mb, load_s = _measure_peak("load_logs", path)
+    assert 0 < stream_peak_mb < load_peak_mb
+    assert stream_s > 0
+    assert load_s > 0
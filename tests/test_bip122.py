@@ -1,5 +1,6 @@
 import pytest
 from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticCustomError
 
 from eth_pydantic_types.bip122 import Bip122Uri, Bip122UriType
 
@@ -20,12 +21,47 @@ def test_parsed():
     assert uri.uri_type == Bip122UriType.BLOCK
     assert uri.chain == f"0x{GENESIS_HASH}"
     assert uri.hash == f"0x{BLOCK_HASH}"
+    assert not hasattr(uri, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "uri",
+    (
+        EXAMPLE,
+        f"blockchain://0x{GENESIS_HASH}/BLOCK/0x{BLOCK_HASH.upper()}",
+        f"blockchain://{GENESIS_HASH.upper()}/Block/{BLOCK_HASH}",
+    ),
+)
+def test_normalizes(uri):
+    assert Model(uri=uri).uri == EXAMPLE
+
+
+def test_odd_length_hash():
+    uri = Bip122Uri.__eth_pydantic_validate__(f"blockchain://{GENESIS_HASH}/tx/abc")
+    assert uri == f"blockchain://{GENESIS_HASH}/tx/0abc"
+
+
+def test_parse_many():
+    uris = [EXAMPLE, f"blockchain://{GENESIS_HASH}/TX/0x{BLOCK_HASH}"]
+    actual = Bip122Uri.parse_many(uris)
+    assert actual == [EXAMPLE, f"blockchain://{GENESIS_HASH}/tx/{BLOCK_HASH}"]
+    assert all(isinstance(uri, Bip122Uri) for uri in actual)
+    assert actual[1].parsed == (f"0x{GENESIS_HASH}", Bip122UriType.TX, f"0x{BLOCK_HASH}")
+
+
+def test_parse_many_invalid():
+    with pytest.raises(PydanticCustomError):
+        Bip122Uri.parse_many([EXAMPLE, "foo"])
 
 
 @pytest.mark.parametrize(
     "uri",
     (
         "foo",
+        123,
+        f"blockchain://blockchain://{GENESIS_HASH}/block/{BLOCK_HASH}",
+        f"blockchain://{GENESIS_HASH}/block/{BLOCK_HASH}/",
+        f"blockchain://{GENESIS_HASH}/blocks/{BLOCK_HASH}",
         f"blockchain://foo/block/{BLOCK_HASH}",
         f"blockchain://{GENESIS_HASH}/block/foo",
         f"blockchain://{GENESIS_HASH}/tx/foo",
@@ -0,0 +1,172 @@
+from typing import ClassVar
+
+import pytest
+from pydantic import BaseModel
+
+from eth_pydantic_types import abi
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.codec import decode_abi, encode_abi, get_layout
+from eth_pydantic_types.hex import BoundHexInt, HexBytes, HexBytes32, HexInt32
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Transfer(BaseModel):
+    to: abi.address
+    amount: abi.uint256
+
+
+class Mixed(BaseModel):
+    selector: abi.bytes4
+    name: abi.string
+    deltas: list[abi.int8]
+    flag: abi.bool
+    data: abi.bytes
+
+
+def words(hex_str: str) -> list[str]:
+    return [hex_str[i : i + 64] for i in range(0, len(hex_str), 64)]
+
+
+def test_encode_static():
+    model = Transfer(to=ADDRESS, amount=10**18)
+    actual = encode_abi(model)
+    assert actual.hex() == (
+        "0000000000000000000000000837207e343277cbd6c114a45ec0e9ec56a1ad84"
+        "0000000000000000000000000000000000000000000000000de0b6b3a7640000"
+    )
+
+
+def test_encode_dynamic():
+    model = Mixed(selector="0xa9059cbb", name="hello", deltas=[1, -2], flag=True, data=b"\x01\x02")
+    actual = encode_abi(model)
+    assert words(actual.hex()) == [
+        # Head.
+        "a9059cbb" + "0" * 56,
+        f"{0xA0:064x}",  # Offset of name.
+        f"{0xE0:064x}",  # Offset of deltas.
+        f"{1:064x}",
+        f"{0x140:064x}",  # Offset of data.
+        # Tail.
+        f"{5:064x}",
+        "68656c6c6f" + "0" * 54,
+        f"{2:064x}",
+        f"{1:064x}",
+        "f" * 63 + "e",
+        f"{2:064x}",
+        "0102" + "0" * 60,
+    ]
+
+
+def test_encode_hex_types():
+    class Int64(BoundHexInt):
+        size: ClassVar[int] = 8
+        signed: ClassVar[bool] = True
+
+    class HexModel(BaseModel):
+        owner: Address
+        value: HexInt32
+        delta: Int64
+        key: HexBytes32
+        data: HexBytes
+
+    model = HexModel(owner=ADDRESS, value=1, delta=-1, key=2, data="0x03")
+    assert words(encode_abi(model).hex()) == [
+        ADDRESS[2:].lower().rjust(64, "0"),
+        f"{1:064x}",
+        "f" * 64,
+        f"{2:064x}",
+        f"{0xA0:064x}",
+        f"{1:064x}",
+        "03" + "0" * 62,
+    ]
+
+
+def test_layout_cached():
+    assert get_layout(Transfer) is get_layout(Transfer)
+
+
+def test_unsupported_field_type():
+    class Unsupported(BaseModel):
+        value: int
+
+    with pytest.raises(TypeError):
+        encode_abi(Unsupported(value=1))
+
+
+def test_out_of_range():
+    model = Transfer.model_construct(to=Address(ADDRESS), amount=-1)
+    with pytest.raises(ValueError):
+        encode_abi(model)
+
+
+def test_decode_static():
+    model = Transfer(to=ADDRESS, amount=10**18)
+    actual = decode_abi(Transfer, encode_abi(model))
+    assert actual == model
+    assert actual.to == ADDRESS
+
+    # Hex strings work too.
+    assert decode_abi(Transfer, f"0x{encode_abi(model).hex()}") == model
+
+
+def test_decode_dynamic():
+    model = Mixed(selector="0xa9059cbb", name="héllo", deltas=[1, -2], flag=True, data=b"\x01\x02")
+    actual = decode_abi(Mixed, memoryview(encode_abi(model)))
+    assert actual == model
+    assert type(actual.selector) is abi.bytes4
+    assert type(actual.data) is HexBytes
+
+
+def test_decode_hex_types():
+    class HexModel(BaseModel):
+        owner: Address
+        value: HexInt32
+        key: HexBytes32
+        data: HexBytes
+
+    model = HexModel(owner=ADDRESS, value=1, key=2, data="0x03")
+    assert decode_abi(HexModel, encode_abi(model)) == model
+
+
+def test_decode_address_subclass():
+    class LowerAddress(Address):
+        @classmethod
+        def to_checksum_address(cls, value):
+            return value.lower()
+
+    class LowerModel(BaseModel):
+        owner: LowerAddress
+
+    data = bytes(12) + bytes.fromhex(ADDRESS[2:])
+    assert decode_abi(LowerModel, data).owner == ADDRESS.lower()
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        # Too short.
+        "00" * 32,
+        # Address with dirty upper bytes.
+        "ff" * 32 + "00" * 32,
+        # Dynamic offset past the end.
+        "00" * 32 * 4 + f"{0xFFFF:064x}" + "00" * 32 * 6,
+    ),
+    ids=("short", "dirty-address", "bad-offset"),
+)
+def test_decode_invalid(data):
+    model_cls = Mixed if len(data) > 128 else Transfer
+    with pytest.raises(ValueError):
+        decode_abi(model_cls, data)
+
+
+def test_decode_out_of_range():
+    class Small(BaseModel):
+        value: abi.uint8
+        flag: abi.bool
+
+    with pytest.raises(ValueError):
+        decode_abi(Small, f"{256:064x}{0:064x}")
+
+    with pytest.raises(ValueError):
+        decode_abi(Small, f"{1:064x}{2:064x}")
@@ -0,0 +1,75 @@
+from pydantic import BaseModel
+
+from eth_pydantic_types import instrumentation
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex import HexBytes32, HexInt32, HexStr32
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASH = f"0x{'ab' * 32}"
+
+
+class Model(BaseModel):
+    address: Address
+    hash: HexBytes32
+    hash_str: HexStr32
+    number: HexInt32
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    Model(address=ADDRESS, hash=HASH, hash_str=HASH, number=1)
+    assert instrumentation.snapshot() == {}
+
+
+def test_collect():
+    Address.checksum_cache.clear()
+    with instrumentation.collect() as collector:
+        assert instrumentation.is_enabled()
+        Model(address=ADDRESS.lower(), hash=HASH, hash_str=HASH, number=1)
+        Model(address=ADDRESS.lower(), hash=b"\x01", hash_str=1, number="0x1b4")
+
+    assert not instrumentation.is_enabled()
+    actual = collector.snapshot()
+    assert actual["Address"]["calls"] == 2
+    assert actual["Address"]["kinds"] == {"str": 2}
+    assert actual["Address"]["events"] == {"checksum": 1, "checksum.cached": 1}
+    assert actual["BoundHexBytes"]["kinds"] == {"str": 1, "bytes": 1}
+    assert actual["BoundHexBytes"]["events"] == {"coerce.to_bytes": 1, "coerce.bytes_size": 1}
+    assert actual["BoundHexStr"]["events"] == {"coerce.int_to_hex": 1, "coerce.str_size": 1}
+    assert actual["HexInt32"]["kinds"] == {"int": 1, "str": 1}
+    assert actual["HexInt32"]["events"] == {"coerce.hex_to_int": 1}
+    assert all(stats["time_ns"] > 0 for stats in actual.values())
+
+
+def test_instance_kind():
+    value = HexBytes32(b"\x01" * 32)
+    with instrumentation.collect() as collector:
+        HexBytes32.__eth_pydantic_validate__(value)
+
+    assert collector.snapshot()["BoundHexBytes"]["kinds"] == {"instance": 1}
+
+
+def test_enable_disable():
+    collector = instrumentation.enable()
+    try:
+        HexInt32.__eth_pydantic_validate__(5)
+        assert instrumentation.snapshot() == collector.snapshot()
+        assert collector.snapshot()["HexInt32"]["calls"] == 1
+        collector.reset()
+        assert collector.snapshot() == {}
+    finally:
+        instrumentation.disable()
+
+    assert not instrumentation.is_enabled()
+
+
+def test_nested_collect():
+    with instrumentation.collect() as outer:
+        HexInt32.__eth_pydantic_validate__(5)
+        with instrumentation.collect() as inner:
+            HexInt32.__eth_pydantic_validate__(6)
+
+        HexInt32.__eth_pydantic_validate__(7)
+
+    assert outer.snapshot()["HexInt32"]["calls"] == 2
+    assert inner.snapshot()["HexInt32"]["calls"] == 1
@@ -0,0 +1,58 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex import HexBytes, HexBytes20, HexBytes32, HexInt32, HexStr, HexStr32
+from eth_pydantic_types.parallel import validate_parallel
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize(
+    "type_,values",
+    (
+        (HexBytes32, [f"0x{i:064x}" for i in range(20)] + [b"\x01", 5]),
+        (HexBytes20, ["0x01", b"\x02" * 20, 3]),
+        (HexBytes, ["0x", "0x0102", b"\x03", 4]),
+        (HexStr32, ["0x01", b"\x02", 3]),
+        (HexStr, ["0x01", b"\x02", 3]),
+        (HexInt32, [0, 1, "0x1b4", 2**256 - 1, b"\x05"]),
+        (Address, [ADDRESS, ADDRESS.lower(), 1, b"\x01" * 20]),
+    ),
+)
+def test_validate_parallel(executor, type_, values):
+    actual = validate_parallel(type_, values, chunk_size=3, executor=executor)
+    expected = [type_.__eth_pydantic_validate__(v) for v in values]
+    assert actual.values == expected
+    assert [type(v) for v in actual.values] == [type(v) for v in expected]
+    assert actual.errors == {}
+
+
+def test_validate_parallel_errors(executor):
+    values = iter(["0x01", "0xzz", 2**256, "0x02", None])
+    result, errors = validate_parallel(HexBytes32, values, chunk_size=2, executor=executor)
+    assert result == [b"\x01".ljust(32, b"\x00"), None, None, b"\x02".ljust(32, b"\x00"), None]
+    assert sorted(errors) == [1, 2, 4]
+    assert all(isinstance(e, ValueError) for e in errors.values())
+
+
+def test_validate_parallel_workers():
+    values = [f"0x{i:040x}" for i in range(10)]
+    actual = validate_parallel(Address, values, workers=2, chunk_size=4)
+    assert actual.values == [Address.__eth_pydantic_validate__(v) for v in values]
+
+
+def test_validate_parallel_empty(executor):
+    assert validate_parallel(HexBytes32, [], executor=executor) == ([], {})
+
+
+def test_validate_parallel_unsupported():
+    with pytest.raises(TypeError, match="Unsupported type"):
+        validate_parallel(int, [1])
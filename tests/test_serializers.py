@@ -0,0 +1,114 @@
+from typing import ClassVar
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import BaseModel
+
+from eth_pydantic_types.hex import HexBytes, HexBytes32, HexInt, HexInt32
+from eth_pydantic_types.serializers import (
+    SerializationMode,
+    _serialize_hex,
+    create_hex_serializer,
+    get_hex_serializer,
+    serialize_hex,
+)
+from eth_pydantic_types.utils import PadDirection
+
+SIGNATURES = (
+    (None, None, None),
+    (None, None, True),
+    (None, None, False),
+    (32, PadDirection.LEFT, False),
+    (8, PadDirection.LEFT, None),
+    (4, PadDirection.RIGHT, True),
+)
+
+
+@pytest.mark.parametrize(
+    "value,kwargs,expected",
+    (
+        (10, {}, "0xa"),
+        (10, {"force_even_length": True}, "0x0a"),
+        (b"\x0a", {}, "0x0a"),
+        (10, {"size": 4, "pad": PadDirection.LEFT, "force_even_length": False}, "0x0000000a"),
+        (10, {"size": 4, "pad": PadDirection.RIGHT, "force_even_length": False}, "0x0a000000"),
+        (b"\x0a", {"size": 2, "pad": PadDirection.LEFT, "force_even_length": False}, "0x000a"),
+    ),
+)
+def test_serialize_hex(value, kwargs, expected):
+    assert serialize_hex(value, **kwargs) == expected
+
+
+@pytest.mark.parametrize("signature", SIGNATURES)
+@given(value=st.one_of(st.integers(min_value=0, max_value=2**260), st.binary(max_size=40)))
+def test_matches_general_path(signature, value):
+    size, pad, force_even_length = signature
+    if pad is not None and force_even_length is not None:
+        force_even_length = True
+
+    try:
+        expected = _serialize_hex(value, size=size, pad=pad, force_even_length=force_even_length)
+    except ValueError:
+        with pytest.raises(ValueError):
+            get_hex_serializer(*signature)(value)
+    else:
+        assert get_hex_serializer(*signature)(value) == expected
+
+
+def test_serializers_are_shared():
+    signature = (32, PadDirection.LEFT, False)
+    assert get_hex_serializer(*signature) is get_hex_serializer(*signature)
+    assert create_hex_serializer(*signature) is create_hex_serializer(*signature)
+
+
+class NativeHexBytes(HexBytes):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.NATIVE
+
+
+class NativeHexInt32(HexInt32):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.NATIVE
+
+
+class ContextHexBytes32(HexBytes32):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.CONTEXT
+
+
+class ContextHexInt(HexInt):
+    serialization_mode: ClassVar[SerializationMode] = SerializationMode.CONTEXT
+
+
+class NativeModel(BaseModel):
+    data: NativeHexBytes
+    value: NativeHexInt32
+
+
+class ContextModel(BaseModel):
+    data: ContextHexBytes32
+    value: ContextHexInt
+
+
+def test_native_mode():
+    model = NativeModel(data="0x0102", value="0x1b4")
+    actual = model.model_dump()
+    assert actual == {"data": b"\x01\x02", "value": 436}
+    assert isinstance(actual["data"], bytes)
+    assert isinstance(actual["value"], int)
+    assert model.model_dump(mode="json") == {"data": "0x0102", "value": f"0x{436:064x}"}
+    assert model.model_dump_json() == f'{{"data":"0x0102","value":"0x{436:064x}"}}'
+
+
+@pytest.mark.parametrize("context", (None, {}, {"hex_serialization": "hex"}))
+def test_context_mode_defaults_to_hex(context):
+    model = ContextModel(data=b"\x01" * 32, value=10)
+    actual = model.model_dump(context=context)
+    assert actual == {"data": f"0x{'01' * 32}", "value": "0xa"}
+
+
+def test_context_mode_native():
+    model = ContextModel(data=b"\x01" * 32, value=10)
+    context = {"hex_serialization": SerializationMode.NATIVE}
+    assert model.model_dump(context=context) == {"data": b"\x01" * 32, "value": 10}
+    # JSON is always hex.
+    actual = model.model_dump_json(context=context)
+    assert actual == f'{{"data":"0x{"01" * 32}","value":"0xa"}}'
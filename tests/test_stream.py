@@ -0,0 +1,227 @@
+import asyncio
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex import HexBytes32, HexInt
+from eth_pydantic_types.stream import avalidate_stream, iter_json_array, validate_stream
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Log(BaseModel):
+    address: Address
+    topics: list[HexBytes32]
+    blockNumber: HexInt
+
+
+LOGS = [
+    {"address": ADDRESS.lower(), "topics": [f"0x{i:064x}"], "blockNumber": hex(i)}
+    for i in range(25)
+]
+RESPONSE = json.dumps({"jsonrpc": "2.0", "id": 1, "result": LOGS}, indent=2)
+
+
+class ChunkedSource:
+    """A binary source returning the given chunks, one per read."""
+
+    def __init__(self, *chunks: bytes):
+        self.chunks = list(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+@pytest.mark.parametrize("read_size", (1, 3, 64, 65536))
+@pytest.mark.parametrize(
+    "make_source",
+    (
+        lambda: RESPONSE,
+        lambda: RESPONSE.encode(),
+        lambda: io.BytesIO(RESPONSE.encode()),
+        lambda: io.StringIO(RESPONSE),
+    ),
+)
+def test_iter_json_array(make_source, read_size):
+    assert list(iter_json_array(make_source(), read_size=read_size)) == LOGS
+
+
+@pytest.mark.parametrize("read_size", (1, 2, 5))
+def test_iter_json_array_scalars(read_size):
+    # Numbers and multi-byte characters may be split across reads.
+    items = [123456789, -1.5e10, True, None, "é€✓" * 3, {"a": [1, 2]}]
+    for document in (json.dumps(items), json.dumps(items, ensure_ascii=False)):
+        source = io.BytesIO(document.encode())
+        assert list(iter_json_array(source, read_size=read_size)) == items
+
+
+def test_iter_json_array_split_numbers():
+    # The number pattern matches ``1`` of ``1.``, so it must wait for the fraction.
+    source = ChunkedSource(b"[1.", b"5, 2e", b"-3, 4E", b"+5]")
+    assert list(iter_json_array(source)) == [1.5, 2e-3, 4e5]  # type: ignore[arg-type]
+
+
+def test_iter_json_array_invalid_fails_fast():
+    # An invalid item is reported straight away, not after reading the whole source.
+    source = io.BytesIO(b'[{"a" 1}, ' + b"0, " * 100_000 + b"0]")
+    with pytest.raises(ValueError, match="Expecting ':' delimiter"):
+        list(iter_json_array(source, read_size=64))
+
+    assert source.tell() == 64
+
+
+@pytest.mark.parametrize("document", ("[]", " [ ] ", '{"result": []}', '{"id": 1, "result": [ ]}'))
+def test_iter_json_array_empty(document):
+    assert list(iter_json_array(document)) == []
+
+
+def test_iter_json_array_key():
+    assert list(iter_json_array('{"logs": [1, 2], "result": [3]}', key="logs")) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "document,message",
+    (
+        ('{"jsonrpc": "2.0", "id": 1, "error": {"code": -32000}}', "JSON-RPC error"),
+        ('{"jsonrpc": "2.0", "id": 1}', "Key 'result' not found"),
+        ("{}", "Key 'result' not found"),
+        ('{"result": 5}', "to be an array"),
+        ('"result"', "Expecting"),
+        ("[1 2]", "Expecting ',' or ']'"),
+        ("[1, 2", "Expecting ',' or ']'"),
+        ("[1,", "Expecting value"),
+    ),
+)
+def test_iter_json_array_invalid(document, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array(document))
+
+
+def test_validate_stream():
+    actual = list(validate_stream(Log, io.BytesIO(RESPONSE.encode()), read_size=100))
+    assert len(actual) == len(LOGS)
+    assert all(isinstance(log, Log) for log in actual)
+    assert actual[3].address == ADDRESS
+    assert actual[3].topics == [(3).to_bytes(32, "big")]
+    assert actual[3].blockNumber == 3
+
+
+def test_validate_stream_chunks():
+    chunks = list(validate_stream(Log, RESPONSE, chunk_size=10))
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    assert [log.blockNumber for chunk in chunks for log in chunk] == list(range(25))
+
+
+def test_validate_stream_array():
+    source = json.dumps([f"0x{i:064x}" for i in range(3)])
+    actual = list(validate_stream(HexBytes32, source))
+    assert actual == [i.to_bytes(32, "big") for i in range(3)]
+    assert all(isinstance(v, HexBytes32) for v in actual)
+
+
+def test_validate_stream_is_lazy():
+    document = '{"result": [{"address": "%s", "topics": [], "blockNumber": 1}, {"foo": 1}]}'
+    items = validate_stream(Log, document % ADDRESS)
+    assert next(items).blockNumber == 1
+    with pytest.raises(ValidationError):
+        next(items)
+
+
+async def collect(items) -> list:
+    return [item async for item in items]
+
+
+async def aiter_logs(logs):
+    for log in logs:
+        await asyncio.sleep(0)
+        yield log
+
+
+@pytest.mark.parametrize("chunk_size", (1, 7, 100))
+def test_avalidate_stream(chunk_size):
+    actual = asyncio.run(collect(avalidate_stream(Log, aiter_logs(LOGS), chunk_size=chunk_size)))
+    assert [log.blockNumber for log in actual] == list(range(25))
+    assert all(isinstance(log, Log) for log in actual)
+    assert actual[3].address == ADDRESS
+
+
+def test_avalidate_stream_iterable():
+    actual = asyncio.run(collect(avalidate_stream(HexBytes32, ["0x01", b"\x02"], chunk_size=1)))
+    assert actual == [b"\x01".ljust(32, b"\x00"), b"\x02".ljust(32, b"\x00")]
+
+
+def test_avalidate_stream_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        items = avalidate_stream(Log, LOGS, executor=executor, chunk_size=10)
+        actual = asyncio.run(collect(items))
+
+    assert len(actual) == len(LOGS)
+
+
+def test_avalidate_stream_invalid():
+    with pytest.raises(ValidationError):
+        asyncio.run(collect(avalidate_stream(Log, [*LOGS, {"foo": 1}])))
+
+
+def test_avalidate_stream_source_error():
+    async def failing():
+        yield LOGS[0]
+        raise RuntimeError("disconnected")
+
+    with pytest.raises(RuntimeError, match="disconnected"):
+        asyncio.run(collect(avalidate_stream(Log, failing())))
+
+
+def test_avalidate_stream_backpressure():
+    read = 0
+
+    async def source():
+        nonlocal read
+        for log in LOGS:
+            read += 1
+            yield log
+
+    async def take_one():
+        items = avalidate_stream(Log, source(), chunk_size=2, max_pending=1)
+        await items.__anext__()
+        await asyncio.sleep(0.01)
+        count = read
+        await items.aclose()
+        return count
+
+    # The chunk being consumed, one queued and one waiting to be queued.
+    assert asyncio.run(take_one()) <= 6
+
+
+def test_avalidate_stream_max_pending():
+    release = threading.Event()
+    submitted = 0
+
+    def blocked(fn, *args):
+        release.wait()
+        return fn(*args)
+
+    class BlockingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            nonlocal submitted
+            submitted += 1
+            return super().submit(blocked, fn, *args, **kwargs)
+
+    async def count_submitted() -> int:
+        with BlockingExecutor(max_workers=4) as executor:
+            items = avalidate_stream(Log, LOGS, chunk_size=1, executor=executor, max_pending=2)
+            first = asyncio.ensure_future(items.__anext__())
+            await asyncio.sleep(0.05)
+            count = submitted
+            release.set()
+            await first
+            await items.aclose()
+            return count
+
+    # No more than ``max_pending`` chunks are handed to the executor.
+    assert asyncio.run(count_submitted()) == 2
@@ -0,0 +1,121 @@
+import random
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+np = pytest.importorskip("numpy")
+
+from eth_pydantic_types.array import UInt256Array  # noqa: E402
+from eth_pydantic_types.hex import HexInt32  # noqa: E402
+from eth_pydantic_types.uint256 import MAX_UINT256, UInt256Column  # noqa: E402
+
+# Values around the limb boundaries, where carries and borrows happen.
+EDGES = [0, 1, 2**64 - 1, 2**64, 2**128 - 1, 2**128, 2**192, MAX_UINT256 - 1, MAX_UINT256]
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(0)
+    return EDGES + [rng.getrandbits(rng.choice((8, 64, 65, 200, 256))) for _ in range(200)]
+
+
+class Balances(BaseModel):
+    amounts: UInt256Column
+
+
+def test_from_values(values):
+    column = UInt256Column.from_values(values)
+    assert len(column) == len(values)
+    assert column.limbs.shape == (len(values), 4)
+    assert column.tolist() == values
+    assert all(type(v) is HexInt32 for v in column)
+    assert column[-1] == values[-1]
+    assert UInt256Column.from_values(["0x1b4", b"\x05"]).tolist() == [0x1B4, 5]
+
+
+def test_from_values_invalid():
+    with pytest.raises(ValueError):
+        UInt256Column.from_values([MAX_UINT256 + 1])
+
+    with pytest.raises(ValueError):
+        UInt256Column.from_values([-1])
+
+
+def test_words(values):
+    words = b"".join(v.to_bytes(32, "big") for v in values)
+    column = UInt256Column.from_words(words)
+    assert column.tolist() == values
+    assert column.to_words() == words
+    assert UInt256Column.from_array(UInt256Array(values)).to_array() == UInt256Array(values)
+    with pytest.raises(ValueError):
+        UInt256Column.from_words(b"\x00" * 33)
+
+
+def test_add(values):
+    other = list(reversed(values))
+    result, overflow = UInt256Column.from_values(values).overflowing_add(
+        UInt256Column.from_values(other)
+    )
+    expected = [a + b for a, b in zip(values, other)]
+    assert result.tolist() == [v % 2**256 for v in expected]
+    assert overflow.tolist() == [v > MAX_UINT256 for v in expected]
+
+
+def test_sub(values):
+    other = list(reversed(values))
+    result, underflow = UInt256Column.from_values(values).overflowing_sub(
+        UInt256Column.from_values(other)
+    )
+    expected = [a - b for a, b in zip(values, other)]
+    assert result.tolist() == [v % 2**256 for v in expected]
+    assert underflow.tolist() == [v < 0 for v in expected]
+
+
+def test_operators():
+    column = UInt256Column.from_values([1, 2**64 - 1])
+    assert (column + 1).tolist() == [2, 2**64]
+    assert (1 + column).tolist() == [2, 2**64]
+    assert (column - 1).tolist() == [0, 2**64 - 2]
+    assert (2**64 - column).tolist() == [2**64 - 1, 1]
+    with pytest.raises(OverflowError, match="index 0"):
+        _ = column - 2
+
+    with pytest.raises(OverflowError, match="index 1"):
+        _ = column + (MAX_UINT256 - 1)
+
+
+def test_compare(values):
+    other = list(reversed(values))
+    a, b = UInt256Column.from_values(values), UInt256Column.from_values(other)
+    assert (a < b).tolist() == [x < y for x, y in zip(values, other)]
+    assert (a <= b).tolist() == [x <= y for x, y in zip(values, other)]
+    assert (a > b).tolist() == [x > y for x, y in zip(values, other)]
+    assert (a >= b).tolist() == [x >= y for x, y in zip(values, other)]
+    assert (a == b).tolist() == [x == y for x, y in zip(values, other)]
+    assert (a != b).tolist() == [x != y for x, y in zip(values, other)]
+    assert a[a > 2**128].tolist() == [v for v in values if v > 2**128]
+
+
+def test_aggregations(values):
+    column = UInt256Column.from_values(values[:-1])
+    assert column.min() == min(values[:-1])
+    assert column.max() == max(values[:-1])
+    assert column.argmax() == values.index(max(values[:-1]))
+    assert UInt256Column.from_values([5, 2**64 + 1, 1, 1]).argmin() == 2
+    assert UInt256Column.from_values([2**200] * 100).sum() == 100 * 2**200
+    small = [v >> 8 for v in values]
+    assert UInt256Column.from_values(small).sum() == sum(small)
+    with pytest.raises(OverflowError):
+        UInt256Column.from_values(values).sum()
+
+    with pytest.raises(ValueError):
+        UInt256Column().max()
+
+
+def test_model():
+    balances = Balances(amounts=["0x01", 2**64])
+    assert isinstance(balances.amounts, UInt256Column)
+    assert balances.model_dump(mode="json")["amounts"] == [f"0x{1:064x}", f"0x{2**64:064x}"]
+    assert Balances.model_validate_json(balances.model_dump_json()).amounts.tolist() == [1, 2**64]
+    with pytest.raises(ValidationError):
+        Balances(amounts=[-1])
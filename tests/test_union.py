@@ -0,0 +1,127 @@
+import warnings
+
+import hexbytes
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from eth_pydantic_types import abi
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hex import HexBytes, HexBytes20, HexBytes32, HexInt, HexStr32
+from eth_pydantic_types.union import hex_union
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASH = f"0x{'ab' * 32}"
+
+
+class Model(BaseModel):
+    data: hex_union(HexBytes, int, None)  # type: ignore[valid-type]
+    target: hex_union(Address, HexStr32)  # type: ignore[valid-type]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, None),
+        (5, 5),
+        ("0x01", b"\x01"),
+        (b"\x01\x02", b"\x01\x02"),
+        (bytearray(b"\x01\x02"), b"\x01\x02"),
+    ),
+)
+def test_dispatch_on_kind(value, expected):
+    actual = Model(data=value, target=ADDRESS).data
+    assert actual == expected
+    assert isinstance(actual, HexBytes if isinstance(expected, bytes) else type(expected))
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (ADDRESS.lower(), ADDRESS),
+        (ADDRESS[2:].lower(), ADDRESS),
+        (HASH, HASH),
+        (HASH[2:], HASH),
+        (bytes.fromhex(ADDRESS[2:]), ADDRESS),
+        (bytes.fromhex(HASH[2:]), HASH),
+    ),
+)
+def test_dispatch_on_size(value, expected):
+    assert Model(data=None, target=value).target == expected
+
+
+@pytest.mark.parametrize("value", (f"0x{'a' * 63}", "a" * 63))
+def test_dispatch_on_size_odd_length(value):
+    class OddModel(BaseModel):
+        value: hex_union(HexBytes20, HexBytes32)  # type: ignore[valid-type]
+
+    actual = OddModel(value=value).value
+    assert isinstance(actual, HexBytes32)
+    assert actual == bytes.fromhex(f"0{'a' * 63}")
+
+
+def test_dispatch_on_size_across_kinds():
+    class AbiModel(BaseModel):
+        value: hex_union(abi.address, abi.bytes32, abi.uint256)  # type: ignore[valid-type]
+
+    assert AbiModel(value=ADDRESS).value == ADDRESS
+    assert AbiModel(value=HASH).value == bytes.fromhex(HASH[2:])
+    assert AbiModel(value=5).value == 5
+
+
+@pytest.mark.parametrize("value", (1.5, [1], {"a": 1}))
+def test_unsupported_kind(value):
+    with pytest.raises(ValidationError) as err:
+        Model(data=value, target=ADDRESS)
+
+    assert err.value.errors()[0]["type"] == "union_tag_not_found"
+
+
+def test_invalid_member_value():
+    with pytest.raises(ValidationError) as err:
+        Model(data=None, target="hello")
+
+    # Only the picked member reports an error.
+    assert [e["type"] for e in err.value.errors()] == ["HexValueError"]
+
+
+def test_json():
+    model = Model.model_validate_json(f'{{"data": "0x01", "target": "{HASH}"}}')
+    assert model.data == b"\x01"
+    assert model.target == HASH
+
+
+def test_unsupported_member():
+    with pytest.raises(TypeError):
+        hex_union(HexBytes32, list[int])
+
+
+def test_int_members():
+    class IntModel(BaseModel):
+        value: hex_union(HexInt, HexBytes32)  # type: ignore[valid-type]
+
+    assert IntModel(value=5).value == 5
+    assert IntModel(value=HASH).value == bytes.fromhex(HASH[2:])
+
+
+def test_validated_values():
+    class HexModel(BaseModel):
+        data: hex_union(HexBytes, int, None)  # type: ignore[valid-type]
+        target: hex_union(Address, HexStr32)  # type: ignore[valid-type]
+        key: hex_union(HexBytes20, HexBytes32)  # type: ignore[valid-type]
+        number: hex_union(HexInt, HexBytes32)  # type: ignore[valid-type]
+
+    model = HexModel(data="0x01", target=HASH, key=HASH, number=5)
+    assert type(model.key) is HexBytes32
+
+    # Already-validated values (subclasses of the input kinds) are routed too.
+    assert HexModel(**dict(model)) == model
+    other = HexModel(
+        data=hexbytes.HexBytes("0x01"), target=HexStr32(HASH), key=HASH, number=HexInt(5)
+    )
+    assert other == model
+
+    # The discriminator also picks the serializer, so dumping must not warn.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert model.model_dump()["key"] == HASH
+        assert HexModel.model_validate_json(model.model_dump_json()) == model
@@ -0,0 +1,218 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import BaseModel
+
+from eth_pydantic_types import Address, HexBytes32, HexStr32
+from eth_pydantic_types.hex import HexInt
+from eth_pydantic_types.utils import (
+    InternPool,
+    LRUCache,
+    PadDirection,
+    normalize_hex,
+    validate_in_range,
+)
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASH = f"0x{'ab' * 32}"
+
+
+class Log(BaseModel):
+    address: Address
+    block_hash: HexBytes32
+    transaction_hash: HexStr32
+    block_number: HexInt
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = InternPool()
+    for cls in (Address, HexBytes32, HexStr32, HexInt):
+        monkeypatch.setattr(cls, "intern_pool", pool)
+
+    # Make sure the address is not already checksummed (and pooled) from the cache.
+    Address.checksum_cache.clear()
+    return pool
+
+
+def test_intern():
+    pool = InternPool()
+    first = bytes.fromhex("ab" * 32)
+    assert pool.intern(first) is first
+    assert pool.intern(bytes.fromhex("ab" * 32)) is first
+    assert pool.stats == {"interned": 1, "new": 1, "size": 1}
+
+
+def test_intern_by_type():
+    pool = InternPool()
+    value = HexBytes32(b"\x01" * 32)
+    assert pool.intern(b"\x01" * 32) is not value
+    assert pool.intern(value) is value
+    assert pool.new == 2
+
+
+def test_sweep():
+    pool = InternPool(sweep_size=8)
+    kept = [pool.intern(i.to_bytes(32, "big")) for i in range(4)]
+    for i in range(4, 8):
+        pool.intern(i.to_bytes(32, "big"))
+
+    # Adding the eighth value swept out the unreferenced ones (but that value itself).
+    assert len(pool) == 5
+    pool.sweep()
+    assert len(pool) == 4
+    assert all(pool.intern(i.to_bytes(32, "big")) is kept[i] for i in range(4))
+
+
+def test_clear():
+    pool = InternPool()
+    pool.intern(b"\x01")
+    pool.intern(b"\x01")
+    pool.clear()
+    assert pool.stats == {"interned": 0, "new": 0, "size": 0}
+
+
+def test_models_share_values(pool):
+    data = {"address": ADDRESS.lower(), "block_hash": HASH, "transaction_hash": HASH}
+    logs = [Log(**data, block_number=2**70) for _ in range(3)]
+    for field in Log.model_fields:
+        assert getattr(logs[0], field) is getattr(logs[1], field) is getattr(logs[2], field)
+
+    assert logs[0].address == ADDRESS
+    assert isinstance(logs[0].block_hash, HexBytes32)
+    assert pool.stats == {"interned": 8, "new": 4, "size": 4}
+
+
+def test_checksum_many(pool):
+    first, second = Address.checksum_many([ADDRESS.lower(), ADDRESS.lower()])
+    assert first is second is Address.__eth_pydantic_validate__(ADDRESS)
+
+
+def test_disabled():
+    data = {"address": ADDRESS, "block_hash": HASH, "transaction_hash": HASH}
+    first, second = Log(**data, block_number=2**70), Log(**data, block_number=2**70)
+    assert first.block_hash is not second.block_hash
+    assert first.block_number is not second.block_number
+
+
+@pytest.fixture
+def switch_often():
+    # Switch threads as often as possible to surface races on GIL builds too.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target, count: int = 8):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return [f.result() for f in [executor.submit(target, i) for i in range(count)]]
+
+
+def test_lru_cache_threads(switch_often):
+    cache = LRUCache(maxsize=16)
+
+    def hammer(thread: int):
+        for i in range(2000):
+            key = (thread * i) % 64
+            if (value := cache.get(key)) is not None:
+                assert value == key * 2
+
+            cache.put(key, key * 2)
+
+    run_threads(hammer)
+    assert len(cache) <= 16
+
+
+def test_lru_cache_hit_does_not_wait():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # A hit while another thread changes the cache returns without waiting.
+    with cache._lock:
+        assert cache.get("a") == 1
+
+    # A hit makes the entry the most recently used.
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_intern_pool_threads(switch_often):
+    pool = InternPool(sweep_size=64)
+
+    def intern(_: int):
+        return [pool.intern((i % 100).to_bytes(32, "big")) for i in range(5000)]
+
+    results = run_threads(intern)
+    # Values referenced by every thread's results were never swept: all threads
+    # got the same instance for each of them.
+    for index in range(100):
+        assert len({id(result[index]) for result in results}) == 1
+
+
+@pytest.mark.parametrize(
+    "value,size,signed",
+    ((2**255 - 1, 32, True), (-(2**255), 32, True), (2**256 - 1, 32, False), (127, 1, True)),
+)
+def test_validate_in_range(value, size, signed):
+    assert validate_in_range(value, size, signed) == value
+
+
+@pytest.mark.parametrize(
+    "value,size,signed",
+    ((2**255, 32, True), (-(2**255) - 1, 32, True), (-1, 32, False), (128, 1, True)),
+)
+def test_validate_in_range_invalid(value, size, signed):
+    with pytest.raises(ValueError):
+        validate_in_range(value, size, signed)
+
+
+def test_normalize_hex_canonical():
+    assert normalize_hex(HASH) is HASH
+    assert normalize_hex(HASH, 32) is HASH
+    assert normalize_hex("0x") == "0x"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("0xABC", "0x0abc"),
+        ("abc", "0x0abc"),
+        (b"\x0a\xbc", "0x0abc"),
+        (0xABC, "0x0abc"),
+        (0, "0x00"),
+        (True, "0x01"),
+        (HexBytes32(b"\x01" * 32), f"0x{'01' * 32}"),
+        (HexStr32(HASH), HASH),
+    ),
+)
+def test_normalize_hex(value, expected):
+    assert normalize_hex(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value,pad,expected",
+    (
+        ("0x0abc", PadDirection.LEFT, "0x00000abc"),
+        ("0x0abc", PadDirection.RIGHT, "0x0abc0000"),
+        ("0x00000abc", PadDirection.RIGHT, "0x00000abc"),
+        ("0x000abc", PadDirection.RIGHT, "0x0abc0000"),
+        (b"\x0a\xbc", PadDirection.LEFT, "0x00000abc"),
+        (0xABC, PadDirection.LEFT, "0x00000abc"),
+    ),
+)
+def test_normalize_hex_size(value, pad, expected):
+    assert normalize_hex(value, 4, pad_direction=pad) == expected
+
+
+@pytest.mark.parametrize(
+    "value,size",
+    (("0xzz", None), ("0x 1", None), ("0x0x1", None), (-1, None), (1.5, None), ("0x0102", 1)),
+)
+def test_normalize_hex_invalid(value, size):
+    with pytest.raises(ValueError):
+        normalize_hex(value, size)